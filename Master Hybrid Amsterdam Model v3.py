@@ -34,7 +34,7 @@ Core Report (publication-ready, 3 focus diets):
 ├─ Charts 6-8: Scope analysis (1+2 vs 3, shares, totals)
 ├─ Charts 9-13: Detailed analysis (CO2 share, food type, protein, infographic)
 ├─ Charts 14a-d: Delta analysis (total, category, mass, scope)
-├─ Chart 15: APA table (PNG + CSV)
+├─ Chart 15: APA table (PNG + HTML + CSV)
 ├─ Charts 16a-i: Enhanced sensitivity analysis suite (9 visualizations)
 
 Appendix (full transparency, all 9 diets):
@@ -84,13 +84,33 @@ Version: 3.1 — ENHANCED Sensitivity Suite (9 Visualizations) with Policy Lever
 import pandas as pd
 import numpy as np
 import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend to prevent rendering issues
+matplotlib.use('Agg', force=True)  # Use non-interactive backend to prevent rendering issues
 import unicodedata
 import matplotlib.pyplot as plt
-import seaborn as sns
-import math
+from matplotlib.patches import Patch, Rectangle
+from matplotlib.collections import PatchCollection
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.projections import register_projection
 import os
+import shutil
 import gc  # Garbage collection for memory management
+import hashlib
+import inspect
+import math
+import pickle
+import multiprocessing
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO
+
+try:
+    from numba import njit  # Optional: JIT-compiles the Scope3Engine kernels
+except ImportError:
+    njit = None  # Engine falls back to the NumPy matmul paths
 
 # Turn off interactive mode to prevent display issues
 plt.ioff()
@@ -104,6 +124,15 @@ plt.rcParams.update({
     'axes.labelweight': 'bold',
     'axes.labelpad': 8,
 })
+# Batch-rendering knobs (every figure goes straight to savefig on the Agg backend):
+# simplify long paths before rasterizing, split very long paths into chunks for Agg,
+# and no "too many open figures" warning (template_figure keeps its shared figures open)
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'figure.max_open_warning': 0,
+})
 
 # Paul Tol colorblind-safe palette (common subsets)
 # Reference: Tol (2018) color schemes for scientific graphics
@@ -117,31 +146,244 @@ TOL2 = [TOL_BLUE, TOL_ORANGE]
 TOL3 = [TOL_BLUE, TOL_ORANGE, TOL_GREEN]
 TOL4 = [TOL_BLUE, TOL_ORANGE, TOL_GREEN, TOL_PINK]
 
+# Fixed legend proxies (legend() copies their properties, so one set serves every figure)
+NEXUS_LEGEND = [Patch(facecolor='#E74C3C', edgecolor='black', label='Total CO₂ (Scope 1+2+3)'),
+                Patch(facecolor='#2ECC71', edgecolor='black', label='Land'),
+                Patch(facecolor='#3498DB', edgecolor='black', label='Water')]
+SENS_LEGEND = [Patch(facecolor='#E74C3C', edgecolor='black', label='Increase (worse)'),
+               Patch(facecolor='#27AE60', edgecolor='black', label='Decrease (better)')]
+
+# Output resolution tiers: core PNGs are for on-screen use, appendix copies are archival
+CORE_DPI = 150
+APPENDIX_DPI = 300
+TABLE_DPI = 100  # Text-only table figures (Chart 15)
+# PNG encoder settings: zlib level 3 without the optimize pass encodes several times
+# faster than Pillow's defaults for flat-colour plots at a near-identical file size
+PNG_PIL_KWARGS = {'compress_level': 3, 'optimize': False}
+# Headline core figures (1a/1b Nexus, 4 Distance to Goals) are small 150-200 DPI renders
+# that get embedded in the report, so they keep zlib's default level for 15-30% smaller files
+HERO_PNG_PIL_KWARGS = {'compress_level': 6, 'optimize': False}
+
 # ==========================================
 # CHART FORMATTING UTILITIES
 # ==========================================
-def safe_savefig(filepath, dpi=300, **kwargs):
+def _link_or_copy(src, dest):
+    """Hardlink dest to an already-written src (plain file copy where links are unsupported)"""
+    if os.path.lexists(dest):
+        os.remove(dest)  # never write through a link left by a previous run
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+def _savefig_to_paths(filepath, copies, fig=None, **savefig_kwargs):
+    """Encode the figure (default: current) once to filepath and link/copy the file to every copy"""
+    if os.path.lexists(filepath):
+        os.remove(filepath)
+    (fig if fig is not None else plt).savefig(filepath, **savefig_kwargs)
+    for dest in copies:
+        _link_or_copy(filepath, dest)
+
+def safe_savefig(filepath, dpi=300, copies=(), tight=True, fig=None, **kwargs):
     """
     Safely save figure with error handling for rendering issues.
     Tries multiple approaches if the first fails.
+    Extra destinations in `copies` receive the same encoded bytes instead of a second render.
+    tight=False skips the bbox_inches='tight' pass (figure already laid out by tight_layout).
+    fig saves that Figure instead of the current one (e.g. a template_figure).
     """
+    bbox = 'tight' if tight else None
+    if filepath.lower().endswith('.png'):
+        kwargs.setdefault('pil_kwargs', PNG_PIL_KWARGS)
     try:
-        plt.savefig(filepath, dpi=dpi, bbox_inches='tight', **kwargs)
+        _savefig_to_paths(filepath, copies, fig=fig, dpi=dpi, bbox_inches=bbox, **kwargs)
         return True
     except Exception as e:
         print(f"⚠ Warning: Failed to save {filepath} at {dpi} DPI ({e}). Trying lower DPI...")
         try:
-            plt.savefig(filepath, dpi=150, bbox_inches='tight', **kwargs)
+            _savefig_to_paths(filepath, copies, fig=fig, dpi=150, bbox_inches=bbox, **kwargs)
             print(f"✓ Saved {filepath} at reduced DPI")
             return True
         except Exception as e2:
             print(f"✗ Error: Could not save {filepath}: {e2}")
             return False
     finally:
+        # Per-save collection is opt-in (long-running notebooks); scripts rely on the
+        # single sweep at the end of run_full_analysis
+        if os.environ.get('PLOT_FORCE_GC'):
+            try:
+                gc.collect()
+            except:
+                pass  # Ignore gc errors
+
+# Background PNG writer: the main thread renders into memory and moves on to the
+# next chart while these threads write (and downsample) the encoded bytes
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+_pending_writes = []
+# PLOT_DEFER_WRITES=1 holds every encoded PNG in memory and writes them in one sequential
+# pass at the end of the run (for slow/seek-bound storage; costs the PNGs' size in RAM)
+_deferred_writes = []
+
+def _write_png_bytes(data, filepath, copy_paths, dpi, core_dpi, pil_kwargs=PNG_PIL_KWARGS):
+    """Write one rendered PNG to its destinations (runs on _IO_POOL)"""
+    # Full-DPI bytes go to filepath + copies, or only to the copies when filepath takes the
+    # core_dpi downsample (with no copies the render is used for the downsample alone)
+    full_paths = list(copy_paths) if core_dpi is not None else [filepath, *copy_paths]
+    if full_paths:
+        target = full_paths[0]
+        if os.path.lexists(target):
+            os.remove(target)
+        with open(target, 'wb') as f:
+            f.write(data)
+        for dest in full_paths[1:]:
+            if dest != target:
+                _link_or_copy(target, dest)
+    if core_dpi is not None:
+        from PIL import Image
+        scale = core_dpi / dpi
+        if os.path.lexists(filepath):
+            os.remove(filepath)
+        with Image.open(BytesIO(data)) as img:
+            size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            img.resize(size, Image.LANCZOS).save(filepath, dpi=(core_dpi, core_dpi), **pil_kwargs)
+
+def wait_for_pending_writes():
+    """
+    Flush deferred PNGs, then block until every queued write has finished.
+    Every failed write is reported with its path; a single RuntimeError is raised
+    afterwards if any failed (the queues are empty either way).
+    """
+    failed = []
+    while _deferred_writes:
+        job = _deferred_writes.pop(0)
+        try:
+            _write_png_bytes(*job)
+        except Exception as e:
+            failed.append((job[1], e))
+    while _pending_writes:
+        future, filepath = _pending_writes.pop(0)
         try:
-            gc.collect()  # Force garbage collection after each save
-        except:
-            pass  # Ignore gc errors
+            future.result()
+        except Exception as e:
+            failed.append((filepath, e))
+    for filepath, e in failed:
+        print(f"✗ Error: Could not write {filepath}: {e}")
+    if failed:
+        raise RuntimeError(f"{len(failed)} PNG write(s) failed, first: {failed[0][0]}") from failed[0][1]
+
+def save_and_copy(filepath, *copy_paths, fig=None, dpi=300, core_dpi=None, tight=True,
+                  pil_kwargs=PNG_PIL_KWARGS):
+    """
+    Render a figure once and copy the PNG to the other destinations
+    (core + appendix pairs are byte-identical, so a second savefig is wasted work).
+    Without copy paths it is a plain savefig whose file write runs in the background.
+    
+    With core_dpi set, the render goes to the copy paths at `dpi` and `filepath`
+    gets a downsampled version at core_dpi (no second render for the lower tier);
+    without copy paths only the downsample is written.
+    Pass tight=False for figures with explicit subplots_adjust margins to skip the
+    extra bbox_inches='tight' measuring pass. pil_kwargs sets the PNG encoder options
+    (e.g. HERO_PNG_PIL_KWARGS for report-embedded charts), downsample included.
+    
+    The render happens in memory; the file writes are queued on _IO_POOL (or held
+    until the end with PLOT_DEFER_WRITES), so the figure can be closed or reused
+    immediately. Call wait_for_pending_writes() before reading the files back.
+    Like safe_savefig, a failed render is retried at 150 DPI; returns False if that
+    fails too (nothing is queued then).
+    """
+    def render(at_dpi):
+        buf = BytesIO()
+        (fig if fig is not None else plt).savefig(buf, format='png', dpi=at_dpi,
+                                                  bbox_inches='tight' if tight else None,
+                                                  pil_kwargs=pil_kwargs)
+        return buf.getvalue()
+
+    try:
+        data = render(dpi)
+    except Exception as e:
+        print(f"⚠ Warning: Failed to save {filepath} at {dpi} DPI ({e}). Trying lower DPI...")
+        dpi = 150
+        core_dpi = min(core_dpi, dpi) if core_dpi is not None else None
+        try:
+            data = render(dpi)
+        except Exception as e2:
+            print(f"✗ Error: Could not save {filepath}: {e2}")
+            return False
+    job = (data, filepath, copy_paths, dpi, core_dpi, pil_kwargs)
+    if os.environ.get('PLOT_DEFER_WRITES'):
+        _deferred_writes.append(job)
+    else:
+        _pending_writes.append((_IO_POOL.submit(_write_png_bytes, *job), filepath))
+    return True
+
+def grid_shape(n):
+    """(rows, cols) of the near-square subplot grid for n panels (integer math, no NumPy scalars)"""
+    cols = math.isqrt(n - 1) + 1 if n > 0 else 1
+    return -(-n // cols), cols
+
+@lru_cache(maxsize=None)
+def short_diet_name(diet_name):
+    """Diet name without its parenthetical descriptor (cached: called per subplot title)"""
+    return diet_name.split('(')[0].strip()
+
+@lru_cache(maxsize=None)
+def template_figure(figsize):
+    """
+    Shared Figure per figsize for charts with repeating geometry (Charts 1a/1b, 7, 14a-14d, 16f/16i).
+    
+    Callers must fig.clear() before drawing and save via fig.savefig; the figures
+    stay open until plt.close('all') at the end of run_full_analysis.
+    """
+    return plt.figure(figsize=figsize)
+
+class ThinAxes(Axes):
+    """
+    Axes without visible spines or axis machinery, for the donut/pie grids (Charts 2, 3, 8).
+    
+    ax.pie already drops the frame and ticks; hiding them up front keeps tight_layout and
+    draw from laying out tick labels no one sees. Use via subplot_kw=dict(projection='thin').
+    """
+    name = 'thin'
+
+    def clear(self):
+        super().clear()
+        for spine in self.spines.values():
+            spine.set_visible(False)
+        self.xaxis.set_visible(False)
+        self.yaxis.set_visible(False)
+
+register_projection(ThinAxes)
+
+def draw_donut(ax, vals, title, center_text, min_pct=3, pct_fontsize=10, title_fontsize=13, center_fontsize=11):
+    """
+    CAT_ORDER donut with white in-ring percentages (only slices above min_pct), a bold
+    title and grey centre text (Charts 2 and 3).
+    """
+    _, _, autotexts = ax.pie(vals, labels=None, autopct=lambda pct: f'{pct:.0f}%' if pct > min_pct else '',
+                             startangle=90, pctdistance=0.75, colors=COLORS,
+                             wedgeprops=dict(width=0.5, edgecolor='white', linewidth=1.5))
+    # Make percentage text bold and white for better visibility
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(pct_fontsize)
+        autotext.set_fontweight('bold')
+    ax.set_title(title, fontsize=title_fontsize, fontweight='bold', pad=10)
+    ax.text(0, 0, center_text, ha='center', va='center', fontsize=center_fontsize, color='#666666', fontweight='bold')
+
+def paired_barh(ax, y_pos, first_vals, second_vals, width, colors, labels, alpha=0.8):
+    """
+    Draw two side-by-side horizontal bar series as a single PatchCollection.
+    
+    Equivalent to two ax.barh calls offset by +/- width/2, but adds one
+    collection per axes instead of one Rectangle artist per bar.
+    Returns legend proxy handles (one per series) since collections carry no labels.
+    """
+    rects = ([Rectangle((0, y - width), v, width) for y, v in zip(y_pos, first_vals)] +
+             [Rectangle((0, y), v, width) for y, v in zip(y_pos, second_vals)])
+    facecolors = [colors[0]] * len(first_vals) + [colors[1]] * len(second_vals)
+    ax.add_collection(PatchCollection(rects, facecolors=facecolors, edgecolors='none', alpha=alpha))
+    ax.autoscale_view()
+    return [Patch(facecolor=c, alpha=alpha, label=l) for c, l in zip(colors, labels)]
 
 def apply_chart_standards(fig, ax, title, ylabel='', xlabel='', caption='', legend=True):
     """
@@ -199,14 +441,18 @@ class HybridModelConfig:
         POPULATION_TOTAL (int): Total Amsterdam metropolitan population
             Used for scaling neighborhood-level calculations to city totals.
             Source: CBS 2024.
+    
+    The values are class-level constants and instances carry no __dict__
+    (empty __slots__), so a config is read-only: assigning an attribute on an
+    instance raises AttributeError.
     """
+    __slots__ = ()
     
-    def __init__(self):
-        self.NATIONAL_AVG_INCOME = 38300
-        self.SCALING_C1 = 0.8
-        self.SCALING_C2 = 0.2
-        self.WASTE_FACTOR = 1.15   # Supply chain loss
-        self.POPULATION_TOTAL = 934374  # Amsterdam metro population 2024
+    NATIONAL_AVG_INCOME = 38300
+    SCALING_C1 = 0.8
+    SCALING_C2 = 0.2
+    WASTE_FACTOR = 1.15   # Supply chain loss
+    POPULATION_TOTAL = 934374  # Amsterdam metro population 2024
 
 # --- VISUALIZATION MAPPING ---
 # Maps model food items to 16 aggregated categories for comprehensive visualization
@@ -259,9 +505,69 @@ COLORS = [
 # Color mapping dictionary for easy lookup
 COLOR_MAP = dict(zip(CAT_ORDER, COLORS))
 
+# --- FOOD TYPE & PROTEIN LOOKUPS ---
+# Food-type grouping used by the multi-resource chart (Chart 10)
+FOOD_TYPE_MAP = {
+    'Red Meat': 'Animal',
+    'Poultry': 'Animal',
+    'Fish': 'Animal',
+    'Dairy (Liquid)': 'Dairy',
+    'Dairy (Solid) & Eggs': 'Dairy',
+    'Plant Protein': 'Plant-based',
+    'Veg & Fruit': 'Plant-based',
+    'Staples': 'Plant-based',
+    'Rice': 'Plant-based',
+    'Ultra-Processed': 'Processed',
+    'Beverages & Additions': 'Processed',
+    'Oils (Plant-based)': 'Oils',
+    'Fats (Solid, Animal)': 'Fats',
+    'Condiments': 'Processed'
+}
+FOOD_TYPES = ['Plant-based', 'Animal', 'Dairy', 'Processed', 'Oils', 'Fats']
+
+# Protein content from NEVO 2025 database (fraction: g protein / g food)
+# Source: NEVO 2025 v9.0 - Nederlandse Voedingsmiddelentabel
+# Mapped to 14 visualization categories using median values from 2,328 products
+# Extraction date: January 2026
+PROTEIN_CONTENT = {
+    'Red Meat': 0.198,              # Median of beef (22.4%), pork (19.8%), lamb (19.3%)
+    'Poultry': 0.144,               # Median from 53 chicken products
+    'Fish': 0.200,                  # Median from 33 fish products
+    'Dairy (Liquid)': 0.038,        # Median from 148 milk/yogurt products
+    'Dairy (Solid) & Eggs': 0.121,  # Median from 179 cheese/egg products
+    'Plant Protein': 0.092,         # Median from 168 pulses/nuts/meat substitutes
+    'Staples': 0.079,               # Median from 290 bread/pasta/grains/potatoes
+    'Rice': 0.061,                  # Median from 49 rice products
+    'Veg & Fruit': 0.012,           # Median from 274 vegetable/fruit products
+    'Ultra-Processed': 0.033,       # Median from 139 sugar/snacks products
+    'Beverages & Additions': 0.025, # Median from 80 coffee/tea/alcohol products
+    'Oils (Plant-based)': 0.020,    # Median from 197 oil products
+    'Fats (Solid, Animal)': 0.040,  # Median from 47 butter/fat products
+    'Condiments': 0.063             # Median from 253 sauce/spice products
+}
+
+# NumPy lookups aligned with CAT_ORDER (built once at import).
+# Categories missing from the maps above fall back to 'Processed' / 0 protein, as with .get().
+TYPE_INDEX = np.array([FOOD_TYPES.index(FOOD_TYPE_MAP.get(cat, 'Processed')) for cat in CAT_ORDER])
+TYPE_ONEHOT = np.eye(len(FOOD_TYPES))[TYPE_INDEX]  # (CAT_ORDER x FOOD_TYPES) indicator: category rows @ it = type totals
+PROTEIN_ARR = np.array([PROTEIN_CONTENT.get(cat, 0) for cat in CAT_ORDER])
+# Rounded protein fractions used by the Chart 11 mass-vs-protein panels
+PROTEIN_CONTENT_SIMPLE = {
+    'Red Meat': 0.20, 'Poultry': 0.25, 'Fish': 0.20, 'Dairy (Solid) & Eggs': 0.12, 'Dairy (Liquid)': 0.03,
+    'Plant Protein': 0.20, 'Staples': 0.10, 'Rice': 0.08, 'Veg & Fruit': 0.02, 'Ultra-Processed': 0.05,
+    'Beverages & Additions': 0.01, 'Fats (Solid, Animal)': 0.0, 'Oils (Plant-based)': 0.0, 'Condiments': 0.05
+}
+PROTEIN_SIMPLE_ARR = np.array([PROTEIN_CONTENT_SIMPLE.get(cat, 0) for cat in CAT_ORDER])
+# Food item -> CAT_ORDER slot in one lookup; foods mapped outside CAT_ORDER are absent
+_CAT_IDX = {cat: i for i, cat in enumerate(CAT_ORDER)}
+FOOD_TO_CAT_IDX = {food: _CAT_IDX[cat] for food, cat in VISUAL_MAPPING.items() if cat in _CAT_IDX}
+PLANT_MASK = np.isin(CAT_ORDER, ['Plant Protein', 'Staples', 'Rice', 'Veg & Fruit'])
+ANIMAL_MASK = np.isin(CAT_ORDER, ['Red Meat', 'Poultry', 'Fish', 'Dairy (Liquid)', 'Dairy (Solid) & Eggs'])
+
 # ==========================================
 # 2. DATA INGESTION
 # ==========================================
+@lru_cache(maxsize=1)
 def load_impact_factors():
     """
     Load environmental impact factors using the official RIVM NEVO aggregated database.
@@ -307,6 +613,7 @@ def load_impact_factors():
             - water (float): Blue water consumption in liters per kg product
             - scope12 (float): Scope 1+2 emissions in kg CO2e per kg consumed
                 (includes production, retail, household, and waste)
+        Built once per process (cached); the DataFrame is shared, so treat it as read-only.
     
     Example:
         >>> factors = load_impact_factors()
@@ -610,6 +917,46 @@ def load_impact_factors():
     
     return df_factors
 
+@lru_cache(maxsize=1)
+def impact_factor_arrays():
+    """
+    Read-only NumPy views of load_impact_factors(), shared by every Scope3Engine.
+    
+    Each factor column is its own contiguous array (structure of arrays); the stacked
+    matrices used by the engine's matmuls are derived from those columns.
+    
+    Returns:
+        dict: Arrays in the factor row order
+            - food_index (dict): food item -> row position
+            - co2, land, water, scope12 (ndarray): (n_foods,) per-kg factors
+            - factor_matrix (ndarray): (n_foods, 3) co2/land/water per kg
+            - lifecycle_factors (ndarray): (4, n_foods) co2/1000, scope12/1000, land, water
+                (the impact rows of Scope3Engine.AGG_ROWS)
+            - food2cat (ndarray): (n_foods, len(CAT_ORDER)) 0/1 category indicator;
+                foods mapped outside CAT_ORDER keep an all-zero row
+            - food_cat (ndarray): (n_foods,) int32 CAT_ORDER slot per food, -1 if unmapped
+                (the same mapping as food2cat, for the loop kernels)
+    """
+    factors = load_impact_factors()
+    arrays = {'food_index': {food: i for i, food in enumerate(factors.index)}}
+    for col in ('co2', 'land', 'water', 'scope12'):
+        arrays[col] = factors[col].to_numpy(dtype=np.float64, copy=True)
+    co2, land, water, scope12 = arrays['co2'], arrays['land'], arrays['water'], arrays['scope12']
+    arrays['factor_matrix'] = np.column_stack((co2, land, water))
+    arrays['lifecycle_factors'] = np.vstack((co2 / 1000, scope12 / 1000, land, water))
+    n_foods = len(arrays['food_index'])
+    food2cat = arrays['food2cat'] = np.zeros((n_foods, len(CAT_ORDER)))
+    food_cat = arrays['food_cat'] = np.full(n_foods, -1, dtype=np.int32)
+    for food, i in arrays['food_index'].items():
+        j = FOOD_TO_CAT_IDX.get(food)
+        if j is not None:
+            food2cat[i, j] = 1.0
+            food_cat[i] = j
+    for name, arr in arrays.items():
+        if name != 'food_index':
+            arr.flags.writeable = False
+    return arrays
+
 def load_diet_profiles():
     """
     Load 9 dietary scenario profiles covering all 32 food items.
@@ -790,6 +1137,42 @@ def load_neighborhood_data():
 # ==========================================
 # 3. CORE ENGINE
 # ==========================================
+# Neighborhood consumption scaling = weights . (meat_modifier, plant_modifier, 1.0) x volume_beta:
+# 40% of intake follows the meat modifier, 10% the plant modifier, 50% is unmodified
+_LOCAL_SCALING_WEIGHTS = np.array([0.4, 0.1, 0.5])
+
+# Engine kernels, compiled when Numba is installed (compilation is cached on disk).
+# Each is a plain loop over the ~32 food rows; without Numba the engine uses the
+# equivalent NumPy matmuls instead of running these loops in Python.
+if njit is not None:
+    @njit(cache=True)
+    def _raw_impact_kernel(grams_vec, factor_matrix_daily):
+        """grams_vec @ factor_matrix_daily as an explicit loop (co2, land, water)"""
+        totals = np.zeros(factor_matrix_daily.shape[1])
+        for i in range(grams_vec.shape[0]):
+            g = grams_vec[i]
+            for k in range(factor_matrix_daily.shape[1]):
+                totals[k] += g * factor_matrix_daily[i, k]
+        return totals
+
+    @njit(cache=True)
+    def _aggregate_kernel(grams_vec, lifecycle_factors_annual, food_cat, n_cats):
+        """Category totals (mass row, then one row per lifecycle factor); food_cat -1 = skip"""
+        n_rows = lifecycle_factors_annual.shape[0]
+        acc = np.zeros((n_rows + 1, n_cats))
+        for i in range(grams_vec.shape[0]):
+            j = food_cat[i]
+            if j < 0:
+                continue
+            g = grams_vec[i]
+            acc[0, j] += g
+            for r in range(n_rows):
+                acc[r + 1, j] += g * lifecycle_factors_annual[r, i]
+        return acc
+else:
+    _raw_impact_kernel = None
+    _aggregate_kernel = None
+
 class Scope3Engine:
     """
     Advanced Scope 3 emissions calculator with behavioral modifiers.
@@ -807,15 +1190,84 @@ class Scope3Engine:
         factors (pd.DataFrame): Environmental impact factors database
     """
     
-    def __init__(self, config):
+    RESULT_CACHE_SIZE = 64  # Diets memoized per engine (LRU; bounds parameter sweeps)
+    AGG_ROWS = ('mass', 'co2', 'scope12', 'land', 'water')  # Row order of aggregate_visual_array
+    
+    def __init__(self, config, dtype=np.float64):
         """
         Initialize the enhanced Scope3 calculation engine.
         
         Args:
             config (HybridModelConfig): Configuration object
+            dtype: Float type of the prepared factor matrices and gram vectors.
+                np.float32 halves their size for large batch_spatial sweeps (the LCA
+                factors carry 3-4 significant digits); the default float64 keeps
+                results identical to the reference calculation.
         """
         self.cfg = config
+        self._dtype = np.dtype(dtype)
+        # Config scalars read once, so the hot paths skip the self.cfg.X attribute chain
+        self._waste = float(config.WASTE_FACTOR)
+        self._pop = float(config.POPULATION_TOTAL)
         self.factors = load_impact_factors()
+        # Row-aligned NumPy views of the factors (shared across engines), so diet totals
+        # are inner products / matmuls instead of .loc lookups; self.factors is kept for
+        # external label-based access only
+        arrays = impact_factor_arrays()
+        self._food_index = arrays['food_index']
+        self._co2, self._land, self._water, self._scope12 = (
+            arrays['co2'], arrays['land'], arrays['water'], arrays['scope12'])
+        self._factor_matrix = arrays['factor_matrix']
+        self._lifecycle_factors = arrays['lifecycle_factors']
+        self._food2cat, self._food_cat = arrays['food2cat'], arrays['food_cat']
+        # Unit scales folded into the factors once (grams in -> results out):
+        #   daily: g -> kg produced (x WASTE/1000)
+        #   annual: g/day -> city-wide cradle-to-grave kg/yr (x 365/1000 x (WASTE + 1) x POP)
+        self._daily_scale = self._waste / 1000.0
+        self._annual_scale = 365.0 / 1000.0 * (self._waste + 1.0) * self._pop
+        self._factor_matrix_daily = (self._factor_matrix * self._daily_scale).astype(self._dtype, copy=False)
+        self._lifecycle_factors_annual = (self._lifecycle_factors * self._annual_scale).astype(self._dtype, copy=False)
+        self._food2cat = self._food2cat.astype(self._dtype, copy=False)  # Keeps matmuls in dtype
+        self._encoder_cache = OrderedDict()  # Diet key layout -> prepare_diet index arrays
+        # Per-diet memo of (raw impacts, category aggregates), keyed by _diet_key
+        self._bundle_cache = OrderedDict()
+
+    def prepare_diet(self, diet_profile):
+        """
+        Daily grams aligned to the factor rows (items without factors are skipped).
+        
+        Build once per diet and pass to the *_vec methods to skip dict handling.
+        """
+        keep, rows = self._diet_encoder(tuple(diet_profile))
+        grams = np.fromiter(diet_profile.values(), dtype=np.float64, count=len(diet_profile))
+        grams_vec = np.zeros(len(self._food_index), dtype=self._dtype)
+        grams_vec[rows] = grams[keep]
+        return grams_vec
+
+    def _diet_encoder(self, foods):
+        """(positions in foods with factors, their factor rows), cached per key layout"""
+        def build():
+            pairs = [(pos, self._food_index[food]) for pos, food in enumerate(foods)
+                     if food in self._food_index]
+            keep = np.array([pos for pos, _ in pairs], dtype=np.int32)
+            rows = np.array([row for _, row in pairs], dtype=np.int32)
+            return keep, rows
+        return self._memoize(self._encoder_cache, foods, build)
+
+    @staticmethod
+    def _diet_key(diet_profile):
+        """Hashable fingerprint of a diet profile (order-independent)"""
+        return tuple(sorted(diet_profile.items()))
+
+    def _memoize(self, cache, key, compute):
+        """Return cache[key], computing and storing it (LRU, RESULT_CACHE_SIZE entries) on a miss"""
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = cache[key] = compute()
+        if len(cache) > self.RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
 
     # --- 3A. REFINED BETA FACTOR (The Monitor Logic) ---
     def calculate_beta(self, row):
@@ -834,6 +1286,7 @@ class Scope3Engine:
         
         Args:
             row (pd.Series): Neighborhood data row with Avg_Income and High_Education_Pct
+                (a DataFrame of neighborhoods also works: each value is then a column)
             
         Returns:
             tuple: (volume_beta, meat_modifier, plant_modifier)
@@ -847,12 +1300,12 @@ class Scope3Engine:
         
         # 2. Education Effect: Higher education correlates with plant-based preference
         # Monitor data: 52% plant (high edu) vs 39% plant (low edu)
-        if row['High_Education_Pct'] > 0.5:
-            meat_modifier = 0.85   # Eat 15% less meat than average
-            plant_modifier = 1.15  # Eat 15% more plant foods than average
-        else:
-            meat_modifier = 1.1    # Eat 10% more meat than average
-            plant_modifier = 0.9   # Eat 10% less plant foods than average
+        # Branchless select on the >50% degree-holder mask ([()] turns a scalar row's 0-d result into a float64)
+        #   high edu: 15% less meat (0.85), 15% more plant foods (1.15)
+        #   low edu:  10% more meat (1.1),  10% less plant foods (0.9)
+        high_edu_mask = np.greater(row['High_Education_Pct'], 0.5)
+        meat_modifier = np.where(high_edu_mask, 0.85, 1.1)[()]
+        plant_modifier = np.where(high_edu_mask, 1.15, 0.9)[()]
             
         return volume_beta, meat_modifier, plant_modifier
 
@@ -865,17 +1318,38 @@ class Scope3Engine:
             diet_profile (dict): Food items and daily consumption (grams)
             
         Returns:
-            dict: Daily per-capita impacts (co2, land, water)
+            dict: Daily per-capita impacts (co2, land, water); a fresh copy of the
+                memoized result, so callers may add keys
+        """
+        return dict(self._impact_arrays(diet_profile)[0])
+
+    def calculate_raw_impact_vec(self, grams_vec):
+        """calculate_raw_impact for a prepare_diet vector (uncached)"""
+        if _raw_impact_kernel is not None:
+            totals = _raw_impact_kernel(grams_vec, self._factor_matrix_daily)
+        else:
+            totals = grams_vec @ self._factor_matrix_daily
+        return dict(zip(('co2', 'land', 'water'), totals.tolist()))
+
+    def impact_bundle(self, diet_profile):
+        """
+        calculate_raw_impact and aggregate_visual_data from one prepared gram vector.
+        
+        Returns:
+            tuple: (raw impact dict, (agg_mass, agg_co2, agg_scope12, agg_land, agg_water)),
+                fresh copies of the memoized results
         """
-        res = {'co2': 0, 'land': 0, 'water': 0}
-        for food, grams in diet_profile.items():
-            if food not in self.factors.index: continue
-            kg_produced = (grams / 1000) * self.cfg.WASTE_FACTOR
-            f = self.factors.loc[food]
-            res['co2'] += kg_produced * f['co2']
-            res['land'] += kg_produced * f['land']
-            res['water'] += kg_produced * f['water']
-        return res
+        raw, agg = self._impact_arrays(diet_profile)
+        return dict(raw), self._category_dicts(agg)
+
+    def impact_bundle_vec(self, grams_vec):
+        """impact_bundle for a prepare_diet vector (uncached; aggregate as an array)"""
+        return self.calculate_raw_impact_vec(grams_vec), self.aggregate_visual_array_vec(grams_vec)
+
+    def _impact_arrays(self, diet_profile):
+        """Memoized impact_bundle_vec of a diet profile (shared, do not mutate)"""
+        return self._memoize(self._bundle_cache, self._diet_key(diet_profile),
+                             lambda: self.impact_bundle_vec(self.prepare_diet(diet_profile)))
 
     def aggregate_visual_data_cradle_to_grave(self, diet_profile):
         """
@@ -895,54 +1369,37 @@ class Scope3Engine:
         
         Returns:
             tuple: (agg_mass, agg_co2, agg_scope12, agg_land, agg_water)
-                All values summed across produced and consumed bases.
+                All values summed across produced and consumed bases; fresh
+                dicts built from the memoized aggregate_visual_array rows.
         """
-        agg_mass = {k: 0.0 for k in CAT_ORDER}
-        agg_co2 = {k: 0.0 for k in CAT_ORDER}
-        agg_scope12 = {k: 0.0 for k in CAT_ORDER}
-        agg_land = {k: 0.0 for k in CAT_ORDER}
-        agg_water = {k: 0.0 for k in CAT_ORDER}
-        
-        for food, grams in diet_profile.items():
-            if food not in self.factors.index: continue
-            category = VISUAL_MAPPING.get(food, 'Other')
-            if category not in agg_mass: continue
-            7
-            # Cradle: Production + retail loss (from farm gate to retail)
-            kg_consumed_yr = (grams / 1000) * 365
-            kg_produced_yr = kg_consumed_yr * self.cfg.WASTE_FACTOR
-            
-            # Grave: Household consumption and end-of-life waste
-            # (kg_consumed_yr covers all food that reaches consumer)
-            
-            f = self.factors.loc[food]
-            
-            # Cradle-to-Grave CO2: produced impacts + consumed impacts
-            co2_cradle = (kg_produced_yr * f['co2'] * self.cfg.POPULATION_TOTAL) / 1000
-            co2_grave = (kg_consumed_yr * f['co2'] * self.cfg.POPULATION_TOTAL) / 1000
-            co2_tonnes = co2_cradle + co2_grave
-            
-            # Cradle-to-Grave Scope 1+2: produced impacts + consumed impacts
-            scope12_cradle = (kg_produced_yr * f['scope12'] * self.cfg.POPULATION_TOTAL) / 1000
-            scope12_grave = (kg_consumed_yr * f['scope12'] * self.cfg.POPULATION_TOTAL) / 1000
-            scope12_tonnes = scope12_cradle + scope12_grave
-            
-            # Cradle-to-Grave Land: produced impacts + consumed impacts
-            land_cradle = kg_produced_yr * f['land'] * self.cfg.POPULATION_TOTAL
-            land_grave = kg_consumed_yr * f['land'] * self.cfg.POPULATION_TOTAL
-            land_m2 = land_cradle + land_grave
-            
-            # Cradle-to-Grave Water: produced impacts + consumed impacts
-            water_cradle = kg_produced_yr * f['water'] * self.cfg.POPULATION_TOTAL
-            water_grave = kg_consumed_yr * f['water'] * self.cfg.POPULATION_TOTAL
-            water_l = water_cradle + water_grave
-            
-            agg_mass[category] += grams
-            agg_co2[category] += co2_tonnes
-            agg_scope12[category] += scope12_tonnes
-            agg_land[category] += land_m2
-            agg_water[category] += water_l
-        return agg_mass, agg_co2, agg_scope12, agg_land, agg_water
+        return self._category_dicts(self.aggregate_visual_array(diet_profile))
+
+    @staticmethod
+    def _category_dicts(agg):
+        """One {category: value} dict per AGG_ROWS row of an aggregate array"""
+        return tuple(dict(zip(CAT_ORDER, row)) for row in agg.tolist())
+
+    def aggregate_visual_array(self, diet_profile):
+        """
+        Cradle-to-grave category totals as one (len(AGG_ROWS), len(CAT_ORDER)) array.
+        
+        Memoized per diet (same key as calculate_raw_impact) and read-only;
+        aggregate_visual_data builds its dicts from this at the API boundary.
+        """
+        return self._impact_arrays(diet_profile)[1]
+
+    def aggregate_visual_array_vec(self, grams_vec):
+        """aggregate_visual_array for a prepare_diet vector (uncached)"""
+        # Cradle (production + retail loss, kg consumed x WASTE) plus grave (household
+        # consumption and end-of-life, kg consumed), annualized city-wide: both are folded
+        # into _lifecycle_factors_annual, so each impact row is grams x a prepared factor
+        # Per-food rows (mass, then impacts) summed into categories by the indicator matrix
+        if _aggregate_kernel is not None:
+            acc = _aggregate_kernel(grams_vec, self._lifecycle_factors_annual, self._food_cat, len(CAT_ORDER))
+        else:
+            acc = np.vstack((grams_vec, grams_vec * self._lifecycle_factors_annual)) @ self._food2cat
+        acc.flags.writeable = False
+        return acc
 
     def aggregate_visual_data(self, diet_profile):
         """
@@ -951,27 +1408,68 @@ class Scope3Engine:
         """
         return self.aggregate_visual_data_cradle_to_grave(diet_profile)
 
-    def run_spatial_simulation(self, neighborhoods, diet_profile):
-        results = []
+    def aggregate_visual_data_vec(self, grams_vec):
+        """aggregate_visual_data for a prepare_diet vector (uncached)"""
+        return self._category_dicts(self.aggregate_visual_array_vec(grams_vec))
+
+    def _local_scaling(self, neighborhoods):
+        """Per-neighborhood consumption scaling (calculate_beta on whole columns, no iterrows)"""
+        vol_beta, meat_mod, plant_mod = (np.asarray(v, dtype=float) for v in self.calculate_beta(neighborhoods))
+        modifiers = np.column_stack((meat_mod, plant_mod, np.ones_like(meat_mod)))
+        return (modifiers @ _LOCAL_SCALING_WEIGHTS) * vol_beta
+
+    def run_spatial_simulation_arrays(self, neighborhoods, diet_profile):
+        """
+        Annual CO2 per neighborhood as plain arrays (no DataFrame construction).
+        
+        Returns:
+            dict: Neighborhood, Population and Total_CO2_Tonnes arrays in the row
+                order of neighborhoods
+        """
         base_impact = self.calculate_raw_impact(diet_profile)
-        for _, row in neighborhoods.iterrows():
-            vol_beta, meat_mod, plant_mod = self.calculate_beta(row)
-            local_scaling = (0.4 * meat_mod + 0.1 * plant_mod + 0.5 * 1.0) * vol_beta
-            local_co2_per_capita = base_impact['co2'] * local_scaling
-            total_tonnes = (local_co2_per_capita * 365 * row['Population']) / 1000
+        local_co2_per_capita = base_impact['co2'] * self._local_scaling(neighborhoods)
+        population = neighborhoods['Population'].to_numpy()
+        total_tonnes = (local_co2_per_capita * 365 * population) / 1000
+        
+        return {
+            'Neighborhood': neighborhoods['Neighborhood'].to_numpy(),
+            'Population': population,
+            'Total_CO2_Tonnes': total_tonnes
+        }
+
+    def run_spatial_simulation(self, neighborhoods, diet_profile):
+        """run_spatial_simulation_arrays as a DataFrame (one column-wise construction)"""
+        return pd.DataFrame(self.run_spatial_simulation_arrays(neighborhoods, diet_profile))
+
+    def batch_spatial(self, diets, neighborhoods):
+        """
+        Annual CO2 for every diet in every neighborhood in one pass.
+        
+        Equivalent to run_spatial_simulation per diet, but the per-diet base CO2 is one
+        (n_diets x n_foods) matmul and the neighborhood scaling is computed once.
+        
+        Args:
+            diets (dict): Diet name -> diet profile (food item -> grams/day)
+            neighborhoods (pd.DataFrame): As for run_spatial_simulation
             
-            results.append({
-                'Neighborhood': row['Neighborhood'],
-                'Population': row['Population'],
-                'Total_CO2_Tonnes': total_tonnes
-            })
-        return pd.DataFrame(results)
+        Returns:
+            pd.DataFrame: Total_CO2_Tonnes with one row per diet, one column per neighborhood
+        """
+        grams = np.zeros((len(diets), len(self._food_index)), dtype=self._dtype)
+        for row, profile in enumerate(diets.values()):
+            grams[row] = self.prepare_diet(profile)
+        base_co2 = grams @ (self._co2 * self._daily_scale).astype(self._dtype, copy=False)  # kg CO2e per capita per day
+        population = neighborhoods['Population'].to_numpy()
+        tonnes = (np.outer(base_co2, self._local_scaling(neighborhoods)) * 365 * population) / 1000
+        return pd.DataFrame(tonnes, index=pd.Index(list(diets), name='Diet'),
+                            columns=pd.Index(neighborhoods['Neighborhood'].to_numpy(), name='Neighborhood'))
 
 # ==========================================
 # 4. VISUALIZATION SUITE
 # ==========================================
 
-def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Monitor 2024 (Current)', output_dir='images/core'):
+def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Monitor 2024 (Current)', output_dir='images/core',
+                                daily_impact=None):
     """
     Create a spatial heatmap showing neighborhood-level emissions intensity.
     
@@ -984,6 +1482,9 @@ def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Moni
         diets_dict (dict): Diet profiles dictionary
         diet_name (str): Diet scenario to visualize
         output_dir (str): Output directory for figures
+        daily_impact (dict): Monitor 2024 per-capita daily impact as returned by
+            Scope3Engine.calculate_raw_impact (lets a worker process skip building an
+            engine); computed with a new engine when omitted
     
     Creates visualization showing:
     - Emissions intensity (kton CO2/neighborhood)
@@ -1000,15 +1501,14 @@ def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Moni
     neighborhoods_sorted = neighborhoods_df.sort_values('High_Education_Pct', ascending=False)
     
     # Get Monitor 2024 baseline for reference
-    cfg = HybridModelConfig()
-    engine = Scope3Engine(cfg)
     monitor_profile = diets_dict.get('1. Monitor 2024 (Current)', {})
     if not monitor_profile:
         print("[WARN] Monitor 2024 diet profile not found for spatial visualization")
         return
     
     # Calculate per-capita daily impact
-    daily_impact = engine.calculate_raw_impact(monitor_profile)
+    if daily_impact is None:
+        daily_impact = Scope3Engine(HybridModelConfig()).calculate_raw_impact(monitor_profile)
     # Scale to annual per capita
     annual_per_capita_kg_co2 = daily_impact['co2'] * 365
     
@@ -1027,10 +1527,10 @@ def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Moni
         edgecolors='black',
         linewidth=1.5
     )
-    for idx, row in neighborhoods_sorted.iterrows():
+    for row in neighborhoods_sorted.itertuples(index=False):
         ax1.annotate(
-            row['Neighborhood'],
-            (row['Avg_Income'] / 1000, row['High_Education_Pct'] * 100),
+            row.Neighborhood,
+            (row.Avg_Income / 1000, row.High_Education_Pct * 100),
             fontsize=8,
             ha='center',
             va='center',
@@ -1057,10 +1557,10 @@ def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Moni
         edgecolors='black',
         linewidth=1.5
     )
-    for idx, row in neighborhoods_sorted.iterrows():
+    for row in neighborhoods_sorted.itertuples(index=False):
         ax2.annotate(
-            row['Neighborhood'],
-            (row['Avg_Income'] / 1000, row['est_total_co2']),
+            row.Neighborhood,
+            (row.Avg_Income / 1000, row.est_total_co2),
             fontsize=8,
             ha='center',
             va='center',
@@ -1085,10 +1585,10 @@ def create_neighborhood_heatmap(neighborhoods_df, diets_dict, diet_name='1. Moni
         edgecolors='black',
         linewidth=1.5
     )
-    for idx, row in neighborhoods_sorted.iterrows():
+    for row in neighborhoods_sorted.itertuples(index=False):
         ax3.annotate(
-            row['Neighborhood'],
-            (row['High_Education_Pct'] * 100, row['Population'] * annual_per_capita_kg_co2 / 1000),
+            row.Neighborhood,
+            (row.High_Education_Pct * 100, row.Population * annual_per_capita_kg_co2 / 1000),
             fontsize=8,
             ha='center',
             va='center',
@@ -1175,15 +1675,13 @@ KEY FINDINGS:
     ax6.axis('off')
     
     # Create summary table
-    table_data = []
-    for idx, row in neighborhoods_sorted.iterrows():
-        table_data.append([
-            row['Neighborhood'],
-            f"€{row['Avg_Income']/1000:.1f}k",
-            f"{row['High_Education_Pct']*100:.0f}%",
-            f"{int(row['Population']/1000)}k",
-            f"{row['est_total_co2']:.0f}t"
-        ])
+    table_data = [[
+        row.Neighborhood,
+        f"€{row.Avg_Income/1000:.1f}k",
+        f"{row.High_Education_Pct*100:.0f}%",
+        f"{int(row.Population/1000)}k",
+        f"{row.est_total_co2:.0f}t"
+    ] for row in neighborhoods_sorted.itertuples(index=False)]
     
     table = ax6.table(cellText=table_data,
                      colLabels=['District', 'Income', 'Education', 'Pop.', 'CO₂e'],
@@ -1250,7 +1748,9 @@ def create_consumption_impact_table(diet_name='1. Monitor 2024 (Current)', outpu
     
     # Load diet and impact data
     diets = load_diet_profiles()
-    factors = load_impact_factors()
+    arrays = impact_factor_arrays()
+    food_index = arrays['food_index']
+    total_factor = arrays['co2'] + arrays['scope12']  # Scope 3 + Scope 1+2 per kg, by factor row
     diet_data = diets[diet_name]
     
     # Group consumption by category and calculate totals
@@ -1274,8 +1774,9 @@ def create_consumption_impact_table(diet_name='1. Monitor 2024 (Current)', outpu
         category_protein[category] += grams_per_day * protein_ratio / 100
         
         # Add CO2 (total Scope 1+2 + Scope 3)
-        if item in factors.index:
-            co2_total = (factors.loc[item, 'co2'] + factors.loc[item, 'scope12']) * grams_per_day / 1000  # kg CO2e
+        row = food_index.get(item)
+        if row is not None:
+            co2_total = total_factor[row] * grams_per_day / 1000  # kg CO2e
             category_co2[category] += co2_total
     
     # Calculate percentages
@@ -1387,15 +1888,68 @@ def create_consumption_impact_table(diet_name='1. Monitor 2024 (Current)', outpu
     
     return table_data
 
+# Opt-in on-disk cache of the per-diet impact pass, keyed by a hash of its inputs
+# (set ANALYSIS_CACHE=1 to use it; the engine still loads its factors on every run,
+# so it only pays off when the impact pass is made heavier, e.g. many more diets)
+ANALYSIS_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.cache')
+
+def impact_bundles_cached(engine, diets, cache_dir=ANALYSIS_CACHE_DIR):
+    """
+    engine.impact_bundle for every diet, loaded from cache_dir when ANALYSIS_CACHE is set
+    and the inputs are unchanged (an unreadable cache file is recomputed and rewritten).
+    
+    The key covers the diet profiles, the config scalars, the engine's prepared factor tables and
+    the source of everything impact_bundle runs (Scope3Engine, impact_factor_arrays and the engine
+    kernels), so editing any of them invalidates the cache.
+    
+    Returns:
+        dict: diet name -> (raw impact dict, (agg_mass, agg_co2, agg_scope12, agg_land, agg_water))
+    """
+    def compute():
+        return {name: engine.impact_bundle(profile) for name, profile in diets.items()}
+
+    if not os.environ.get('ANALYSIS_CACHE'):
+        return compute()
+    h = hashlib.sha1()
+    h.update(repr([(name, list(profile.items())) for name, profile in diets.items()]).encode())
+    h.update(repr((engine._waste, engine._pop, list(engine._food_index), CAT_ORDER, str(engine._dtype))).encode())
+    for arr in (engine._factor_matrix_daily, engine._lifecycle_factors_annual, engine._food2cat):
+        h.update(np.ascontiguousarray(arr).tobytes())
+    h.update(_LOCAL_SCALING_WEIGHTS.tobytes())
+    for obj in (Scope3Engine, impact_factor_arrays, _raw_impact_kernel, _aggregate_kernel):
+        if obj is not None:  # kernels are None without Numba
+            h.update(inspect.getsource(getattr(obj, 'py_func', obj)).encode())
+    path = os.path.join(cache_dir, f'analysis-{h.hexdigest()}.pkl')
+    try:
+        with open(path, 'rb') as f:
+            bundles = pickle.load(f)
+        print(f"[CACHE] Loaded diet impacts from {path}")
+        return bundles
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # e.g. a pickle written under another NumPy/pandas version
+        print(f"[CACHE] Ignoring unreadable {path}: {e}")
+    bundles = compute()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(bundles, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"[CACHE] Could not write {path}: {e}")
+    return bundles
+
 def run_full_analysis():
+    # Figure 2 and Table 7 render in worker processes while the charts run; 'spawn' keeps the
+    # workers free of this process's pyplot state and writer threads. The with block shuts the
+    # pool down even when a chart raises.
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as standalone_pool:
+        _run_full_analysis(standalone_pool)
+
+def _run_full_analysis(standalone_pool):
     cfg = HybridModelConfig()
     
-    # Load impact factors and check which split method is being used
-    factors = load_impact_factors()
-    
     # Determine output folder suffix based on split method
     # Check the USE_UNIFORM_SPLIT flag from load_impact_factors scope
-    import inspect
     source = inspect.getsource(load_impact_factors)
     use_uniform = 'USE_UNIFORM_SPLIT = True' in source
     folder_suffix = '_uniform' if use_uniform else '_categoryspecific'
@@ -1421,8 +1975,9 @@ def run_full_analysis():
     # For appendix: use all 9 diets
     
     # Helper function: Clean diet labels (remove numbers, keep parenthetical descriptors for clarity)
+    @lru_cache(maxsize=None)
     def clean_diet_label(diet_name):
-        """Remove number prefix and standardize diet names, KEEPING descriptors for clarity"""
+        """Remove number prefix and standardize diet names, KEEPING descriptors for clarity (cached per run)"""
         # Remove number prefix (e.g., "1. " or "10. ")
         label = diet_name.split('. ', 1)[1] if '. ' in diet_name else diet_name
         # KEEP all parenthetical descriptors for clarity
@@ -1432,6 +1987,34 @@ def run_full_analysis():
             label = label.replace('Schijf van Vijf', 'Schijf van 5')
         return label
     
+    @lru_cache(maxsize=None)
+    def diet_comp_pct(diet_name):
+        """Mass share (%) per CAT_ORDER category of a diet (read-only array, cached per run)"""
+        profile = diets[diet_name]
+        total_weight = sum(profile.values())
+        comp = np.zeros(len(CAT_ORDER))
+        if total_weight > 0:
+            for item, grams in profile.items():
+                cat_i = FOOD_TO_CAT_IDX.get(item)
+                if cat_i is not None:
+                    comp[cat_i] += grams / total_weight * 100
+        comp.flags.writeable = False
+        return comp
+
+    def avg_comp_pct(diet_names):
+        """Mean category mass share (%) across diets (zeros for an empty list)"""
+        return sum(diet_comp_pct(d) for d in diet_names) / max(len(diet_names), 1)
+
+    def rank_by_magnitude(delta, n=None):
+        """CAT_ORDER indices of delta ordered by |change|, largest first (stable for ties), top n"""
+        return np.argsort(-np.abs(delta), kind='stable')[:n]
+
+    def actual_scope_split(diet_name):
+        """Uncalibrated per-category (Scope 1+2, Scope 3) dicts from the memoized engine aggregate"""
+        agg = engine.aggregate_visual_array(diets[diet_name])
+        return (dict(zip(CAT_ORDER, agg[engine.AGG_ROWS.index('scope12')].tolist())),
+                dict(zip(CAT_ORDER, agg[engine.AGG_ROWS.index('co2')].tolist())))
+
     # Helper function: filter data by diet list
     def filter_by_diets(data_dict, diet_list):
         return {k: v for k, v in data_dict.items() if k in diet_list}
@@ -1444,16 +2027,6 @@ def run_full_analysis():
     results_water = {}
     total_footprints = {}
     
-    for name, profile in diets.items():
-        mass, co2, scope12, land, water = engine.aggregate_visual_data(profile)
-        results_mass[name] = mass
-        results_co2[name] = co2
-        results_scope12[name] = scope12
-        results_land[name] = land
-        results_water[name] = water
-        # Total = Scope 1+2 + Scope 3
-        total_footprints[name] = sum(scope12.values()) + sum(co2.values())
-
     # FIXED INFRASTRUCTURE APPROACH: Calibrate ALL diets to 1750 kton Scope 1+2
     # This represents a scenario where Amsterdam's processing/retail infrastructure remains constant
     # Only Scope 3 (supply chain) emissions vary with dietary changes
@@ -1465,23 +2038,58 @@ def run_full_analysis():
     print(f"[CALIBRATION] Rationale: Amsterdam's food processing, retail, and waste infrastructure")
     print(f"[CALIBRATION]            operates on fixed capacity; only supply chain (Scope 3) varies\n")
     
-    # Calculate calibration scale factor for each diet to hit 1750 kton Scope 1+2
+    # One pass per diet: daily per-capita impacts and category aggregates (one engine call),
+    # the scale factor that brings its Scope 1+2 to 1750 kton, the calibrated Scope 1+2
+    # (ALL diets, not just Monitor 2024) and the Scope 1+2+3 total used by the charts below
+    raw_impacts = {}
     scope12_scales = {}
-    for diet in results_scope12.keys():
-        raw_scope12 = sum(results_scope12[diet].values())
-        scope12_scales[diet] = (scope12_target_kton * 1000) / raw_scope12 if raw_scope12 else 1.0
-        print(f"  {diet}: Raw={raw_scope12/1000:.1f} kton → Scale factor={scope12_scales[diet]:.4f}")
-    
-    # Apply calibration to ALL diets (not just Monitor 2024)
-    results_scope12 = {
-        diet: {cat: val * scope12_scales[diet]
-               for cat, val in cats.items()}
-        for diet, cats in results_scope12.items()
-    }
-    
-    # Recompute totals to reflect fixed Scope 1+2 values
-    for diet in total_footprints.keys():
-        total_footprints[diet] = sum(results_scope12.get(diet, {}).values()) + sum(results_co2.get(diet, {}).values())
+    for name, (raw, (mass, co2, scope12, land, water)) in impact_bundles_cached(engine, diets).items():
+        raw_impacts[name] = raw
+        results_mass[name] = mass
+        results_co2[name] = co2
+        results_land[name] = land
+        results_water[name] = water
+        raw_scope12 = sum(scope12.values())
+        scale = scope12_scales[name] = (scope12_target_kton * 1000) / raw_scope12 if raw_scope12 else 1.0
+        print(f"  {name}: Raw={raw_scope12/1000:.1f} kton → Scale factor={scale:.4f}")
+        results_scope12[name] = {cat: val * scale for cat, val in scope12.items()}
+        total_footprints[name] = sum(results_scope12[name].values()) + sum(co2.values())
+
+    # Per-diet category arrays (SoA): rows follow diet_keys, columns follow CAT_ORDER.
+    # Built once after calibration so the charts below index arrays instead of nested dicts.
+    diet_keys = list(results_co2.keys())
+    diet_pos = {diet: i for i, diet in enumerate(diet_keys)}
+    S12 = np.array([[results_scope12[d][c] for c in CAT_ORDER] for d in diet_keys])  # tonnes CO2e (calibrated)
+    S3 = np.array([[results_co2[d][c] for c in CAT_ORDER] for d in diet_keys])       # tonnes CO2e
+    M = np.array([[results_mass[d].get(c, 0) for c in CAT_ORDER] for d in diet_keys])  # grams/day
+    LAND = np.array([[results_land[d][c] for c in CAT_ORDER] for d in diet_keys])
+    WATER = np.array([[results_water[d][c] for c in CAT_ORDER] for d in diet_keys])
+    E = S12 + S3  # Total emissions (Scope 1+2+3)
+    total_S12 = S12.sum(axis=1)
+    total_S3 = S3.sum(axis=1)
+    total_E = E.sum(axis=1)
+    total_mass_arr = M.sum(axis=1)
+    total_LAND = LAND.sum(axis=1)
+    total_WATER = WATER.sum(axis=1)
+    # Long-form view (index: diet, cat) for pandas-side per-diet shares and rankings
+    df_long = pd.DataFrame({'scope12': S12.ravel(), 'scope3': S3.ravel(), 'total': E.ravel(), 'mass': M.ravel()},
+                           index=pd.MultiIndex.from_product([diet_keys, CAT_ORDER], names=['diet', 'cat']))
+    diet_totals = df_long.groupby(level='diet', sort=False).sum()
+    diet_shares = (df_long.div(diet_totals, level='diet') * 100).fillna(0)  # 0% where a diet total is zero
+
+    def share_rows(arr, names, value_col):
+        """Long-form % share of each CAT_ORDER category per diet from a SoA array (0 where a diet total is zero)"""
+        rows = arr[[diet_pos[name] for name in names]]
+        totals = rows.sum(axis=1, keepdims=True)
+        pct = np.divide(rows, totals, out=np.zeros_like(rows), where=totals != 0) * 100
+        return pd.DataFrame({'diet': np.repeat(list(names), len(CAT_ORDER)),
+                             'category': np.tile(CAT_ORDER, len(names)), value_col: pct.ravel()})
+    protein_arr_11 = M * PROTEIN_SIMPLE_ARR  # grams protein/day, simple factors (Chart 11 mass vs protein)
+    # Category rankings per diet (descending; stable so ties keep CAT_ORDER), computed once for Charts 9/11/12
+    sort_orders = {diet: {'co2': np.argsort(-S3[i], kind='stable'),
+                          'protein': np.argsort(-protein_arr_11[i], kind='stable'),
+                          'mass': np.argsort(-M[i], kind='stable')}
+                   for i, diet in enumerate(diet_keys)}
 
     # ============================================================================
     # EXPORT: Core Calculation Results as CSV (for reproducibility)
@@ -1528,21 +2136,16 @@ def run_full_analysis():
     
     # Export summary totals (all metrics by diet)
     # NOTE: results_scope12 already includes calibration for Monitor 2024
-    summary_export = []
-    for diet in results_co2.keys():
-        scope12_total = sum(results_scope12.get(diet, {}).values())
-        scope3_total = sum(results_co2.get(diet, {}).values())
-        summary_export.append({
-            'Diet': clean_diet_label(diet),
-            'Scope12_kton': scope12_total,
-            'Scope3_kton': scope3_total,
-            'Land_hectares': sum(results_land.get(diet, {}).values()),
-            'Water_m3': sum(results_water.get(diet, {}).values()),
-            'Total_Emissions_kton': scope12_total + scope3_total
-        })
-    summary_df = pd.DataFrame(summary_export)
+    summary_df = pd.DataFrame({
+        'Diet': [clean_diet_label(diet) for diet in diet_keys],
+        'Scope12_kton': total_S12,
+        'Scope3_kton': total_S3,
+        'Land_hectares': total_LAND,
+        'Water_m3': total_WATER,
+        'Total_Emissions_kton': total_S12 + total_S3
+    })
     summary_df.to_csv(os.path.join(data_dir, 'emissions_totals_by_diet.csv'), index=False)
-    print(f"  ✓ Saved: emissions_totals_by_diet.csv ({len(summary_export)} rows) [Monitor 2024 calibrated to 1750 kton]")
+    print(f"  ✓ Saved: emissions_totals_by_diet.csv ({len(summary_df)} rows) [Monitor 2024 calibrated to 1750 kton]")
     
     # Export Food Mass (composition) by diet and category
     mass_export = []
@@ -1559,20 +2162,23 @@ def run_full_analysis():
     # Integrate neighborhood education/income profiling with emissions to show
     # "Volume vs. Composition" paradox across Amsterdam districts
     # ============================================================================
+    # Figure 2 and Table 7 are self-contained (plain data in, files out), so they go to the
+    # worker pool (see run_full_analysis) and are collected before the final write flush.
+    # The heatmap gets the Monitor impact from this engine's memo, not the engine itself
+    standalone_jobs = []
     print("\nGenerating 2_Spatial_Hotspot_Neighborhood_Heatmap.png...")
-    try:
-        create_neighborhood_heatmap(neighborhoods, diets, diet_name='1. Monitor 2024 (Current)', output_dir=core_dir)
-    except Exception as e:
-        print(f"  [WARN] Could not generate neighborhood heatmap: {str(e)}")
+    monitor_daily_impact = engine.calculate_raw_impact(diets.get('1. Monitor 2024 (Current)', {}))
+    standalone_jobs.append(('neighborhood heatmap', create_neighborhood_heatmap, (neighborhoods, diets),
+                            dict(diet_name='1. Monitor 2024 (Current)', output_dir=core_dir,
+                                 daily_impact=monitor_daily_impact)))
     
     # ============================================================================
     # Generate Table 7: Environmental Impact and Consumption Ratios
     # ============================================================================
     print("\nGenerating Table 7: Environmental Impact and Consumption Ratios...")
-    try:
-        create_consumption_impact_table(diet_name='1. Monitor 2024 (Current)', output_dir=core_dir)
-    except Exception as e:
-        print(f"  [WARN] Could not generate consumption impact table: {str(e)}")
+    standalone_jobs.append(('consumption impact table', create_consumption_impact_table, (),
+                            dict(diet_name='1. Monitor 2024 (Current)', output_dir=core_dir)))
+    standalone_futures = [standalone_pool.submit(fn, *args, **kwargs) for _, fn, args, kwargs in standalone_jobs]
 
 
     # ============================================================================
@@ -1583,9 +2189,8 @@ def run_full_analysis():
     # ============================================================================
     print("Generating 1a_Nexus_Stacked.png and 1b_Nexus_Diverging.png...")
     nexus_data = []
-    for name, profile in diets.items():
-        res = engine.calculate_raw_impact(profile)
-        res['Diet'] = name
+    for name, raw in raw_impacts.items():
+        res = dict(raw, Diet=name)
         nexus_data.append(res)
     df_nexus = pd.DataFrame(nexus_data).set_index('Diet').sort_values('co2', ascending=False)
     
@@ -1618,7 +2223,8 @@ def run_full_analysis():
     land_pct = (land_normalized / total_normalized * 100)
     water_pct = (water_normalized / total_normalized * 100)
     
-    fig1a = plt.figure(figsize=(14, 10))
+    fig1a = template_figure((14, 10))
+    fig1a.clear()
     ax1a = fig1a.add_subplot(111)
     
     y_pos = np.arange(len(diets_list))
@@ -1654,10 +2260,8 @@ def run_full_analysis():
     ax1a.spines['top'].set_visible(False)
     ax1a.spines['right'].set_visible(False)
     
-    plt.tight_layout()
-    safe_savefig(os.path.join(core_dir, '1a_Nexus_Stacked.png'), dpi=200)
-    plt.close()
-    gc.collect()
+    fig1a.tight_layout()
+    safe_savefig(os.path.join(core_dir, '1a_Nexus_Stacked.png'), dpi=200, fig=fig1a, pil_kwargs=HERO_PNG_PIL_KWARGS)
     # Export per-chart data (Chart 1a - core)
     try:
         df_1a_core = pd.DataFrame({
@@ -1678,19 +2282,17 @@ def run_full_analysis():
     diet_labels_div = [clean_diet_label(d) for d in diets_list_div]
     
     # Calculate % change from baseline
-    baseline_total_emissions = (
-        sum(results_scope12.get('1. Monitor 2024 (Current)', {}).values()) +
-        sum(results_co2.get('1. Monitor 2024 (Current)', {}).values())
-    )
+    baseline_total_emissions = total_footprints.get('1. Monitor 2024 (Current)', 0)
     co2_change = np.array([
-        (((sum(results_scope12.get(d, {}).values()) + sum(results_co2.get(d, {}).values())) - baseline_total_emissions) /
+        ((total_footprints.get(d, 0) - baseline_total_emissions) /
          baseline_total_emissions * 100) if baseline_total_emissions else 0
         for d in diets_list_div
     ])
     land_change = ((df_nexus_core_no_baseline['land'] - baseline_land) / baseline_land * 100).values
     water_change = ((df_nexus_core_no_baseline['water'] - baseline_water) / baseline_water * 100).values
     
-    fig1b = plt.figure(figsize=(14, 10))
+    fig1b = template_figure((14, 10))
+    fig1b.clear()
     ax1b = fig1b.add_subplot(111)
     
     y_pos_div = np.arange(len(diets_list_div))
@@ -1736,16 +2338,10 @@ def run_full_analysis():
     ax1b.spines['right'].set_visible(False)
     
     # Create custom legend
-    from matplotlib.patches import Patch
-    legend_elements = [Patch(facecolor='#E74C3C', edgecolor='black', label='Total CO₂ (Scope 1+2+3)'),
-                    Patch(facecolor='#2ECC71', edgecolor='black', label='Land'),
-                    Patch(facecolor='#3498DB', edgecolor='black', label='Water')]
-    ax1b.legend(handles=legend_elements, loc='lower right', fontsize=11, frameon=True)
+    ax1b.legend(handles=NEXUS_LEGEND, loc='lower right', fontsize=11, frameon=True)
     
-    plt.tight_layout()
-    safe_savefig(os.path.join(core_dir, '1b_Nexus_Diverging.png'), dpi=200)
-    plt.close()
-    gc.collect()
+    fig1b.tight_layout()
+    safe_savefig(os.path.join(core_dir, '1b_Nexus_Diverging.png'), dpi=200, fig=fig1b, pil_kwargs=HERO_PNG_PIL_KWARGS)
     # Export per-chart data (Chart 1b - core)
     try:
         df_1b_core = pd.DataFrame({
@@ -1780,7 +2376,8 @@ def run_full_analysis():
     land_pct_app = (land_normalized_app / total_normalized_app * 100)
     water_pct_app = (water_normalized_app / total_normalized_app * 100)
     
-    fig1a_app = plt.figure(figsize=(14, 12))
+    fig1a_app = template_figure((14, 12))
+    fig1a_app.clear()
     ax1a_app = fig1a_app.add_subplot(111)
     
     y_pos_app = np.arange(len(diets_list_app))
@@ -1810,10 +2407,8 @@ def run_full_analysis():
     ax1a_app.spines['top'].set_visible(False)
     ax1a_app.spines['right'].set_visible(False)
     
-    plt.tight_layout()
-    safe_savefig(os.path.join(appendix_dir, '1a_Nexus_Stacked.png'), dpi=200)
-    plt.close()
-    gc.collect()
+    fig1a_app.tight_layout()
+    safe_savefig(os.path.join(appendix_dir, '1a_Nexus_Stacked.png'), dpi=200, fig=fig1a_app)
     # Export per-chart data (Chart 1a - appendix)
     try:
         df_1a_all = pd.DataFrame({
@@ -1836,19 +2431,17 @@ def run_full_analysis():
     baseline_land_app = df_nexus.loc['1. Monitor 2024 (Current)', 'land']
     baseline_water_app = df_nexus.loc['1. Monitor 2024 (Current)', 'water']
     
-    baseline_total_emissions_app = (
-        sum(results_scope12.get('1. Monitor 2024 (Current)', {}).values()) +
-        sum(results_co2.get('1. Monitor 2024 (Current)', {}).values())
-    )
+    baseline_total_emissions_app = total_footprints.get('1. Monitor 2024 (Current)', 0)
     co2_change_app = np.array([
-        (((sum(results_scope12.get(d, {}).values()) + sum(results_co2.get(d, {}).values())) - baseline_total_emissions_app) /
+        ((total_footprints.get(d, 0) - baseline_total_emissions_app) /
          baseline_total_emissions_app * 100) if baseline_total_emissions_app else 0
         for d in diets_list_div_app
     ])
     land_change_app = ((df_nexus_no_baseline['land'] - baseline_land_app) / baseline_land_app * 100).values
     water_change_app = ((df_nexus_no_baseline['water'] - baseline_water_app) / baseline_water_app * 100).values
     
-    fig1b_app = plt.figure(figsize=(14, 12))
+    fig1b_app = template_figure((14, 12))
+    fig1b_app.clear()
     ax1b_app = fig1b_app.add_subplot(111)
     
     y_pos_div_app = np.arange(len(diets_list_div_app))
@@ -1886,12 +2479,10 @@ def run_full_analysis():
     ax1b_app.set_xlim(-120, 120)
     ax1b_app.spines['top'].set_visible(False)
     ax1b_app.spines['right'].set_visible(False)
-    ax1b_app.legend(handles=legend_elements, loc='lower right', fontsize=11, frameon=True)
+    ax1b_app.legend(handles=NEXUS_LEGEND, loc='lower right', fontsize=11, frameon=True)
     
-    plt.tight_layout()
-    safe_savefig(os.path.join(appendix_dir, '1b_Nexus_Diverging.png'), dpi=200)
-    plt.close()
-    gc.collect()
+    fig1b_app.tight_layout()
+    safe_savefig(os.path.join(appendix_dir, '1b_Nexus_Diverging.png'), dpi=200, fig=fig1b_app)
     # Export per-chart data (Chart 1b - appendix)
     try:
         df_1b_all = pd.DataFrame({
@@ -1973,8 +2564,8 @@ def run_full_analysis():
         ax_change.legend(loc='upper left', bbox_to_anchor=(1.02, 1), frameon=True, fontsize=10)
         ax_change.grid(axis='y', linestyle='--', alpha=0.3)
         plt.tight_layout()
-        plt.savefig(os.path.join(core_dir, '1c_System_Wide_Impact_Change.png'), dpi=300, bbox_inches='tight')
-        plt.savefig(os.path.join(appendix_dir, '1c_System_Wide_Impact_Change.png'), dpi=300, bbox_inches='tight')
+        save_and_copy(os.path.join(core_dir, '1c_System_Wide_Impact_Change.png'),
+                      os.path.join(appendix_dir, '1c_System_Wide_Impact_Change.png'), dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
         plt.close()
         # Export per-chart data (Chart 1c)
         try:
@@ -1986,7 +2577,7 @@ def run_full_analysis():
     # ============================================================================
     # CHART 1d: SYSTEM-WIDE IMPACT MATRIX (per-diet panels, GHG/Water/Land)
     # ============================================================================
-    def plot_system_wide_matrix(diet_keys, out_path):
+    def plot_system_wide_matrix(diet_keys, out_path, dpi):
         panels = []
         for diet in diet_keys:
             if diet not in df_nexus.index or diet == baseline_key:
@@ -2005,10 +2596,10 @@ def run_full_analysis():
         impacts = ['GHG Emissions', 'Water Use', 'Land Use']
         n = len(df_panels)
         cols = 3 if n > 3 else n
-        rows = int(np.ceil(n / cols))
+        rows = -(-n // cols)
 
-        fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3.5 * rows), sharey=True)
-        axes = np.array(axes).reshape(-1)
+        fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3.5 * rows), sharey=True, squeeze=False)
+        axes = axes.ravel()
 
         y_min = min(df_panels[impacts].min().min(), -30)
         y_max = max(df_panels[impacts].max().max(), 30)
@@ -2040,13 +2631,13 @@ def run_full_analysis():
         fig.suptitle('Change of Food System-Wide Impacts (vs Monitor 2024 Baseline)', fontsize=14, fontweight='bold', y=0.98)
         fig.legend(impacts, loc='lower center', ncol=3, frameon=True, bbox_to_anchor=(0.5, 0.0), fontsize=10)
         plt.tight_layout(rect=[0, 0.06, 1, 0.96])
-        plt.savefig(out_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        save_and_copy(out_path, fig=fig, dpi=dpi)
+        plt.close(fig)
 
     # Core matrix (focus + goals)
-    plot_system_wide_matrix(focus_and_goals_core, os.path.join(core_dir, '1d_System_Wide_Impact_Matrix.png'))
+    plot_system_wide_matrix(focus_and_goals_core, os.path.join(core_dir, '1d_System_Wide_Impact_Matrix.png'), CORE_DPI)
     # Appendix matrix (all diets)
-    plot_system_wide_matrix(df_nexus.index.tolist(), os.path.join(appendix_dir, '1d_System_Wide_Impact_Matrix.png'))
+    plot_system_wide_matrix(df_nexus.index.tolist(), os.path.join(appendix_dir, '1d_System_Wide_Impact_Matrix.png'), APPENDIX_DPI)
     # Export per-chart data (Chart 1d - core + appendix)
     try:
         def build_system_wide_df(diet_keys):
@@ -2075,32 +2666,15 @@ def run_full_analysis():
     # CORE: Focus diets only
     results_mass_core = filter_by_diets(results_mass, focus_diets_core)
     n_diets_core = len(results_mass_core)
-    cols2_core = int(np.ceil(np.sqrt(n_diets_core)))
-    rows2_core = int(np.ceil(n_diets_core / cols2_core))
-    fig2, axes2 = plt.subplots(rows2_core, cols2_core, figsize=(6 * cols2_core, 6 * rows2_core))
-    axes2 = np.array(axes2).reshape(-1)
+    rows2_core, cols2_core = grid_shape(n_diets_core)
+    fig2, axes2 = plt.subplots(rows2_core, cols2_core, figsize=(6 * cols2_core, 6 * rows2_core), subplot_kw=dict(projection='thin'), squeeze=False)
+    axes2 = axes2.ravel()
     
-    for i, (name, mass_dict) in enumerate(results_mass_core.items()):
+    for i, name in enumerate(results_mass_core):
         if i >= len(axes2): break
         ax = axes2[i]
-        vals = [mass_dict[c] for c in CAT_ORDER]
-        
         # Only show percentages for slices > 3% to avoid clutter
-        def autopct_format(pct):
-            return f'{pct:.0f}%' if pct > 3 else ''
-        
-        wedges, texts, autotexts = ax.pie(vals, labels=None, autopct=autopct_format, 
-                                        startangle=90, pctdistance=0.75, colors=COLORS,
-                                        wedgeprops=dict(width=0.5, edgecolor='white', linewidth=1.5))
-        
-        # Make percentage text bold and white for better visibility
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(10)
-            autotext.set_fontweight('bold')
-        
-        ax.set_title(name, fontsize=13, fontweight='bold', pad=10)
-        ax.text(0, 0, "MASS", ha='center', va='center', fontsize=11, color='#666666', fontweight='bold')
+        draw_donut(ax, M[diet_pos[name]].tolist(), name, "MASS")
     
     for j in range(n_diets_core, len(axes2)): axes2[j].axis('off')
     
@@ -2109,48 +2683,25 @@ def run_full_analysis():
             bbox_to_anchor=(0.5, -0.05), fontsize=9, edgecolor='black')
     fig2.suptitle('Mass Distribution: 3 Focus Diets', fontsize=15, fontweight='bold', y=0.98)
     plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '2_All_Plates_Mass.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '2_All_Plates_Mass.png'), dpi=CORE_DPI)
     plt.close()
     # Export per-chart data (Chart 2 - core)
     try:
-        rows2c = []
-        for name, mass_dict in results_mass_core.items():
-            total = sum(mass_dict.get(c, 0.0) for c in CAT_ORDER)
-            for c in CAT_ORDER:
-                val = mass_dict.get(c, 0.0)
-                rows2c.append({'diet': name, 'category': c, 'mass_share_pct': (val / total * 100) if total else 0.0})
-        pd.DataFrame(rows2c).to_csv(os.path.join(data_dir, '2_All_Plates_Mass_core.csv'), index=False)
+        share_rows(M, list(results_mass_core), 'mass_share_pct').to_csv(os.path.join(data_dir, '2_All_Plates_Mass_core.csv'), index=False)
     except Exception as e:
         print(f"Warning: failed to export 2 core CSV: {e}")
     
     # APPENDIX: All 9 diets
     n_diets = len(results_mass)
-    cols2 = int(np.ceil(np.sqrt(n_diets)))
-    rows2 = int(np.ceil(n_diets / cols2))
-    fig2b, axes2b = plt.subplots(rows2, cols2, figsize=(6 * cols2, 6 * rows2))
-    axes2b = np.array(axes2b).reshape(-1)
+    rows2, cols2 = grid_shape(n_diets)
+    fig2b, axes2b = plt.subplots(rows2, cols2, figsize=(6 * cols2, 6 * rows2), subplot_kw=dict(projection='thin'), squeeze=False)
+    axes2b = axes2b.ravel()
     
-    for i, (name, mass_dict) in enumerate(results_mass.items()):
+    for i, name in enumerate(results_mass):
         if i >= len(axes2b): break
         ax = axes2b[i]
-        vals = [mass_dict[c] for c in CAT_ORDER]
-        
         # Only show percentages for slices > 3% to avoid clutter
-        def autopct_format(pct):
-            return f'{pct:.0f}%' if pct > 3 else ''
-        
-        wedges, texts, autotexts = ax.pie(vals, labels=None, autopct=autopct_format, 
-                                        startangle=90, pctdistance=0.75, colors=COLORS,
-                                        wedgeprops=dict(width=0.5, edgecolor='white', linewidth=1.5))
-        
-        # Make percentage text bold and white for better visibility
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(9)
-            autotext.set_fontweight('bold')
-        
-        ax.set_title(name, fontsize=12, fontweight='bold', pad=10)
-        ax.text(0, 0, "MASS", ha='center', va='center', fontsize=10, color='#666666', fontweight='bold')
+        draw_donut(ax, M[diet_pos[name]].tolist(), name, "MASS", pct_fontsize=9, title_fontsize=12, center_fontsize=10)
     
     for j in range(n_diets, len(axes2b)): axes2b[j].axis('off')
     
@@ -2159,17 +2710,11 @@ def run_full_analysis():
             bbox_to_anchor=(0.5, -0.05), fontsize=9, edgecolor='black')
     fig2b.suptitle('Mass Distribution: All 9 Diets', fontsize=15, fontweight='bold', y=0.98)
     plt.tight_layout()
-    plt.savefig(os.path.join(appendix_dir, '2_All_Plates_Mass.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '2_All_Plates_Mass.png'), dpi=APPENDIX_DPI)
     plt.close()
     # Export per-chart data (Chart 2 - appendix)
     try:
-        rows2a = []
-        for name, mass_dict in results_mass.items():
-            total = sum(mass_dict.get(c, 0.0) for c in CAT_ORDER)
-            for c in CAT_ORDER:
-                val = mass_dict.get(c, 0.0)
-                rows2a.append({'diet': name, 'category': c, 'mass_share_pct': (val / total * 100) if total else 0.0})
-        pd.DataFrame(rows2a).to_csv(os.path.join(data_dir, '2_All_Plates_Mass_all.csv'), index=False)
+        share_rows(M, list(results_mass), 'mass_share_pct').to_csv(os.path.join(data_dir, '2_All_Plates_Mass_all.csv'), index=False)
     except Exception as e:
         print(f"Warning: failed to export 2 appendix CSV: {e}")
 
@@ -2178,34 +2723,16 @@ def run_full_analysis():
     # CORE: Focus diets only
     results_co2_core = filter_by_diets(results_co2, focus_diets_core)
     n_diets3_core = len(results_co2_core)
-    cols3_core = int(np.ceil(np.sqrt(n_diets3_core)))
-    rows3_core = int(np.ceil(n_diets3_core / cols3_core))
-    fig3, axes3 = plt.subplots(rows3_core, cols3_core, figsize=(6 * cols3_core, 6 * rows3_core))
-    axes3 = np.array(axes3).reshape(-1)
+    rows3_core, cols3_core = grid_shape(n_diets3_core)
+    fig3, axes3 = plt.subplots(rows3_core, cols3_core, figsize=(6 * cols3_core, 6 * rows3_core), subplot_kw=dict(projection='thin'), squeeze=False)
+    axes3 = axes3.ravel()
     
-    for i, (name, co2_dict) in enumerate(results_co2_core.items()):
+    for i, name in enumerate(results_co2_core):
         if i >= len(axes3): break
         ax = axes3[i]
-        vals = [co2_dict[c] for c in CAT_ORDER]
-        
+        vals = S3[diet_pos[name]].tolist()
         # Only show percentages for slices > 3% to avoid clutter
-        def autopct_format(pct):
-            return f'{pct:.0f}%' if pct > 3 else ''
-        
-        wedges, texts, autotexts = ax.pie(vals, labels=None, autopct=autopct_format, 
-                                        startangle=90, pctdistance=0.75, colors=COLORS,
-                                        wedgeprops=dict(width=0.5, edgecolor='white', linewidth=1.5))
-        
-        # Make percentage text bold and white for better visibility
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(10)
-            autotext.set_fontweight('bold')
-        
-        ax.set_title(name, fontsize=13, fontweight='bold', pad=10)
-        total_t = sum(vals)
-        ax.text(0, 0, f"{int(total_t/1000)}k\nTonnes", ha='center', va='center', 
-                fontsize=11, fontweight='bold', color='#666666')
+        draw_donut(ax, vals, name, f"{int(sum(vals)/1000)}k\nTonnes")
     
     for j in range(n_diets3_core, len(axes3)): axes3[j].axis('off')
     
@@ -2214,50 +2741,27 @@ def run_full_analysis():
             bbox_to_anchor=(0.5, -0.08), fontsize=9, edgecolor='black')
     fig3.subplots_adjust(bottom=0.15)
     fig3.suptitle('Scope 3 Emissions Distribution: 3 Focus Diets', fontsize=15, fontweight='bold', y=0.98)
-    plt.savefig(os.path.join(core_dir, '3_All_Emissions_Donuts.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '3_All_Emissions_Donuts.png'), dpi=CORE_DPI)
     plt.close()
     # Export per-chart data (Chart 3 - core)
     try:
-        rows3c = []
-        for name, co2_dict in results_co2_core.items():
-            total = sum(co2_dict.get(c, 0.0) for c in CAT_ORDER)
-            for c in CAT_ORDER:
-                val = co2_dict.get(c, 0.0)
-                rows3c.append({'diet': name, 'category': c, 'scope3_share_pct': (val / total * 100) if total else 0.0})
-        pd.DataFrame(rows3c).to_csv(os.path.join(data_dir, '3_All_Emissions_Donuts_core.csv'), index=False)
+        share_rows(S3, list(results_co2_core), 'scope3_share_pct').to_csv(os.path.join(data_dir, '3_All_Emissions_Donuts_core.csv'), index=False)
     except Exception as e:
         print(f"Warning: failed to export 3 core CSV: {e}")
     
     # APPENDIX: All 9 diets
     n_diets3 = len(results_co2)
-    cols3 = int(np.ceil(np.sqrt(n_diets3)))
-    rows3 = int(np.ceil(n_diets3 / cols3))
-    fig3b, axes3b = plt.subplots(rows3, cols3, figsize=(6 * cols3, 6 * rows3))
-    axes3b = np.array(axes3b).reshape(-1)
+    rows3, cols3 = grid_shape(n_diets3)
+    fig3b, axes3b = plt.subplots(rows3, cols3, figsize=(6 * cols3, 6 * rows3), subplot_kw=dict(projection='thin'), squeeze=False)
+    axes3b = axes3b.ravel()
     
-    for i, (name, co2_dict) in enumerate(results_co2.items()):
+    for i, name in enumerate(results_co2):
         if i >= len(axes3b): break
         ax = axes3b[i]
-        vals = [co2_dict[c] for c in CAT_ORDER]
-        
+        vals = S3[diet_pos[name]].tolist()
         # Only show percentages for slices > 2% to avoid clutter
-        def autopct_format(pct):
-            return f'{pct:.0f}%' if pct > 2 else ''
-        
-        wedges, texts, autotexts = ax.pie(vals, labels=None, autopct=autopct_format, 
-                                        startangle=90, pctdistance=0.75, colors=COLORS,
-                                        wedgeprops=dict(width=0.5, edgecolor='white', linewidth=1.5))
-        
-        # Make percentage text bold and white for better visibility
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(9)
-            autotext.set_fontweight('bold')
-        
-        ax.set_title(name, fontsize=12, fontweight='bold', pad=10)
-        total_t = sum(vals)
-        ax.text(0, 0, f"{int(total_t/1000)}k\nTonnes", ha='center', va='center', 
-                fontsize=10, fontweight='bold', color='#666666')
+        draw_donut(ax, vals, name, f"{int(sum(vals)/1000)}k\nTonnes", min_pct=2,
+                   pct_fontsize=9, title_fontsize=12, center_fontsize=10)
     
     for j in range(n_diets3, len(axes3b)): axes3b[j].axis('off')
     
@@ -2266,43 +2770,37 @@ def run_full_analysis():
             bbox_to_anchor=(0.5, -0.08), fontsize=9, edgecolor='black')
     fig3b.subplots_adjust(bottom=0.15)
     fig3b.suptitle('Scope 3 Emissions Distribution: All 9 Diets', fontsize=15, fontweight='bold', y=0.98)
-    plt.savefig(os.path.join(appendix_dir, '3_All_Emissions_Donuts.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '3_All_Emissions_Donuts.png'), dpi=APPENDIX_DPI)
     plt.close()
     # Export per-chart data (Chart 3 - appendix)
     try:
-        rows3a = []
-        for name, co2_dict in results_co2.items():
-            total = sum(co2_dict.get(c, 0.0) for c in CAT_ORDER)
-            for c in CAT_ORDER:
-                val = co2_dict.get(c, 0.0)
-                rows3a.append({'diet': name, 'category': c, 'scope3_share_pct': (val / total * 100) if total else 0.0})
-        pd.DataFrame(rows3a).to_csv(os.path.join(data_dir, '3_All_Emissions_Donuts_all.csv'), index=False)
+        share_rows(S3, list(results_co2), 'scope3_share_pct').to_csv(os.path.join(data_dir, '3_All_Emissions_Donuts_all.csv'), index=False)
     except Exception as e:
         print(f"Warning: failed to export 3 appendix CSV: {e}")
 
     # 4. DISTANCE TO GOALS
     print("Generating 4_Distance_To_Goals.png...")
+    import seaborn as sns  # Deferred: only the Chart 4 heatmaps use seaborn (pulls in scipy on import)
+    def reduction_matrix(bases, goals):
+        """% reduction needed to go from each base diet (rows) to each goal diet (columns)"""
+        base_vals = np.fromiter((total_footprints[d] for d in bases), dtype=np.float64, count=len(bases))
+        goal_vals = np.fromiter((total_footprints[g] for g in goals), dtype=np.float64, count=len(goals))
+        mat = (base_vals[:, None] - goal_vals[None, :]) / base_vals[:, None] * 100
+        return pd.DataFrame(mat, index=bases, columns=goals)
+
     # CORE: 3 focus diets vs 4 goal diets
     goals_core = goal_diets_core
     baselines_core = focus_diets_core
-    data_matrix_core = []
-    for base in baselines_core:
-        row = []
-        base_val = total_footprints[base]
-        for goal in goals_core:
-            goal_val = total_footprints[goal]
-            reduction_needed = (base_val - goal_val) / base_val * 100
-            row.append(reduction_needed)
-        data_matrix_core.append(row)
-    df_matrix_core = pd.DataFrame(data_matrix_core, index=baselines_core, columns=goals_core)
+    df_matrix_core = reduction_matrix(baselines_core, goals_core)
     fig4, ax4 = plt.subplots(figsize=(11, 6))
     sns.heatmap(df_matrix_core, annot=True, fmt=".1f", cmap="Reds", cbar_kws={'label': '% Reduction Needed'}, ax=ax4)
     ax4.set_title("Distance to Target: % Reduction Required (3 Focus Diets vs 4 Goals)", fontsize=13, fontweight='bold', pad=15)
     ax4.set_xlabel("Goal Diets", fontweight='bold')
     ax4.set_ylabel("Current Diets", fontweight='bold')
     fig4.tight_layout()
-    fig4.savefig(os.path.join(core_dir, '4_Distance_To_Goals.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_and_copy(os.path.join(core_dir, '4_Distance_To_Goals.png'), fig=fig4, dpi=CORE_DPI, tight=False,
+                  pil_kwargs=HERO_PNG_PIL_KWARGS)
+    plt.close(fig4)
     # Export per-chart data (Chart 4 - core)
     try:
         df_matrix_core.to_csv(os.path.join(data_dir, '4_Distance_To_Goals_core.csv'))
@@ -2312,23 +2810,14 @@ def run_full_analysis():
     # APPENDIX: All 9 diets vs all goals
     all_diets = list(diets.keys())
     all_goals = list(diets.keys())
-    data_matrix_all = []
-    for base in all_diets:
-        row = []
-        base_val = total_footprints[base]
-        for goal in all_goals:
-            goal_val = total_footprints[goal]
-            reduction_needed = (base_val - goal_val) / base_val * 100
-            row.append(reduction_needed)
-        data_matrix_all.append(row)
-    df_matrix_all = pd.DataFrame(data_matrix_all, index=all_diets, columns=all_goals)
+    df_matrix_all = reduction_matrix(all_diets, all_goals)
     fig4b, ax4b = plt.subplots(figsize=(13, 10))
     sns.heatmap(df_matrix_all, annot=True, fmt=".1f", cmap="Reds", cbar_kws={'label': '% Reduction Needed'}, ax=ax4b)
     ax4b.set_title("Distance to Target: % Reduction Required (All 9 Diets)", fontsize=13, fontweight='bold', pad=15)
     ax4b.set_xlabel("Goal Diets", fontweight='bold')
     ax4b.set_ylabel("Current Diets", fontweight='bold')
     fig4b.tight_layout()
-    fig4b.savefig(os.path.join(appendix_dir, '4_Distance_To_Goals.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '4_Distance_To_Goals.png'), fig=fig4b, dpi=APPENDIX_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4 - appendix)
     try:
@@ -2337,10 +2826,8 @@ def run_full_analysis():
         print(f"Warning: failed to export 4 appendix CSV: {e}")
 
     # Use already-calculated cradle-to-grave scope totals for 4A-4E charts
-    scope3_totals = {diet: sum(results_co2.get(diet, {}).values()) for diet in results_co2}
-    scope12_totals = {}
-    for diet in results_scope12:
-        scope12_totals[diet] = sum(results_scope12.get(diet, {}).values())
+    scope3_totals = dict(zip(diet_keys, total_S3.tolist()))
+    scope12_totals = dict(zip(diet_keys, total_S12.tolist()))
 
     # ================================================
     # 4A-4E: DIET ADAPTATION & REDUCTION STRATEGIES
@@ -2374,7 +2861,7 @@ def run_full_analysis():
     
     fig4a.suptitle("Distance to Target: Scope 3 vs Total Comparison (3 Focus Diets)", fontsize=13, fontweight='bold')
     fig4a.tight_layout()
-    fig4a.savefig(os.path.join(core_dir, '4a_Distance_Scope3_vs_Total.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '4a_Distance_Scope3_vs_Total.png'), fig=fig4a, dpi=CORE_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4a - core)
     try:
@@ -2423,7 +2910,7 @@ def run_full_analysis():
     
     fig4b.suptitle('Gap Analysis: Reduction Required by Diet & Goal', fontsize=13, fontweight='bold')
     fig4b.tight_layout()
-    fig4b.savefig(os.path.join(core_dir, '4b_Gap_Analysis_Readiness.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '4b_Gap_Analysis_Readiness.png'), fig=fig4b, dpi=CORE_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4b - core)
     try:
@@ -2445,12 +2932,12 @@ def run_full_analysis():
         ax = axes[idx]
         
         # Get scope values (results_scope12 already calibrated for Monitor 2024)
-        base_s12 = sum(results_scope12.get(base_diet, {}).values())
+        base_s12 = scope12_totals.get(base_diet, 0.0)
         base_s3 = scope3_totals.get(base_diet, 0.0)
         base_total = base_s12 + base_s3
         
         # Calculate average goal values
-        avg_goal_s12 = np.mean([sum(results_scope12.get(g, {}).values()) for g in goals_core])
+        avg_goal_s12 = np.mean([scope12_totals.get(g, 0.0) for g in goals_core])
         avg_goal_s3 = np.mean([scope3_totals.get(g, 0.0) for g in goals_core])
         avg_goal_total = avg_goal_s12 + avg_goal_s3
         
@@ -2478,16 +2965,16 @@ def run_full_analysis():
     
     fig4c.suptitle('Scope Breakdown Waterfall: Current vs Goal', fontsize=13, fontweight='bold')
     fig4c.tight_layout()
-    safe_savefig(os.path.join(core_dir, '4c_Scope_Breakdown_Waterfall.png'), dpi=300)
+    safe_savefig(os.path.join(core_dir, '4c_Scope_Breakdown_Waterfall.png'), dpi=CORE_DPI)
     plt.close()
     # Export per-chart data (Chart 4c - core)
     try:
         rows4c = []
         for base_diet in baselines_core:
-            base_s12 = sum(results_scope12.get(base_diet, {}).values())
+            base_s12 = scope12_totals.get(base_diet, 0.0)
             base_s3 = scope3_totals.get(base_diet, 0.0)
             base_total = base_s12 + base_s3
-            avg_goal_s12 = np.mean([sum(results_scope12.get(g, {}).values()) for g in goals_core])
+            avg_goal_s12 = np.mean([scope12_totals.get(g, 0.0) for g in goals_core])
             avg_goal_s3 = np.mean([scope3_totals.get(g, 0.0) for g in goals_core])
             avg_goal_total = avg_goal_s12 + avg_goal_s3
             reduction_pct = ((base_total - avg_goal_total) / base_total * 100) if base_total else 0.0
@@ -2510,38 +2997,22 @@ def run_full_analysis():
     # Create subplots for each base diet x goal combination (3 diets x 4 goals = 12 panels)
     n_base = len(baselines_core)
     n_goals = len(goals_core)
-    fig4d, axes = plt.subplots(n_base, n_goals, figsize=(5*n_goals, 4*n_base))
-    axes = np.array(axes).reshape(n_base, n_goals)
+    fig4d, axes = plt.subplots(n_base, n_goals, figsize=(5*n_goals, 4*n_base), layout='constrained', squeeze=False)
     
     for base_idx, base_diet in enumerate(baselines_core):
         # Get category weights for current diet
-        base_profile = diets[base_diet]
-        base_total_weight = sum(base_profile.values())
-        base_comp = {cat: 0 for cat in CAT_ORDER}
-        for item, grams in base_profile.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in base_comp:
-                base_comp[cat] += grams / base_total_weight * 100
+        base_comp = diet_comp_pct(base_diet)
         
         for goal_idx, goal_diet in enumerate(goals_core):
             ax = axes[base_idx, goal_idx]
             
-            # Get category weights for specific goal diet
-            goal_profile = diets[goal_diet]
-            goal_total_weight = sum(goal_profile.values())
-            goal_comp = {cat: 0 for cat in CAT_ORDER}
-            for item, grams in goal_profile.items():
-                cat = VISUAL_MAPPING.get(item, item)
-                if cat in goal_comp:
-                    goal_comp[cat] += grams / goal_total_weight * 100
-            
-            # Calculate changes from base diet to specific goal diet
-            changes = {cat: goal_comp[cat] - base_comp[cat] for cat in CAT_ORDER}
+            # Calculate changes from base diet to specific goal diet (category weights)
+            changes = diet_comp_pct(goal_diet) - base_comp
             
             # Sort by magnitude of change
-            sorted_cats = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)
-            cats = [c[0][:15] for c in sorted_cats]  # Truncate long names
-            vals = [c[1] for c in sorted_cats]
+            order = rank_by_magnitude(changes)
+            cats = [CAT_ORDER[j][:15] for j in order]  # Truncate long names
+            vals = changes[order]
             colors_change = ['#117733' if v < 0 else '#CC3311' for v in vals]
             
             bars = ax.barh(cats, vals, color=colors_change, edgecolor='black', linewidth=0.8)
@@ -2561,41 +3032,24 @@ def run_full_analysis():
                         ha='left' if width > 0 else 'right', va='center', fontweight='bold', fontsize=7)
     
     fig4d.suptitle('Diet Adaptation: Food Category Composition Changes (Each Diet to Each Goal)', fontsize=13, fontweight='bold')
-    try:
-        fig4d.tight_layout()
-    except:
-        pass
-    fig4d.savefig(os.path.join(core_dir, '4d_Diet_Shift_Categories.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '4d_Diet_Shift_Categories.png'), fig=fig4d, dpi=CORE_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4d - core, per base→goal, top 8 changes)
     try:
         rows4d = []
         for base_diet in baselines_core:
-            base_profile = diets[base_diet]
-            base_total_weight = sum(base_profile.values())
-            base_comp = {cat: 0 for cat in CAT_ORDER}
-            for item, grams in base_profile.items():
-                cat = VISUAL_MAPPING.get(item, item)
-                if cat in base_comp and base_total_weight > 0:
-                    base_comp[cat] += grams / base_total_weight * 100
+            base_comp = diet_comp_pct(base_diet)
             for goal_diet in goals_core:
-                goal_profile = diets[goal_diet]
-                goal_total_weight = sum(goal_profile.values())
-                goal_comp = {cat: 0 for cat in CAT_ORDER}
-                for item, grams in goal_profile.items():
-                    cat = VISUAL_MAPPING.get(item, item)
-                    if cat in goal_comp and goal_total_weight > 0:
-                        goal_comp[cat] += grams / goal_total_weight * 100
-                changes = {cat: goal_comp[cat] - base_comp[cat] for cat in CAT_ORDER}
-                sorted_cats = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)[:8]
-                for cat, delta in sorted_cats:
+                goal_comp = diet_comp_pct(goal_diet)
+                changes = goal_comp - base_comp
+                for j in rank_by_magnitude(changes, 8):
                     rows4d.append({
                         'base_diet': base_diet,
                         'goal_diet': goal_diet,
-                        'category': cat,
-                        'base_pct': base_comp.get(cat, 0.0),
-                        'goal_pct': goal_comp.get(cat, 0.0),
-                        'delta_pct': delta
+                        'category': CAT_ORDER[j],
+                        'base_pct': base_comp[j],
+                        'goal_pct': goal_comp[j],
+                        'delta_pct': changes[j]
                     })
         pd.DataFrame(rows4d).to_csv(os.path.join(data_dir, '4d_Diet_Shift_Categories_core.csv'), index=False)
     except Exception as e:
@@ -2604,34 +3058,15 @@ def run_full_analysis():
     # 4D-AVG: DIET SHIFT - Average Goal Composition (Core)
     print("Generating 4d-avg_Diet_Shift_Categories.png...")
     n_diets_avg = len(baselines_core)
-    fig4d_avg, axes_avg = plt.subplots(n_diets_avg, 1, figsize=(12, 3*n_diets_avg))
+    fig4d_avg, axes_avg = plt.subplots(n_diets_avg, 1, figsize=(12, 3*n_diets_avg), layout='constrained')
     if n_diets_avg == 1:
         axes_avg = [axes_avg]
     for idx, base_diet in enumerate(baselines_core):
         ax = axes_avg[idx]
-        base_profile = diets[base_diet]
-        base_total_weight = sum(base_profile.values())
-        base_comp = {cat: 0 for cat in CAT_ORDER}
-        for item, grams in base_profile.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in base_comp:
-                base_comp[cat] += grams / base_total_weight * 100
-
-        goal_profiles = [diets[g] for g in goals_core]
-        goal_weights = [sum(p.values()) for p in goal_profiles]
-        avg_goal_comp = {cat: 0 for cat in CAT_ORDER}
-        for gp, gw in zip(goal_profiles, goal_weights):
-            for item, grams in gp.items():
-                cat = VISUAL_MAPPING.get(item, item)
-                if cat in avg_goal_comp and gw > 0:
-                    avg_goal_comp[cat] += grams / gw * 100
-        for cat in avg_goal_comp:
-            avg_goal_comp[cat] /= max(len(goals_core), 1)
-
-        changes = {cat: avg_goal_comp[cat] - base_comp[cat] for cat in CAT_ORDER}
-        sorted_cats = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)[:8]
-        cats = [c[0] for c in sorted_cats]
-        vals = [c[1] for c in sorted_cats]
+        changes = avg_comp_pct(goals_core) - diet_comp_pct(base_diet)
+        order = rank_by_magnitude(changes, 8)
+        cats = [CAT_ORDER[j] for j in order]
+        vals = changes[order]
         colors_change = ['#117733' if v < 0 else '#CC3311' for v in vals]
 
         bars = ax.barh(cats, vals, color=colors_change, edgecolor='black', linewidth=0.8)
@@ -2645,42 +3080,22 @@ def run_full_analysis():
                         ha='left' if width > 0 else 'right', va='center', fontweight='bold', fontsize=7)
 
     fig4d_avg.suptitle('Diet Adaptation (Average Goal): Top Food Category Changes', fontsize=13, fontweight='bold')
-    try:
-        fig4d_avg.tight_layout()
-    except:
-        pass
-    fig4d_avg.savefig(os.path.join(core_dir, '4d-avg_Diet_Shift_Categories.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '4d-avg_Diet_Shift_Categories.png'), fig=fig4d_avg, dpi=CORE_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4d-avg - core, per base→avg goals, top 8 changes)
     try:
         rows4davg = []
+        avg_goal_comp = avg_comp_pct(goals_core)
         for base_diet in baselines_core:
-            base_profile = diets[base_diet]
-            base_total_weight = sum(base_profile.values())
-            base_comp = {cat: 0 for cat in CAT_ORDER}
-            for item, grams in base_profile.items():
-                cat = VISUAL_MAPPING.get(item, item)
-                if cat in base_comp and base_total_weight > 0:
-                    base_comp[cat] += grams / base_total_weight * 100
-            goal_profiles = [diets[g] for g in goals_core]
-            goal_weights = [sum(p.values()) for p in goal_profiles]
-            avg_goal_comp = {cat: 0 for cat in CAT_ORDER}
-            for gp, gw in zip(goal_profiles, goal_weights):
-                for item, grams in gp.items():
-                    cat = VISUAL_MAPPING.get(item, item)
-                    if cat in avg_goal_comp and gw > 0:
-                        avg_goal_comp[cat] += grams / gw * 100
-            for cat in avg_goal_comp:
-                avg_goal_comp[cat] /= max(len(goals_core), 1)
-            changes = {cat: avg_goal_comp[cat] - base_comp[cat] for cat in CAT_ORDER}
-            sorted_cats = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)[:8]
-            for cat, delta in sorted_cats:
+            base_comp = diet_comp_pct(base_diet)
+            changes = avg_goal_comp - base_comp
+            for j in rank_by_magnitude(changes, 8):
                 rows4davg.append({
                     'base_diet': base_diet,
-                    'category': cat,
-                    'base_pct': base_comp.get(cat, 0.0),
-                    'avg_goal_pct': avg_goal_comp.get(cat, 0.0),
-                    'delta_pct': delta
+                    'category': CAT_ORDER[j],
+                    'base_pct': base_comp[j],
+                    'avg_goal_pct': avg_goal_comp[j],
+                    'delta_pct': changes[j]
                 })
         pd.DataFrame(rows4davg).to_csv(os.path.join(data_dir, '4d_avg_Diet_Shift_Categories_core.csv'), index=False)
     except Exception as e:
@@ -2688,7 +3103,7 @@ def run_full_analysis():
     
     # 4E: SANKEY-STYLE REDUCTION PATHWAY
     print("Generating 4e_Reduction_Pathways.png...")
-    fig4e, ax4e = plt.subplots(figsize=(14, 8))
+    fig4e, ax4e = plt.subplots(figsize=(14, 8), layout='constrained')
     
     # Create a flow chart showing which diets achieve which goals most efficiently
     # X-axis: Current diets, Y-axis: Goals, color by reduction % required
@@ -2730,11 +3145,7 @@ def run_full_analysis():
                 fontsize=12, fontweight='bold', pad=15)
     ax4e.invert_yaxis()
     
-    try:
-        fig4e.tight_layout()
-    except:
-        pass
-    fig4e.savefig(os.path.join(core_dir, '4e_Reduction_Pathways.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '4e_Reduction_Pathways.png'), fig=fig4e, dpi=CORE_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4e - core)
     try:
@@ -2773,7 +3184,7 @@ def run_full_analysis():
     
     fig4a_app.suptitle("Distance to Target: Scope 3 vs Total Comparison (All 9 Diets)", fontsize=13, fontweight='bold')
     fig4a_app.tight_layout()
-    fig4a_app.savefig(os.path.join(appendix_dir, '4a_Distance_Scope3_vs_Total.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '4a_Distance_Scope3_vs_Total.png'), fig=fig4a_app, dpi=APPENDIX_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4a - appendix)
     try:
@@ -2786,9 +3197,9 @@ def run_full_analysis():
     print("Generating 4b_Gap_Analysis_Readiness_Appendix.png...")
     n_diets_gap = len(all_diets)
     cols_gap = 3
-    rows_gap = int(np.ceil(n_diets_gap / cols_gap))
-    fig4b_app, axes_gap = plt.subplots(rows_gap, cols_gap, figsize=(15, 4*rows_gap))
-    axes_gap = np.array(axes_gap).reshape(-1)
+    rows_gap = -(-n_diets_gap // cols_gap)
+    fig4b_app, axes_gap = plt.subplots(rows_gap, cols_gap, figsize=(15, 4*rows_gap), squeeze=False)
+    axes_gap = axes_gap.ravel()
     
     for idx, base_diet in enumerate(all_diets):
         ax = axes_gap[idx]
@@ -2826,7 +3237,7 @@ def run_full_analysis():
     
     fig4b_app.suptitle('Gap Analysis: Reduction Required by Diet & Goal (All 9 Diets)', fontsize=13, fontweight='bold')
     fig4b_app.tight_layout()
-    fig4b_app.savefig(os.path.join(appendix_dir, '4b_Gap_Analysis_Readiness.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '4b_Gap_Analysis_Readiness.png'), fig=fig4b_app, dpi=APPENDIX_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4b - appendix)
     try:
@@ -2841,19 +3252,19 @@ def run_full_analysis():
     print("Generating 4c_Scope_Breakdown_Waterfall_Appendix.png...")
     n_diets_scope = len(all_diets)
     cols_scope = 3
-    rows_scope = int(np.ceil(n_diets_scope / cols_scope))
-    fig4c_app, axes_scope = plt.subplots(rows_scope, cols_scope, figsize=(15, 4*rows_scope))
-    axes_scope = np.array(axes_scope).reshape(-1)
+    rows_scope = -(-n_diets_scope // cols_scope)
+    fig4c_app, axes_scope = plt.subplots(rows_scope, cols_scope, figsize=(15, 4*rows_scope), squeeze=False)
+    axes_scope = axes_scope.ravel()
     
     for idx, base_diet in enumerate(all_diets):
         ax = axes_scope[idx]
         
         # Scope 1+2 values (results_scope12 already calibrated for Monitor 2024)
-        base_s12 = sum(results_scope12.get(base_diet, {}).values())
+        base_s12 = scope12_totals.get(base_diet, 0.0)
         base_s3 = scope3_totals.get(base_diet, 0.0)
         base_total = base_s12 + base_s3
         
-        avg_goal_s12 = np.mean([sum(results_scope12.get(g, {}).values()) for g in all_goals])
+        avg_goal_s12 = np.mean([scope12_totals.get(g, 0.0) for g in all_goals])
         avg_goal_s3 = np.mean([scope3_totals.get(g, 0.0) for g in all_goals])
         avg_goal_total = avg_goal_s12 + avg_goal_s3
         
@@ -2881,43 +3292,24 @@ def run_full_analysis():
     
     fig4c_app.suptitle('Scope Breakdown: Current vs Goal Average (All 9 Diets)', fontsize=13, fontweight='bold')
     fig4c_app.tight_layout()
-    safe_savefig(os.path.join(appendix_dir, '4c_Scope_Breakdown_Waterfall.png'), dpi=300)
+    safe_savefig(os.path.join(appendix_dir, '4c_Scope_Breakdown_Waterfall.png'), dpi=APPENDIX_DPI)
     plt.close()
     
     # 4D Appendix: Category shifts for all 9 diets
     print("Generating 4d_Diet_Shift_Categories_Appendix.png...")
     n_diets_shift = len(all_diets)
     cols_shift = 3
-    rows_shift = int(np.ceil(n_diets_shift / cols_shift))
-    fig4d_app, axes_shift = plt.subplots(rows_shift, cols_shift, figsize=(15, 4*rows_shift))
-    axes_shift = np.array(axes_shift).reshape(-1)
+    rows_shift = -(-n_diets_shift // cols_shift)
+    fig4d_app, axes_shift = plt.subplots(rows_shift, cols_shift, figsize=(15, 4*rows_shift), squeeze=False)
+    axes_shift = axes_shift.ravel()
     
     for idx, base_diet in enumerate(all_diets):
         ax = axes_shift[idx]
         
-        base_profile = diets[base_diet]
-        base_total_weight = sum(base_profile.values())
-        base_comp = {cat: 0 for cat in CAT_ORDER}
-        for item, grams in base_profile.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in base_comp:
-                base_comp[cat] += grams / base_total_weight * 100
-        
-        goal_profiles = [diets[g] for g in all_goals]
-        goal_weights = [sum(p.values()) for p in goal_profiles]
-        avg_goal_comp = {cat: 0 for cat in CAT_ORDER}
-        for gp, gw in zip(goal_profiles, goal_weights):
-            for item, grams in gp.items():
-                cat = VISUAL_MAPPING.get(item, item)
-                if cat in avg_goal_comp:
-                    avg_goal_comp[cat] += grams / gw * 100
-        for cat in avg_goal_comp:
-            avg_goal_comp[cat] /= len(all_goals)
-        
-        changes = {cat: avg_goal_comp[cat] - base_comp[cat] for cat in CAT_ORDER}
-        sorted_cats = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)[:8]  # Top 8 changes
-        cats = [c[0] for c in sorted_cats]
-        vals = [c[1] for c in sorted_cats]
+        changes = avg_comp_pct(all_goals) - diet_comp_pct(base_diet)
+        order = rank_by_magnitude(changes, 8)  # Top 8 changes
+        cats = [CAT_ORDER[j] for j in order]
+        vals = changes[order]
         colors_change = ['#117733' if v < 0 else '#CC3311' for v in vals]
         
         bars = ax.barh(cats, vals, color=colors_change)
@@ -2936,40 +3328,21 @@ def run_full_analysis():
     
     fig4d_app.suptitle('Diet Adaptation: Top Food Category Changes (All 9 Diets)', fontsize=13, fontweight='bold')
     fig4d_app.tight_layout()
-    fig4d_app.savefig(os.path.join(appendix_dir, '4d_Diet_Shift_Categories.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '4d_Diet_Shift_Categories.png'), fig=fig4d_app, dpi=APPENDIX_DPI, tight=False)
     plt.close()
 
     # 4D-AVG Appendix: Average Goal Composition for ALL diets
     print("Generating 4d-avg_Diet_Shift_Categories_Appendix.png...")
     n_diets_avg_app = len(all_diets)
-    fig4d_avg_app, axes_avg_app = plt.subplots(n_diets_avg_app, 1, figsize=(12, 2.8*n_diets_avg_app))
+    fig4d_avg_app, axes_avg_app = plt.subplots(n_diets_avg_app, 1, figsize=(12, 2.8*n_diets_avg_app), layout='constrained')
     if n_diets_avg_app == 1:
         axes_avg_app = [axes_avg_app]
     for idx, base_diet in enumerate(all_diets):
         ax = axes_avg_app[idx]
-        base_profile = diets[base_diet]
-        base_total_weight = sum(base_profile.values())
-        base_comp = {cat: 0 for cat in CAT_ORDER}
-        for item, grams in base_profile.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in base_comp and base_total_weight > 0:
-                base_comp[cat] += grams / base_total_weight * 100
-
-        goal_profiles = [diets[g] for g in all_goals]
-        goal_weights = [sum(p.values()) for p in goal_profiles]
-        avg_goal_comp = {cat: 0 for cat in CAT_ORDER}
-        for gp, gw in zip(goal_profiles, goal_weights):
-            for item, grams in gp.items():
-                cat = VISUAL_MAPPING.get(item, item)
-                if cat in avg_goal_comp and gw > 0:
-                    avg_goal_comp[cat] += grams / gw * 100
-        for cat in avg_goal_comp:
-            avg_goal_comp[cat] /= max(len(all_goals), 1)
-
-        changes = {cat: avg_goal_comp[cat] - base_comp[cat] for cat in CAT_ORDER}
-        sorted_cats = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)[:8]
-        cats = [c[0] for c in sorted_cats]
-        vals = [c[1] for c in sorted_cats]
+        changes = avg_comp_pct(all_goals) - diet_comp_pct(base_diet)
+        order = rank_by_magnitude(changes, 8)
+        cats = [CAT_ORDER[j] for j in order]
+        vals = changes[order]
         colors_change = ['#117733' if v < 0 else '#CC3311' for v in vals]
         bars = ax.barh(cats, vals, color=colors_change)
         ax.set_xlabel('Change (%)', fontweight='bold', fontsize=9)
@@ -2982,16 +3355,12 @@ def run_full_analysis():
                         ha='left' if width > 0 else 'right', va='center', fontweight='bold', fontsize=7)
 
     fig4d_avg_app.suptitle('Diet Adaptation (Average Goal): Top Food Category Changes (All Diets)', fontsize=13, fontweight='bold')
-    try:
-        fig4d_avg_app.tight_layout()
-    except:
-        pass
-    fig4d_avg_app.savefig(os.path.join(appendix_dir, '4d-avg_Diet_Shift_Categories.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '4d-avg_Diet_Shift_Categories.png'), fig=fig4d_avg_app, dpi=APPENDIX_DPI, tight=False)
     plt.close()
     
     # 4E Appendix: Reduction Pathways for all 9 diets
     print("Generating 4e_Reduction_Pathways_Appendix.png...")
-    fig4e_app, ax4e_app = plt.subplots(figsize=(16, 12))
+    fig4e_app, ax4e_app = plt.subplots(figsize=(16, 12), layout='constrained')
     
     ax4e_app.set_xlim(-0.5, len(all_diets)-0.5)
     ax4e_app.set_ylim(-0.5, len(all_goals)-0.5)
@@ -3024,11 +3393,7 @@ def run_full_analysis():
                     fontsize=12, fontweight='bold', pad=15)
     ax4e_app.invert_yaxis()
     
-    try:
-        fig4e_app.tight_layout()
-    except:
-        pass
-    fig4e_app.savefig(os.path.join(appendix_dir, '4e_Reduction_Pathways.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '4e_Reduction_Pathways.png'), fig=fig4e_app, dpi=APPENDIX_DPI, tight=False)
     plt.close()
     # Export per-chart data (Chart 4e - appendix)
     try:
@@ -3081,32 +3446,13 @@ def run_full_analysis():
     ax_cat = fig_info.add_subplot(gs[1, 1])
     
     # Get top 5 offending categories and best alternatives
-    current_profile = diets[current_diet]
-    current_weight = sum(current_profile.values())
-    current_comp = {cat: 0 for cat in CAT_ORDER}
-    for item, grams in current_profile.items():
-        cat = VISUAL_MAPPING.get(item, item)
-        if cat in current_comp:
-            current_comp[cat] += grams / current_weight * 100
-    
-    # Get average goal composition
-    goal_profiles = [diets[g] for g in goals_core]
-    goal_weights = [sum(p.values()) for p in goal_profiles]
-    avg_goal_comp = {cat: 0 for cat in CAT_ORDER}
-    for gp, gw in zip(goal_profiles, goal_weights):
-        for item, grams in gp.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in avg_goal_comp:
-                avg_goal_comp[cat] += grams / gw * 100
-    for cat in avg_goal_comp:
-        avg_goal_comp[cat] /= len(goals_core)
-    
-    # Calculate changes
-    changes = {cat: avg_goal_comp[cat] - current_comp[cat] for cat in CAT_ORDER}
-    top_changes = sorted(changes.items(), key=lambda x: abs(x[1]), reverse=True)[:5]
-    
-    cats_top = [c[0][:12] for c in top_changes]
-    vals_top = [c[1] for c in top_changes]
+    # Calculate changes against the average goal composition
+    changes = avg_comp_pct(goals_core) - diet_comp_pct(current_diet)
+    top_idx = rank_by_magnitude(changes, 5)
+    top_changes = [(CAT_ORDER[j], changes[j]) for j in top_idx]
+    
+    cats_top = [cat[:12] for cat, _ in top_changes]
+    vals_top = changes[top_idx]
     colors_top = ['#117733' if v < 0 else '#CC3311' for v in vals_top]
     
     bars = ax_cat.barh(cats_top, vals_top, color=colors_top, edgecolor='black', linewidth=0.8)
@@ -3208,7 +3554,7 @@ def run_full_analysis():
     ax_rec.text(0.05, 0.95, rec_text, transform=ax_rec.transAxes, fontsize=9, verticalalignment='top',
             fontfamily='monospace', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    fig_info.savefig(os.path.join(core_dir, '5_Infographic_Summary.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '5_Infographic_Summary.png'), fig=fig_info, dpi=CORE_DPI)
     plt.close()
     
     # -------- APPENDIX: ALL 9 DIETS SUMMARY INFOGRAPHIC --------
@@ -3310,7 +3656,7 @@ def run_full_analysis():
                     verticalalignment='top', fontfamily='monospace',
                     bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
     
-    fig_info_app.savefig(os.path.join(appendix_dir, '5_Infographic_Summary.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '5_Infographic_Summary.png'), fig=fig_info_app, dpi=APPENDIX_DPI)
     plt.close()
 
     # ================================================
@@ -3331,16 +3677,7 @@ def run_full_analysis():
     diet_labels_core = []
     
     for diet_name in diets_to_plot_core:
-        profile = diets[diet_name]
-        total_weight = sum(profile.values())
-        comp = {cat: 0 for cat in CAT_ORDER}
-        
-        for item, grams in profile.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in comp:
-                comp[cat] += grams / total_weight * 100
-        
-        category_data_core.append([comp[cat] for cat in CAT_ORDER])
+        category_data_core.append(diet_comp_pct(diet_name).tolist())
         short_label = clean_diet_label(diet_name)
         diet_labels_core.append(short_label)
     
@@ -3370,7 +3707,7 @@ def run_full_analysis():
     ax_stack_core.grid(axis='y', alpha=0.3, linestyle='--')
     
     fig_stack_core.tight_layout()
-    fig_stack_core.savefig(os.path.join(core_dir, '5f_Food_Category_Stacked_Bars.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '5f_Food_Category_Stacked_Bars.png'), fig=fig_stack_core, dpi=CORE_DPI)
     plt.close()
     
     # APPENDIX: All 9 Diets - Stacked bar chart by food category
@@ -3382,16 +3719,7 @@ def run_full_analysis():
     diet_labels_app = []
     
     for diet_name in diets_to_plot_app:
-        profile = diets[diet_name]
-        total_weight = sum(profile.values())
-        comp = {cat: 0 for cat in CAT_ORDER}
-        
-        for item, grams in profile.items():
-            cat = VISUAL_MAPPING.get(item, item)
-            if cat in comp:
-                comp[cat] += grams / total_weight * 100
-        
-        category_data_app.append([comp[cat] for cat in CAT_ORDER])
+        category_data_app.append(diet_comp_pct(diet_name).tolist())
         # Clean diet names
         short_label = clean_diet_label(diet_name)
         diet_labels_app.append(short_label)
@@ -3422,7 +3750,7 @@ def run_full_analysis():
     ax_stack_app.grid(axis='y', alpha=0.3, linestyle='--')
     
     fig_stack_app.tight_layout()
-    fig_stack_app.savefig(os.path.join(appendix_dir, '5f_Food_Category_Stacked_Bars.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '5f_Food_Category_Stacked_Bars.png'), fig=fig_stack_app, dpi=APPENDIX_DPI)
     plt.close()
 
     # ================================================
@@ -3434,16 +3762,13 @@ def run_full_analysis():
     # ---------------------------------------------
     print("Generating 6_Scope12_vs_Scope3.png and 7_Scope3_Share.png...")
     # Use already-calculated cradle-to-grave data (properly accounts for waste and full lifecycle)
-    scope3_totals = {diet: sum(results_co2.get(diet, {}).values()) for diet in results_co2}
-    # NOTE: results_scope12 already includes calibration for Monitor 2024, so NO additional scaling needed
-    scope12_totals = {diet: sum(results_scope12.get(diet, {}).values()) for diet in results_scope12}
-    total_totals = {diet: scope12_totals.get(diet, 0.0) + scope3_totals.get(diet, 0.0) for diet in results_co2}
-    
+    # NOTE: S12 already includes the Scope 1+2 calibration, so NO additional scaling needed
+    # Built straight from the SoA row totals (rows follow diet_keys, no index alignment)
     df_compare = pd.DataFrame({
-        'Scope 1+2': pd.Series(scope12_totals),
-        'Scope 3': pd.Series(scope3_totals),
-        'Total': pd.Series(total_totals)
-    }).fillna(0.0)
+        'Scope 1+2': total_S12,
+        'Scope 3': total_S3,
+        'Total': total_S12 + total_S3
+    }, index=diet_keys)
     
     # CORE: Filter to focus diets + goal diets only
     diets_for_core = focus_diets_core + goal_diets_core
@@ -3458,7 +3783,7 @@ def run_full_analysis():
     ax6.legend(loc='upper left', bbox_to_anchor=(1.02, 1), frameon=True)
     plt.xticks(rotation=15, ha='right')
     plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '6_Scope12_vs_Scope3_Total.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '6_Scope12_vs_Scope3_Total.png'), dpi=CORE_DPI)
     
     # APPENDIX: All 9 diets
     df_compare_app = df_compare.copy()
@@ -3470,7 +3795,7 @@ def run_full_analysis():
     ax6_app.legend(loc='upper left', bbox_to_anchor=(1.02, 1), frameon=True)
     plt.xticks(rotation=15, ha='right')
     plt.tight_layout()
-    plt.savefig(os.path.join(appendix_dir, '6_Scope12_vs_Scope3_Total.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(appendix_dir, '6_Scope12_vs_Scope3_Total.png'), dpi=APPENDIX_DPI)
     # CSV exports for Chart 6
     df_compare_core.reset_index().rename(columns={'index': 'Diet'}).to_csv(
         os.path.join(data_dir, '6_Scope12_vs_Scope3_Total_core.csv'), index=False)
@@ -3483,7 +3808,9 @@ def run_full_analysis():
     share_s12_core = (df_compare_core['Scope 1+2'] / total_emissions_core).replace([np.inf, np.nan], 0.0) * 100.0
     share_s3_core = (df_compare_core['Scope 3'] / total_emissions_core).replace([np.inf, np.nan], 0.0) * 100.0
     
-    fig7, ax7 = plt.subplots(figsize=(14, 6))
+    fig7 = template_figure((14, 6))
+    fig7.clear()
+    ax7 = fig7.subplots()
     x = np.arange(len(share_s12_core))
     ax7.bar(x, share_s12_core, label='Scope 1+2', color=TOL_BLUE, width=0.4)
     ax7.bar(x, share_s3_core, bottom=share_s12_core, label='Scope 3', color=TOL_ORANGE, width=0.4)
@@ -3493,16 +3820,17 @@ def run_full_analysis():
     ax7.set_xticklabels(df_compare_core.index, rotation=15, ha='right')  # Already cleaned
     ax7.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10, frameon=True)
     ax7.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '7_Scope_Shares.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    fig7.tight_layout()
+    save_and_copy(os.path.join(core_dir, '7_Scope_Shares.png'), fig=fig7, dpi=CORE_DPI)
     
     # Chart 7: Scope shares - APPENDIX (all 9)
     total_emissions_app = df_compare['Total']
     share_s12_app = (df_compare['Scope 1+2'] / total_emissions_app).replace([np.inf, np.nan], 0.0) * 100.0
     share_s3_app = (df_compare['Scope 3'] / total_emissions_app).replace([np.inf, np.nan], 0.0) * 100.0
     
-    fig7_app, ax7_app = plt.subplots(figsize=(14, 6))
+    fig7_app = template_figure((14, 6))
+    fig7_app.clear()
+    ax7_app = fig7_app.subplots()
     x_app = np.arange(len(share_s12_app))
     ax7_app.bar(x_app, share_s12_app, label='Scope 1+2', color=TOL_BLUE, width=0.4)
     ax7_app.bar(x_app, share_s3_app, bottom=share_s12_app, label='Scope 3', color=TOL_ORANGE, width=0.4)
@@ -3512,8 +3840,8 @@ def run_full_analysis():
     ax7_app.set_xticklabels(df_compare_app.index, rotation=15, ha='right')  # Already cleaned
     ax7_app.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10, frameon=True)
     ax7_app.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(appendix_dir, '7_Scope_Shares.png'), dpi=300, bbox_inches='tight')
+    fig7_app.tight_layout()
+    save_and_copy(os.path.join(appendix_dir, '7_Scope_Shares.png'), fig=fig7_app, dpi=APPENDIX_DPI)
     # CSV exports for Chart 7 (scope shares)
     df_share_core = pd.DataFrame({
         'Diet': list(df_compare_core.index),
@@ -3529,38 +3857,24 @@ def run_full_analysis():
     df_share_all.to_csv(os.path.join(data_dir, '7_Scope_Shares_all.csv'), index=False)
 
     print("Generating 8_All_Total_Emissions_Donuts.png...")
-    # Use the properly calculated cradle-to-grave data (scope 1+2 + scope 3)
-    results_total = {}
-    for name in diets.keys():
-        cat_totals = {cat: 0.0 for cat in CAT_ORDER}
-        # Get scope 1+2 and scope 3 from already-calculated results
-        scope12_dict = results_scope12.get(name, {})
-        scope3_dict = results_co2.get(name, {})
-        
-        for cat in CAT_ORDER:
-            # All diets already scaled to 1750 kton in calibration step
-            scope12_val = scope12_dict.get(cat, 0.0)
-            scope3_val = scope3_dict.get(cat, 0.0)
-            cat_totals[cat] = scope12_val + scope3_val
-        
-        results_total[name] = cat_totals
-
-    n_diets8 = len(results_total)
-    cols8 = int(np.ceil(np.sqrt(n_diets8)))
-    rows8 = int(np.ceil(n_diets8 / cols8))
-    fig8, axes8 = plt.subplots(rows8, cols8, figsize=(5 * cols8, 5 * rows8), dpi=100)
-    axes8 = np.array(axes8).reshape(-1)
+    # Use the properly calculated cradle-to-grave data: E rows are scope 1+2 (already
+    # scaled to 1750 kton in the calibration step) + scope 3 per CAT_ORDER category
+    n_diets8 = len(diet_keys)
+    rows8, cols8 = grid_shape(n_diets8)
+    fig8, axes8 = plt.subplots(rows8, cols8, figsize=(5 * cols8, 5 * rows8), dpi=100, subplot_kw=dict(projection='thin'), squeeze=False)
+    axes8 = axes8.ravel()
     
     def autopct_format(pct):
         return f'{pct:.0f}%' if pct > 3 else ''
     
-    for i, (name, total_dict) in enumerate(results_total.items()):
+    for i, name in enumerate(diet_keys):
         if i >= len(axes8): break
         ax = axes8[i]
-        vals = [total_dict[c] for c in CAT_ORDER]
-        ax.pie(vals, labels=None, autopct=autopct_format, startangle=90, pctdistance=0.85, colors=COLORS)
+        vals = E[i].tolist()
+        # Native ring (inner radius 0.65) instead of a white circle drawn over a full pie
+        ax.pie(vals, labels=None, autopct=autopct_format, startangle=90, pctdistance=0.85, colors=COLORS,
+               wedgeprops=dict(width=0.35))
         ax.set_title(clean_diet_label(name), fontsize=12, fontweight='bold')
-        ax.add_artist(plt.Circle((0,0),0.65,fc='white'))
         total_t = sum(vals)
         ax.text(0, 0, f"{int(total_t/1000)}k\\nTonnes\\n(1+2+3)", ha='center', va='center', fontsize=9, fontweight='bold')
     
@@ -3569,22 +3883,16 @@ def run_full_analysis():
     fig8.legend(CAT_ORDER, loc='lower center', ncol=8, frameon=True, 
             bbox_to_anchor=(0.5, -0.02), fontsize=9, edgecolor='black')
     plt.suptitle('Total Emissions (Scope 1+2+3) by Category', fontsize=16, fontweight='bold', y=0.98)
-    plt.savefig(os.path.join(core_dir, '8_All_Total_Emissions_Donuts.png'), dpi=150, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '8_All_Total_Emissions_Donuts.png'), dpi=150, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '8_All_Total_Emissions_Donuts.png'),
+                  os.path.join(appendix_dir, '8_All_Total_Emissions_Donuts.png'), dpi=150)
     # CSV export for Chart 8 (total emissions by category per diet)
-    total_rows = []
-    for diet_name, cat_map in results_total.items():
-        for cat, val in cat_map.items():
-            total_rows.append({'Diet': clean_diet_label(diet_name), 'Category': cat,
-                            'Total_emissions_tonnes_per_year': val})
-    pd.DataFrame(total_rows).to_csv(os.path.join(data_dir, '8_Total_Emissions_by_Category_all.csv'), index=False)
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in diet_keys], len(CAT_ORDER)),
+                  'Category': np.tile(CAT_ORDER, len(diet_keys)),
+                  'Total_emissions_tonnes_per_year': E.ravel()}).to_csv(os.path.join(data_dir, '8_Total_Emissions_by_Category_all.csv'), index=False)
     plt.close()
 
     print("\nScope 1+2 vs Scope 3 vs Total Summary (Tonnes CO2e/Year):")
-    for diet in df_compare.index:
-        s12 = df_compare.loc[diet, 'Scope 1+2']
-        s3 = df_compare.loc[diet, 'Scope 3']
-        total = df_compare.loc[diet, 'Total']
+    for diet, s12, s3, total in zip(diet_keys, total_S12, total_S3, df_compare['Total'].to_numpy()):
         s3_share = (s3 / total * 100.0) if total > 0 else 0.0
         s12_share = (s12 / total * 100.0) if total > 0 else 0.0
         print(f"- {diet}: S1+2={s12:,.0f} ({s12_share:.1f}%), S3={s3:,.0f} ({s3_share:.1f}%), Total={total:,.0f}")
@@ -3617,10 +3925,8 @@ def run_full_analysis():
         fig = plt.figure(figsize=(16, 12))
         grid = plt.GridSpec(3, 2, height_ratios=[1, 0.15, 1.2], hspace=0.4, wspace=0.3)
         
-        b_mass = [results_mass[baseline_key][c] for c in CAT_ORDER]
-        g_mass = [results_mass[goal_key][c] for c in CAT_ORDER]
-        b_co2 = [results_co2[baseline_key][c] for c in CAT_ORDER]
-        g_co2 = [results_co2[goal_key][c] for c in CAT_ORDER]
+        b_mass, g_mass = M[diet_pos[baseline_key]].tolist(), M[diet_pos[goal_key]].tolist()
+        b_co2, g_co2 = S3[diet_pos[baseline_key]].tolist(), S3[diet_pos[goal_key]].tolist()
         
         # Helper function to hide small percentages
         def autopct_format(pct):
@@ -3639,7 +3945,6 @@ def run_full_analysis():
         # Legend between pie charts (in middle row spanning both columns)
         ax_legend = fig.add_subplot(grid[1, :])
         ax_legend.axis('off')
-        from matplotlib.patches import Patch
         cat_handles = [Patch(facecolor=COLOR_MAP[c], label=c) for c in CAT_ORDER]
         ax_legend.legend(handles=cat_handles, loc='center', ncol=8, frameon=True,
                         fontsize=9, edgecolor='black', title='Food Categories', title_fontsize=10)
@@ -3713,22 +4018,11 @@ def run_full_analysis():
     # 6. TABLE VISUALIZATION (New Request)
     print("Generating 6_Table_Tonnage.png...")
     # Prepare Dataframe for Table
-    table_data = []
-    short_names = [clean_diet_label(d) for d in diets.keys()]
-    
-    for cat in CAT_ORDER:
-        row = [cat]
-        for d in diets.keys():
-            val = results_co2[d][cat]
-            row.append(f"{val:,.0f}")
-        table_data.append(row)
-    
-    # Add Total Row
-    total_row = ["TOTAL"]
-    for d in diets.keys():
-        t = sum(results_co2[d].values())
-        total_row.append(f"{t:,.0f}")
-    table_data.append(total_row)
+    short_names = [clean_diet_label(d) for d in diet_keys]
+    # Category rows then the TOTAL row; columns follow diet_keys
+    tonnage = np.vstack((S3.T, total_S3))
+    table_data = [[cat] + [f"{val:,.0f}" for val in row]
+                  for cat, row in zip(CAT_ORDER + ['TOTAL'], tonnage.tolist())]
 
     # Create Plot for Table
     fig_table, ax_table = plt.subplots(figsize=(14, 6))
@@ -3750,23 +4044,17 @@ def run_full_analysis():
             cell.set_facecolor('#e0e0e0')
 
     plt.title("Master Scope 3 Tonnage Report (Tonnes CO2e/Year)", fontweight='bold', y=1.05)
-    plt.savefig(os.path.join(core_dir, '6_Table_Tonnage.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '6_Table_Tonnage.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '6_Table_Tonnage.png'),
+                  os.path.join(appendix_dir, '6_Table_Tonnage.png'), dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     # CSV exports for 6_Table_Tonnage
     # Wide format matching displayed table
-    wide_data = {'Category': CAT_ORDER + ['TOTAL']}
-    for diet_key, short_name in zip(diets.keys(), short_names):
-        col_vals = [results_co2[diet_key][cat] for cat in CAT_ORDER]
-        col_vals.append(sum(results_co2[diet_key].values()))
-        wide_data[short_name] = col_vals
-    pd.DataFrame(wide_data).to_csv(os.path.join(data_dir, '6_Table_Tonnage.csv'), index=False)
+    wide_df = pd.DataFrame(tonnage, columns=short_names)
+    wide_df.insert(0, 'Category', CAT_ORDER + ['TOTAL'])
+    wide_df.to_csv(os.path.join(data_dir, '6_Table_Tonnage.csv'), index=False)
     # Long format for analysis
-    long_rows = []
-    for diet_key, short_name in zip(diets.keys(), short_names):
-        for cat in CAT_ORDER:
-            long_rows.append({'Diet': short_name, 'Category': cat, 'Scope3_tonnes_per_year': results_co2[diet_key][cat]})
-        long_rows.append({'Diet': short_name, 'Category': 'TOTAL', 'Scope3_tonnes_per_year': sum(results_co2[diet_key].values())})
-    pd.DataFrame(long_rows).to_csv(os.path.join(data_dir, '6_Table_Tonnage_long.csv'), index=False)
+    pd.DataFrame({'Diet': np.repeat(short_names, len(CAT_ORDER) + 1),
+                  'Category': np.tile(CAT_ORDER + ['TOTAL'], len(short_names)),
+                  'Scope3_tonnes_per_year': tonnage.T.ravel()}).to_csv(os.path.join(data_dir, '6_Table_Tonnage_long.csv'), index=False)
     plt.close()
 
     # ---------------------------------------------------------
@@ -3778,50 +4066,28 @@ def run_full_analysis():
                             '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)',
                             '7. EAT-Lancet (Planetary)', '8. Schijf van 5 (Guideline)', '9. Mediterranean Diet']
     
-    fig9, axes = plt.subplots(3, 3, figsize=(20, 16))
-    axes = axes.flatten()
+    fig9, axes = plt.subplots(3, 3, figsize=(20, 16), layout='constrained')
+    axes = axes.ravel()
     
     for idx, diet_name in enumerate(all_comparison_diets):
         ax = axes[idx]
         # Get Scope 1+2 and Scope 3 data for this diet
-        diet_profile = diets[diet_name]
-        factors = load_impact_factors()
-        scope12_data = results_scope12[diet_name]
-        scope3_data = results_co2[diet_name]
+        d = diet_pos[diet_name]
         
-        # Recalculate ACTUAL category-specific Scope 1+2 vs Scope 3 splits from consumption and impact factors
-        cat_scope12_actual = {cat: 0.0 for cat in CAT_ORDER}
-        cat_scope3_actual = {cat: 0.0 for cat in CAT_ORDER}
+        # ACTUAL category-specific Scope 1+2 vs Scope 3 splits (uncalibrated cradle + grave
+        # engine aggregates; only their ratio is used below)
+        cat_scope12_actual, cat_scope3_actual = actual_scope_split(diet_name)
         
-        for food, grams_per_day in diet_profile.items():
-            if food not in factors.index:
-                continue
-            category = VISUAL_MAPPING.get(food, food)
-            if category not in CAT_ORDER:
-                continue
-            
-            kg_annual = (grams_per_day / 1000) * 365
-            kg_produced = kg_annual * 1.15  # Include waste factor
-            
-            f = factors.loc[food]
-            scope12_impact = (kg_produced + kg_annual) * f['scope12']
-            scope3_impact = (kg_produced + kg_annual) * f['co2']
-            
-            cat_scope12_actual[category] += scope12_impact
-            cat_scope3_actual[category] += scope3_impact
-        
-        # Calculate total emissions per category
-        total_data = {cat: scope12_data[cat] + scope3_data[cat] for cat in CAT_ORDER}
-        
-        # Get top 8 categories by total emissions
-        sorted_cats = sorted(CAT_ORDER, key=lambda c: total_data[c], reverse=True)[:8]
+        # Get top 8 categories by total emissions (stable sort keeps CAT_ORDER for ties)
+        order = np.argsort(-E[d], kind='stable')[:8]
+        sorted_cats = [CAT_ORDER[j] for j in order]
         
         y_pos = np.arange(len(sorted_cats))
         width = 0.7
         
         # Stacked horizontal bars: Scope 1+2 (base) + Scope 3 (on top)
-        scope12_vals = [scope12_data[c] / 1000 for c in sorted_cats]  # Convert to kilotonnes
-        scope3_vals = [scope3_data[c] / 1000 for c in sorted_cats]
+        scope12_vals = S12[d, order] / 1000  # Convert to kilotonnes
+        scope3_vals = S3[d, order] / 1000
         
         bars1 = ax.barh(y_pos, scope12_vals, width, 
                         label='Scope 1+2 (Local)', color='#F39C12', alpha=0.9)
@@ -3831,10 +4097,10 @@ def run_full_analysis():
         ax.set_yticks(y_pos)
         ax.set_yticklabels(sorted_cats, fontsize=9)
         ax.set_xlabel('Emissions (kton CO2e/year)', fontsize=10, fontweight='bold')
-        total_emissions = sum(total_data.values())
-        s12_total = sum([scope12_data[c] for c in CAT_ORDER])
+        total_emissions = total_E[d]
+        s12_total = total_S12[d]
         s12_pct = (s12_total / total_emissions * 100) if total_emissions > 0 else 0
-        ax.set_title(f'{diet_name.split("(")[0].strip()}\nTotal: {total_emissions/1000:,.0f} kton ({s12_pct:.0f}% S1+2)', 
+        ax.set_title(f'{short_diet_name(diet_name)}\nTotal: {total_emissions/1000:,.0f} kton ({s12_pct:.0f}% S1+2)', 
                     fontsize=11, fontweight='bold')
         if idx == 0:
             ax.legend(loc='upper left', fontsize=8, frameon=True)
@@ -3844,7 +4110,7 @@ def run_full_analysis():
         # 1. Category contribution to total (on the right side) - only if >3%
         # 2. ACTUAL Scope 1+2 vs Scope 3 split within category (inside bars) - calculated from impacts
         for i, cat in enumerate(sorted_cats):
-            total = total_data[cat]
+            total = E[d, order[i]]
             cat_contribution_pct = (total / total_emissions * 100) if total_emissions > 0 else 0
             
             # Calculate ACTUAL category-specific scope split from the real impact data
@@ -3870,16 +4136,16 @@ def run_full_analysis():
                 ax.text(scope12_vals[i] + scope3_vals[i]/2, y_pos[i], f'{s3_pct_cat:.0f}%',
                     ha='center', va='center', fontsize=7, fontweight='bold', color='white')
     
-    plt.tight_layout()
-    safe_savefig(os.path.join(core_dir, '9_Scope_Breakdown_by_Category.png'), dpi=200)
-    safe_savefig(os.path.join(appendix_dir, '9_Scope_Breakdown_by_Category.png'), dpi=200)
+    safe_savefig(os.path.join(core_dir, '9_Scope_Breakdown_by_Category.png'), dpi=200, tight=False,
+                 copies=[os.path.join(appendix_dir, '9_Scope_Breakdown_by_Category.png')])
     # CSV export for Chart 9 (scope breakdown by category)
     scope_breakdown_rows = []
     for diet_name in all_comparison_diets:
-        for cat in CAT_ORDER:
-            scope12_val = results_scope12[diet_name][cat]
-            scope3_val = results_co2[diet_name][cat]
-            total_val = scope12_val + scope3_val
+        d = diet_pos[diet_name]
+        for j, cat in enumerate(CAT_ORDER):
+            scope12_val = S12[d, j]
+            scope3_val = S3[d, j]
+            total_val = E[d, j]
             scope_breakdown_rows.append({
                 'Diet': clean_diet_label(diet_name),
                 'Category': cat,
@@ -3891,7 +4157,6 @@ def run_full_analysis():
             })
     pd.DataFrame(scope_breakdown_rows).to_csv(os.path.join(data_dir, '9_Scope_Breakdown_by_Category.csv'), index=False)
     plt.close()
-    gc.collect()
 
     # ---------------------------------------------------------
     # CHART 9B: MONITOR 2024 BASELINE - STANDALONE CATEGORY BREAKDOWN
@@ -3900,47 +4165,22 @@ def run_full_analysis():
     fig9b, ax9b = plt.subplots(1, 1, figsize=(10, 8))
     
     diet_name = '1. Monitor 2024 (Current)'
-    diet_profile = diets[diet_name]
-    factors = load_impact_factors()
-    scope12_data = results_scope12[diet_name]
-    scope3_data = results_co2[diet_name]
+    d = diet_pos[diet_name]
     
-    # Recalculate ACTUAL category-specific Scope 1+2 vs Scope 3 splits from consumption and impact factors
+    # ACTUAL category-specific Scope 1+2 vs Scope 3 splits (uncalibrated engine aggregates)
     # This gives TRUE category ratios, not uniform splits
-    cat_scope12_actual = {cat: 0.0 for cat in CAT_ORDER}
-    cat_scope3_actual = {cat: 0.0 for cat in CAT_ORDER}
-    
-    for food, grams_per_day in diet_profile.items():
-        if food not in factors.index:
-            continue
-        category = VISUAL_MAPPING.get(food, food)
-        if category not in CAT_ORDER:
-            continue
-        
-        # Annual consumption in kg
-        kg_annual = (grams_per_day / 1000) * 365
-        kg_produced = kg_annual * 1.15  # Include waste factor
-        
-        f = factors.loc[food]
-        # Calculate actual impacts for this food
-        scope12_impact = (kg_produced + kg_annual) * f['scope12']  # cradle + grave
-        scope3_impact = (kg_produced + kg_annual) * f['co2']  # cradle + grave
-        
-        cat_scope12_actual[category] += scope12_impact
-        cat_scope3_actual[category] += scope3_impact
-    
-    # Calculate total emissions per category
-    total_data = {cat: scope12_data[cat] + scope3_data[cat] for cat in CAT_ORDER}
+    cat_scope12_actual, cat_scope3_actual = actual_scope_split(diet_name)
     
     # Sort all categories by total emissions (descending)
-    sorted_cats = sorted(CAT_ORDER, key=lambda c: total_data[c], reverse=True)
+    order = np.argsort(-E[d], kind='stable')
+    sorted_cats = [CAT_ORDER[j] for j in order]
     
     y_pos = np.arange(len(sorted_cats))
     width = 0.8
     
     # Stacked horizontal bars: Scope 1+2 (base) + Scope 3 (on top)
-    scope12_vals = [scope12_data[c] / 1000 for c in sorted_cats]  # Convert to kilotonnes
-    scope3_vals = [scope3_data[c] / 1000 for c in sorted_cats]
+    scope12_vals = S12[d, order] / 1000  # Convert to kilotonnes
+    scope3_vals = S3[d, order] / 1000
     
     bars1 = ax9b.barh(y_pos, scope12_vals, width, 
                     label='Scope 1+2 (Local)', color='#F39C12', alpha=0.9, edgecolor='black', linewidth=0.5)
@@ -3951,8 +4191,8 @@ def run_full_analysis():
     ax9b.set_yticklabels(sorted_cats, fontsize=11, fontweight='bold')
     ax9b.set_xlabel('Emissions (kton CO₂e/year)', fontsize=12, fontweight='bold')
     
-    total_emissions = sum(total_data.values())
-    s12_total = sum([scope12_data[c] for c in CAT_ORDER])
+    total_emissions = total_E[d]
+    s12_total = total_S12[d]
     s12_pct = (s12_total / total_emissions * 100) if total_emissions > 0 else 0
     
     ax9b.set_title(f'Monitor 2024 Baseline: Category-Level Emissions Breakdown\nTotal: {total_emissions/1000:,.0f} kton CO₂e/year (Overall Split - Scope 1+2: {s12_pct:.1f}%, Scope 3: {100-s12_pct:.1f}%)', 
@@ -3965,7 +4205,7 @@ def run_full_analysis():
     # 1. Category contribution to total (on the right side) - only if >3%
     # 2. ACTUAL Scope 1+2 vs Scope 3 split within category (inside bars) - calculated from impacts, not uniform
     for i, cat in enumerate(sorted_cats):
-        cat_total = scope12_data[cat] + scope3_data[cat]
+        cat_total = E[d, order[i]]
         cat_contribution_pct = (cat_total / total_emissions * 100) if total_emissions > 0 else 0
         
         # Calculate ACTUAL category-specific scope split from the real impact data
@@ -3992,85 +4232,47 @@ def run_full_analysis():
                 ha='center', va='center', fontsize=8, fontweight='bold', color='white')
     
     plt.tight_layout()
-    safe_savefig(os.path.join(core_dir, '9b_Monitor2024_Category_Breakdown.png'), dpi=300)
+    safe_savefig(os.path.join(core_dir, '9b_Monitor2024_Category_Breakdown.png'), dpi=CORE_DPI)
     plt.close()
-    gc.collect()
 
     # ---------------------------------------------------------
     # CHART 10: MULTI-RESOURCE IMPACT (CO2, LAND, WATER) WITH SCOPE BREAKDOWN
     # ---------------------------------------------------------
     print("Generating 10_Multi_Resource_Impact.png...")
-    FOOD_TYPE_MAP = {
-        'Red Meat': 'Animal',
-        'Poultry': 'Animal',
-        'Fish': 'Animal',
-        'Dairy (Liquid)': 'Dairy',
-        'Dairy (Solid) & Eggs': 'Dairy',
-        'Plant Protein': 'Plant-based',
-        'Veg & Fruit': 'Plant-based',
-        'Staples': 'Plant-based',
-        'Rice': 'Plant-based',
-        'Ultra-Processed': 'Processed',
-        'Beverages & Additions': 'Processed',
-        'Oils (Plant-based)': 'Oils',
-        'Fats (Solid, Animal)': 'Fats',
-        'Condiments': 'Processed'
-    }
-    
     fig10, axes = plt.subplots(3, 3, figsize=(20, 16))
     comparison_diets_9 = ['1. Monitor 2024 (Current)', '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)',
                         '4. Metabolic Balance', '7. EAT-Lancet (Planetary)', '8. Schijf van 5 (Guideline)',
                         '2. Amsterdam Theoretical', '3. Metropolitan (High Risk)', '9. Mediterranean Diet']
+    type_colors_10 = ['#2ECC71', '#E74C3C', '#F39C12', '#95A5A6', '#D4AF37', '#C0504D']  # Per FOOD_TYPES
+    type_pct_10 = {}  # diet -> (FOOD_TYPES x resources) % shares, reused by the CSV export
+    animal_row_10 = FOOD_TYPES.index('Animal')
+    # Type totals for every diet (diets x FOOD_TYPES x [CO2 (Scope 1+2 + Scope 3), Land, Water])
+    type_totals_10 = np.stack((E @ TYPE_ONEHOT, LAND @ TYPE_ONEHOT, WATER @ TYPE_ONEHOT), axis=-1)
     
     for idx, diet_name in enumerate(comparison_diets_9):
         ax = axes[idx // 3, idx % 3]
         
-        # Calculate type totals for CO2 (Scope 1+2 + Scope 3)
-        type_totals_co2 = {'Plant-based': 0, 'Animal': 0, 'Dairy': 0, 'Processed': 0, 'Oils': 0, 'Fats': 0}
-        type_totals_land = {'Plant-based': 0, 'Animal': 0, 'Dairy': 0, 'Processed': 0, 'Oils': 0, 'Fats': 0}
-        type_totals_water = {'Plant-based': 0, 'Animal': 0, 'Dairy': 0, 'Processed': 0, 'Oils': 0, 'Fats': 0}
-        
-        for cat in CAT_ORDER:
-            food_type = FOOD_TYPE_MAP.get(cat, 'Processed')  # Use .get() with fallback
-            # CO2: Scope 1+2 + Scope 3
-            type_totals_co2[food_type] += results_scope12[diet_name][cat] + results_co2[diet_name][cat]
-            type_totals_land[food_type] += results_land[diet_name][cat]
-            type_totals_water[food_type] += results_water[diet_name][cat]
+        # Type totals per resource (rows: FOOD_TYPES, columns: CO2 (Scope 1+2 + Scope 3), Land, Water)
+        type_totals = type_totals_10[diet_pos[diet_name]]
         
-        total_co2 = sum(type_totals_co2.values())
-        total_land = sum(type_totals_land.values())
-        total_water = sum(type_totals_water.values())
+        resource_totals = type_totals.sum(axis=0, keepdims=True)
+        total_co2 = resource_totals[0, 0]
         
-        type_pct_co2 = {k: (v/total_co2*100) if total_co2 > 0 else 0 for k, v in type_totals_co2.items()}
-        type_pct_land = {k: (v/total_land*100) if total_land > 0 else 0 for k, v in type_totals_land.items()}
-        type_pct_water = {k: (v/total_water*100) if total_water > 0 else 0 for k, v in type_totals_water.items()}
+        # Percent share per resource in one call; resources with a zero total stay at 0%
+        type_pct = type_pct_10[diet_name] = np.divide(type_totals, resource_totals, out=np.zeros_like(type_totals),
+                                                      where=resource_totals > 0) * 100
         
         categories = ['CO₂\n(Scope 1+2+3)', 'Land Use\n(Scope 3)', 'Water\n(Scope 3)']
-        plant_vals = [type_pct_co2['Plant-based'], type_pct_land['Plant-based'], type_pct_water['Plant-based']]
-        animal_vals = [type_pct_co2['Animal'], type_pct_land['Animal'], type_pct_water['Animal']]
-        dairy_vals = [type_pct_co2['Dairy'], type_pct_land['Dairy'], type_pct_water['Dairy']]
-        processed_vals = [type_pct_co2['Processed'], type_pct_land['Processed'], type_pct_water['Processed']]
-        oils_vals = [type_pct_co2['Oils'], type_pct_land['Oils'], type_pct_water['Oils']]
-        fats_vals = [type_pct_co2['Fats'], type_pct_land['Fats'], type_pct_water['Fats']]
         
+        # Stack segments (rows: food type, columns: resource) with cumulative bottoms built once
         x = np.arange(len(categories))
         width = 0.6
-        p1 = ax.bar(x, plant_vals, width, label='Plant-based', color='#2ECC71')
-        p2 = ax.bar(x, animal_vals, width, bottom=plant_vals, label='Animal', color='#E74C3C')
-        p3 = ax.bar(x, dairy_vals, width, bottom=np.array(plant_vals)+np.array(animal_vals), 
-                    label='Dairy', color='#F39C12')
-        p4 = ax.bar(x, processed_vals, width, 
-                    bottom=np.array(plant_vals)+np.array(animal_vals)+np.array(dairy_vals),
-                    label='Processed', color='#95A5A6')
-        p5 = ax.bar(x, oils_vals, width,
-                    bottom=np.array(plant_vals)+np.array(animal_vals)+np.array(dairy_vals)+np.array(processed_vals),
-                    label='Oils', color='#D4AF37')
-        p6 = ax.bar(x, fats_vals, width,
-                    bottom=np.array(plant_vals)+np.array(animal_vals)+np.array(dairy_vals)+np.array(processed_vals)+np.array(oils_vals),
-                    label='Fats', color='#C0504D')
+        bottoms = np.vstack([np.zeros(len(categories)), np.cumsum(type_pct[:-1], axis=0)])
+        type_bars = [ax.bar(x, vals, width, bottom=btm, label=label, color=color)
+                     for vals, btm, label, color in zip(type_pct, bottoms, FOOD_TYPES, type_colors_10)]
         
         ax.set_ylabel('Percentage (%)', fontsize=10, fontweight='bold')
-        ax.set_title(f'{diet_name.split("(")[0].strip()}\nTotal CO2: {total_co2/1000:,.0f} kton', 
+        ax.set_title(f'{short_diet_name(diet_name)}\nTotal CO2: {total_co2/1000:,.0f} kton', 
                     fontsize=11, fontweight='bold')
         ax.set_xticks(x)
         ax.set_xticklabels(categories, fontsize=9)
@@ -4080,150 +4282,22 @@ def run_full_analysis():
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         
         # Add percentage labels for significant segments
-        for i, rect in enumerate(p2):  # Animal products (usually largest)
+        for i, rect in enumerate(type_bars[animal_row_10]):  # Animal products (usually largest)
             height = rect.get_height()
-            bottom = plant_vals[i]
+            bottom = bottoms[animal_row_10, i]
             if height > 8:
                 ax.text(rect.get_x() + rect.get_width()/2., bottom + height/2,
                     f'{height:.0f}%', ha='center', va='center', fontsize=8, fontweight='bold', color='white')
     
     plt.tight_layout()
-    safe_savefig(os.path.join(core_dir, '10_Multi_Resource_Impact.png'), dpi=200)
-    safe_savefig(os.path.join(appendix_dir, '10_Multi_Resource_Impact.png'), dpi=200)
+    safe_savefig(os.path.join(core_dir, '10_Multi_Resource_Impact.png'), dpi=200,
+                 copies=[os.path.join(appendix_dir, '10_Multi_Resource_Impact.png')])
     # CSV export for Chart 10 (multi-resource impact by food type)
-    multi_resource_rows = []
-    for diet_name in comparison_diets_9:
-        type_totals_co2 = {'Plant-based': 0, 'Animal': 0, 'Dairy': 0, 'Processed': 0, 'Oils': 0, 'Fats': 0}
-        type_totals_land = {'Plant-based': 0, 'Animal': 0, 'Dairy': 0, 'Processed': 0, 'Oils': 0, 'Fats': 0}
-        type_totals_water = {'Plant-based': 0, 'Animal': 0, 'Dairy': 0, 'Processed': 0, 'Oils': 0, 'Fats': 0}
-        for cat in CAT_ORDER:
-            food_type = FOOD_TYPE_MAP.get(cat, 'Processed')
-            type_totals_co2[food_type] += results_scope12[diet_name][cat] + results_co2[diet_name][cat]
-            type_totals_land[food_type] += results_land[diet_name][cat]
-            type_totals_water[food_type] += results_water[diet_name][cat]
-        total_co2 = sum(type_totals_co2.values())
-        total_land = sum(type_totals_land.values())
-        total_water = sum(type_totals_water.values())
-        for food_type in type_totals_co2.keys():
-            multi_resource_rows.append({
-                'Diet': clean_diet_label(diet_name),
-                'Food_Type': food_type,
-                'CO2_pct': (type_totals_co2[food_type] / total_co2 * 100) if total_co2 else 0,
-                'Land_pct': (type_totals_land[food_type] / total_land * 100) if total_land else 0,
-                'Water_pct': (type_totals_water[food_type] / total_water * 100) if total_water else 0
-            })
-    pd.DataFrame(multi_resource_rows).to_csv(os.path.join(data_dir, '10_Multi_Resource_Impact.csv'), index=False)
-    plt.close()
-    gc.collect()
-
-    # ---------------------------------------------------------
-    # CHART 11: TOTAL EMISSIONS (SCOPE 1+2+3) VS PROTEIN CONTRIBUTION (All 9 Diets)
-    # ---------------------------------------------------------
-    print("Generating 11_Emissions_vs_Protein.png...")
-    
-    # Protein content from NEVO 2025 database (fraction: g protein / g food)
-    # Source: NEVO 2025 v9.0 - Nederlandse Voedingsmiddelentabel
-    # Mapped to 14 visualization categories using median values from 2,328 products
-    # Extraction date: January 2026
-    PROTEIN_CONTENT = {
-        'Red Meat': 0.198,              # Median of beef (22.4%), pork (19.8%), lamb (19.3%)
-        'Poultry': 0.144,               # Median from 53 chicken products
-        'Fish': 0.200,                  # Median from 33 fish products
-        'Dairy (Liquid)': 0.038,        # Median from 148 milk/yogurt products
-        'Dairy (Solid) & Eggs': 0.121,  # Median from 179 cheese/egg products
-        'Plant Protein': 0.092,         # Median from 168 pulses/nuts/meat substitutes
-        'Staples': 0.079,               # Median from 290 bread/pasta/grains/potatoes
-        'Rice': 0.061,                  # Median from 49 rice products
-        'Veg & Fruit': 0.012,           # Median from 274 vegetable/fruit products
-        'Ultra-Processed': 0.033,       # Median from 139 sugar/snacks products
-        'Beverages & Additions': 0.025, # Median from 80 coffee/tea/alcohol products
-        'Oils (Plant-based)': 0.020,    # Median from 197 oil products
-        'Fats (Solid, Animal)': 0.040,  # Median from 47 butter/fat products
-        'Condiments': 0.063             # Median from 253 sauce/spice products
-    }
-    
-    fig11, axes = plt.subplots(3, 3, figsize=(22, 18))
-    axes = axes.flatten()
-    all_comparison_diets_11 = ['1. Monitor 2024 (Current)', '2. Amsterdam Theoretical',
-                            '3. Metropolitan (High Risk)', '4. Metabolic Balance',
-                            '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)',
-                            '7. EAT-Lancet (Planetary)', '8. Schijf van 5 (Guideline)', '9. Mediterranean Diet']
-    
-    for idx, diet_name in enumerate(all_comparison_diets_11):
-        ax = axes[idx]
-        mass_data = results_mass[diet_name]
-        
-        # Total emissions = Scope 1+2 + Scope 3
-        total_emissions = {cat: results_scope12[diet_name][cat] + results_co2[diet_name][cat] 
-                        for cat in CAT_ORDER}
-        
-        total_mass = sum(mass_data.values())
-        total_emission = sum(total_emissions.values())
-        
-        # Calculate protein contribution
-        protein_data = {cat: mass_data.get(cat, 0) * PROTEIN_CONTENT.get(cat, 0) for cat in CAT_ORDER}
-        total_protein = sum(protein_data.values())
-        
-        # Calculate percentages
-        emission_pct = {cat: (total_emissions[cat] / total_emission * 100) for cat in CAT_ORDER}
-        protein_pct = {cat: (protein_data[cat] / total_protein * 100) for cat in CAT_ORDER}
-        
-        sorted_cats = sorted(CAT_ORDER, key=lambda c: emission_pct[c], reverse=True)
-        y_pos = np.arange(len(sorted_cats))
-        width = 0.35
-        
-        bars1 = ax.barh(y_pos - width/2, [emission_pct[c] for c in sorted_cats], width,
-                        label='Share in total emissions (Scope 1+2+3)', color='#E74C3C', alpha=0.9)
-        bars2 = ax.barh(y_pos + width/2, [protein_pct[c] for c in sorted_cats], width,
-                        label='Share in protein intake', color='#2ECC71', alpha=0.9)
-        
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(sorted_cats, fontsize=9)
-        ax.set_xlabel('Percentage (%)', fontsize=10, fontweight='bold')
-        ax.set_title(f'{diet_name.split("(")[0].strip()}\nTotal: {total_emission/1000:,.0f} kton CO2e', 
-                    fontsize=11, fontweight='bold')
-        if idx == 0:
-            ax.legend(loc='lower right', fontsize=8)
-        ax.grid(axis='x', alpha=0.3, linestyle='--')
-        ax.axvline(x=0, color='black', linewidth=0.8)
-        
-        # Calculate plant vs animal protein
-        plant_protein = sum([protein_data.get(c, 0) for c in ['Plant Protein', 'Staples', 'Rice', 'Veg & Fruit']])
-        animal_protein = sum([protein_data.get(c, 0) for c in ['Red Meat', 'Poultry', 'Fish', 'Dairy (Liquid)', 'Dairy (Solid) & Eggs']])
-        plant_pct_total = plant_protein / (plant_protein + animal_protein) * 100 if (plant_protein + animal_protein) > 0 else 0
-        
-        # Add efficiency indicator
-        ax.text(0.98, 0.98, f'Plant: {plant_pct_total:.0f}%\nAnimal: {100-plant_pct_total:.0f}%',
-            transform=ax.transAxes, ha='right', va='top', fontsize=9, 
-            bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
-    
-    plt.tight_layout()
-    # Save Chart 11 with error handling for matplotlib rendering issues
-    try:
-        safe_savefig(os.path.join(core_dir, '11_Emissions_vs_Protein.png'), dpi=200)
-        safe_savefig(os.path.join(appendix_dir, '11_Emissions_vs_Protein.png'), dpi=200)
-    except Exception as e:
-        print(f"[WARNING] Chart 11 rendering error (likely matplotlib font issue): {str(e)[:100]}. Skipping this chart.")
-        plt.close()
-    
-    # CSV export for Chart 11 (emissions vs protein)
-    protein_rows = []
-    for diet_name in all_comparison_diets_11:
-        mass_data = results_mass[diet_name]
-        total_emissions = {cat: results_scope12[diet_name][cat] + results_co2[diet_name][cat] for cat in CAT_ORDER}
-        total_emission = sum(total_emissions.values())
-        protein_data = {cat: mass_data.get(cat, 0) * PROTEIN_CONTENT.get(cat, 0) for cat in CAT_ORDER}
-        total_protein = sum(protein_data.values())
-        for cat in CAT_ORDER:
-            emission_pct = (total_emissions[cat] / total_emission * 100) if total_emission else 0
-            protein_pct = (protein_data[cat] / total_protein * 100) if total_protein else 0
-            protein_rows.append({
-                'Diet': clean_diet_label(diet_name),
-                'Category': cat,
-                'Emissions_share_pct': emission_pct,
-                'Protein_share_pct': protein_pct
-            })
-    pd.DataFrame(protein_rows).to_csv(os.path.join(data_dir, '11_Emissions_vs_Protein.csv'), index=False)
+    type_pct_rows = np.vstack([type_pct_10[diet_name] for diet_name in comparison_diets_9])
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in comparison_diets_9], len(FOOD_TYPES)),
+                  'Food_Type': np.tile(FOOD_TYPES, len(comparison_diets_9)),
+                  'CO2_pct': type_pct_rows[:, 0], 'Land_pct': type_pct_rows[:, 1],
+                  'Water_pct': type_pct_rows[:, 2]}).to_csv(os.path.join(data_dir, '10_Multi_Resource_Impact.csv'), index=False)
     plt.close()
 
     # ---------------------------------------------------------
@@ -4245,29 +4319,28 @@ def run_full_analysis():
     goal_titles = ['Schijf van 5', 'Dutch Goal 60:40', 'Amsterdam Goal 70:30', 'EAT-Lancet']
     diet_labels = ['Monitor', 'Mediterranean', 'Municipal', 'Metabolic']
     diet_colors = TOL4
-    resource_map = {
-        'CO2 (Scope 1+2+3)': lambda d: sum((results_scope12[d][c] + results_co2[d][c]) for c in CAT_ORDER),
-        'Land (m²)': lambda d: sum(results_land.get(d, {}).values()),
-        'Water (L)': lambda d: sum(results_water.get(d, {}).values())
-    }
+    resource_names = ['CO2 (Scope 1+2+3)', 'Land (m²)', 'Water (L)']
+    resource_totals = np.column_stack((total_E, total_LAND, total_WATER))  # diet_keys x resource
+    comparison_rows = [diet_pos[diet] for diet in comparison_diets]
+    goal_rows = [diet_pos[ref] for ref in goal_refs]
+    # % change vs goal for every (diet, goal, resource) in one broadcast (0% where a goal total is 0)
+    diet_res = resource_totals[comparison_rows][:, None, :]  # diet x 1 x resource
+    goal_res = resource_totals[goal_rows][None, :, :]        # 1 x goal x resource
+    pct_vs_goal_12 = np.divide(diet_res - goal_res, goal_res,
+                               out=np.zeros((len(comparison_rows), len(goal_rows), len(resource_names))),
+                               where=goal_res != 0) * 100
 
     fig12, axes = plt.subplots(3, 4, figsize=(22, 12), sharey=True)
     axes = axes.reshape(3, 4)
 
-    for col, (ref_key, ref_title) in enumerate(zip(goal_refs, goal_titles)):
-        ref_values = {name: fn(ref_key) for name, fn in resource_map.items()}
-        for row, (res_name, fn) in enumerate(resource_map.items()):
+    for col, ref_title in enumerate(goal_titles):
+        for row, res_name in enumerate(resource_names):
             ax = axes[row, col]
-            pct_changes = []
-            for diet in comparison_diets:
-                ref_val = ref_values[res_name]
-                diet_val = fn(diet)
-                change = ((diet_val - ref_val) / ref_val * 100) if ref_val else 0.0
-                pct_changes.append(change)
+            pct_changes = pct_vs_goal_12[:, col, row]
             ax.bar(np.arange(len(comparison_diets)), pct_changes, color=diet_colors, alpha=0.85)
             if row == 0:
                 ax.set_title(ref_title, fontsize=12, fontweight='bold')
-            if row == len(resource_map) - 1:
+            if row == len(resource_names) - 1:
                 ax.set_xticks(np.arange(len(comparison_diets)))
                 ax.set_xticklabels(diet_labels, rotation=20, fontsize=10)
             else:
@@ -4285,23 +4358,14 @@ def run_full_analysis():
         plt.tight_layout(rect=[0, 0.03, 1, 1])
     except:
         plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '12_Diets_vs_Goals_MultiResource.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '12_Diets_vs_Goals_MultiResource.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '12_Diets_vs_Goals_MultiResource.png'),
+                  os.path.join(appendix_dir, '12_Diets_vs_Goals_MultiResource.png'), dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     # CSV export for Chart 12 (multi-resource gap)
-    multiresource_gap_rows = []
-    for diet in comparison_diets:
-        for ref_key, ref_title in zip(goal_refs, goal_titles):
-            for res_name, fn in resource_map.items():
-                ref_val = fn(ref_key)
-                diet_val = fn(diet)
-                pct_change = ((diet_val - ref_val) / ref_val * 100) if ref_val else 0.0
-                multiresource_gap_rows.append({
-                    'Diet': clean_diet_label(diet),
-                    'Goal_Reference': ref_title,
-                    'Resource': res_name,
-                    'Pct_vs_goal': pct_change
-                })
-    pd.DataFrame(multiresource_gap_rows).to_csv(os.path.join(data_dir, '12_Diets_vs_Goals_MultiResource.csv'), index=False)
+    n_goals_12, n_res_12 = len(goal_titles), len(resource_names)
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in comparison_diets], n_goals_12 * n_res_12),
+                  'Goal_Reference': np.tile(np.repeat(goal_titles, n_res_12), len(comparison_diets)),
+                  'Resource': np.tile(resource_names, len(comparison_diets) * n_goals_12),
+                  'Pct_vs_goal': pct_vs_goal_12.ravel()}).to_csv(os.path.join(data_dir, '12_Diets_vs_Goals_MultiResource.csv'), index=False)
     plt.close()
 
     # ---------------------------------------------------------
@@ -4312,24 +4376,22 @@ def run_full_analysis():
     ref_keys = goal_refs
     ref_titles = goal_titles
     fig12b, axes = plt.subplots(1, 4, figsize=(22, 7), sharey=True)
-    total_emissions_map = {
-        diet: sum((results_scope12[diet][c] + results_co2[diet][c]) for c in CAT_ORDER)
-        for diet in comparison_diets + ref_keys
-    }
+    # Total emissions as % of each reference, goals x diets (0% where a reference total is 0)
+    ref_totals_12b = total_E[goal_rows]
+    diet_totals_12b = total_E[comparison_rows]
+    pct_of_ref_12b = np.divide(diet_totals_12b[None, :], ref_totals_12b[:, None],
+                               out=np.zeros((len(ref_keys), len(comparison_diets))),
+                               where=ref_totals_12b[:, None] != 0) * 100
 
     # overall title/subtitle
     fig12b.suptitle('Total Food System Emissions vs Goal References', fontsize=16, fontweight='bold', y=1.02)
     fig12b.text(0.5, 0.98, 'Percent of reference (Scope 1+2+3)', ha='center', fontsize=12)
 
     per_goal_panels = []
-    for col, (ref_key, ref_title) in enumerate(zip(ref_keys, ref_titles)):
+    for col, ref_title in enumerate(ref_titles):
         ax = axes[col]
-        ref_val = total_emissions_map.get(ref_key, 0)
-        pct_vals = []
-        for diet in comparison_diets:
-            diet_val = total_emissions_map.get(diet, 0)
-            pct = (diet_val / ref_val * 100) if ref_val else 0.0
-            pct_vals.append(pct)
+        ref_val = ref_totals_12b[col]
+        pct_vals = pct_of_ref_12b[col].tolist()
         bars = ax.bar(np.arange(len(comparison_diets)), pct_vals, color=diet_colors, alpha=0.9)
         ax.axhline(100, color='black', linewidth=1.2, linestyle='--')
         ax.set_title(ref_title, fontsize=12, fontweight='bold', pad=10)
@@ -4340,9 +4402,7 @@ def run_full_analysis():
             ax.set_ylabel('Total emissions vs reference (%)', fontsize=11, fontweight='bold')
         ax.set_ylim(0, max(pct_vals + [140]))
         # add value labels
-        for rect, val in zip(bars, pct_vals):
-            ax.text(rect.get_x() + rect.get_width()/2, rect.get_height() + 2, f'{val:.0f}%',
-                    ha='center', va='bottom', fontsize=9)
+        ax.bar_label(bars, labels=[f'{val:.0f}%' for val in pct_vals], padding=3, fontsize=9)
         # annotate reference absolute kton
         ax.text(0.02, 0.95, f'Ref: {ref_val/1000:.1f} kton', transform=ax.transAxes,
                 ha='left', va='top', fontsize=9, bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
@@ -4356,32 +4416,18 @@ def run_full_analysis():
         plt.tight_layout(rect=[0, 0.06, 1, 0.95])
     except:
         plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '12b_Emissions_vs_Reference_MultiGoal.png'), dpi=150, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '12b_Emissions_vs_Reference_MultiGoal.png'), dpi=150, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '12b_Emissions_vs_Reference_MultiGoal.png'),
+                  os.path.join(appendix_dir, '12b_Emissions_vs_Reference_MultiGoal.png'), dpi=150)
     # CSV export for Chart 12b (total emissions vs goals)
-    emissions_vs_ref_rows = []
-    for diet in comparison_diets:
-        for ref_key, ref_title in zip(ref_keys, ref_titles):
-            ref_val = total_emissions_map.get(ref_key, 0)
-            diet_val = total_emissions_map.get(diet, 0)
-            pct = (diet_val / ref_val * 100) if ref_val else 0.0
-            emissions_vs_ref_rows.append({
-                'Diet': clean_diet_label(diet),
-                'Goal_Reference': ref_title,
-                'Total_emissions_pct_of_goal': pct,
-                'Goal_total_tonnes_per_year': ref_val,
-                'Diet_total_tonnes_per_year': diet_val
-            })
-    pd.DataFrame(emissions_vs_ref_rows).to_csv(os.path.join(data_dir, '12b_Emissions_vs_Reference_MultiGoal.csv'), index=False)
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in comparison_diets], len(ref_keys)),
+                  'Goal_Reference': np.tile(ref_titles, len(comparison_diets)),
+                  'Total_emissions_pct_of_goal': pct_of_ref_12b.T.ravel(),
+                  'Goal_total_tonnes_per_year': np.tile(ref_totals_12b, len(comparison_diets)),
+                  'Diet_total_tonnes_per_year': np.repeat(diet_totals_12b, len(ref_keys))}).to_csv(os.path.join(data_dir, '12b_Emissions_vs_Reference_MultiGoal.csv'), index=False)
     plt.close()
 
-    # Per-goal single panels for clarity
-    for ref_key, ref_title in zip(ref_keys, ref_titles):
-        ref_val = total_emissions_map.get(ref_key, 0)
-        pct_vals = []
-        for diet in comparison_diets:
-            diet_val = total_emissions_map.get(diet, 0)
-            pct_vals.append((diet_val / ref_val * 100) if ref_val else 0.0)
+    # Per-goal single panels for clarity (same percentages as the combined panels above)
+    for ref_title, pct_vals, ref_val in per_goal_panels:
         fig_single, ax_single = plt.subplots(figsize=(6, 5))
         bars = ax_single.bar(np.arange(len(comparison_diets)), pct_vals, color=diet_colors, alpha=0.9)
         ax_single.axhline(100, color='black', linewidth=1.2, linestyle='--', label=f'{ref_title} (100%)')
@@ -4391,9 +4437,7 @@ def run_full_analysis():
         ax_single.set_ylabel('% of reference', fontsize=11, fontweight='bold')
         ax_single.grid(axis='y', linestyle='--', alpha=0.4)
         ax_single.set_ylim(0, max(pct_vals + [140]))
-        for rect, val in zip(bars, pct_vals):
-            ax_single.text(rect.get_x() + rect.get_width()/2, rect.get_height() + 2, f'{val:.0f}%',
-                        ha='center', va='bottom', fontsize=9)
+        ax_single.bar_label(bars, labels=[f'{val:.0f}%' for val in pct_vals], padding=3, fontsize=9)
         ax_single.legend(loc='upper left', fontsize=9, frameon=True)
         ax_single.text(0.02, 0.94, f'Ref total: {ref_val/1000:.1f} kton', transform=ax_single.transAxes,
                         ha='left', va='top', fontsize=9, bbox=dict(boxstyle='round', facecolor='white', alpha=0.85))
@@ -4401,8 +4445,8 @@ def run_full_analysis():
         # Sanitize filename: remove invalid Windows characters (: \ / * ? " < > |) and parentheses
         safe_title = ref_title.replace(' ', '_').replace(':', '').replace('(', '').replace(')', '').replace('/', '_')
         # Save per-goal panels inside core and appendix folders
-        safe_savefig(os.path.join(core_dir, f'12b_Emissions_vs_{safe_title}.png'), dpi=150)
-        safe_savefig(os.path.join(appendix_dir, f'12b_Emissions_vs_{safe_title}.png'), dpi=150)
+        safe_savefig(os.path.join(core_dir, f'12b_Emissions_vs_{safe_title}.png'), dpi=150,
+                     copies=[os.path.join(appendix_dir, f'12b_Emissions_vs_{safe_title}.png')])
         plt.close(fig_single)
 
     # ---------------------------------------------------------
@@ -4414,10 +4458,11 @@ def run_full_analysis():
     monitor_diet = '1. Monitor 2024 (Current)'
     
     # Calculate totals
-    total_scope12 = sum(results_scope12[monitor_diet].values())
-    total_scope3 = sum(results_co2[monitor_diet].values())
-    total_land = sum(results_land[monitor_diet].values())
-    total_water = sum(results_water[monitor_diet].values())
+    monitor_row = diet_pos[monitor_diet]
+    total_scope12 = total_S12[monitor_row]
+    total_scope3 = total_S3[monitor_row]
+    total_land = total_LAND[monitor_row]
+    total_water = total_WATER[monitor_row]
 
     # Calibrate Scope 1+2 display to target 1750 kton (Monitor baseline expectation)
     scope12_target_kton = 1750
@@ -4462,10 +4507,7 @@ def run_full_analysis():
         '7. EAT-Lancet (Planetary)'
     ]
     goal_titles_inf = ['Schijf van 5', 'Dutch Goal 60:40', 'Amsterdam Goal 70:30', 'EAT-Lancet']
-    goal_totals_inf = {
-        ref: sum((results_scope12[ref][c] + results_co2[ref][c]) for c in CAT_ORDER)
-        for ref in goal_refs_inf
-    }
+    goal_totals_inf = {ref: total_E[diet_pos[ref]] for ref in goal_refs_inf}
     goal_lines = []
     for ref, title in zip(goal_refs_inf, goal_titles_inf):
         ref_total = goal_totals_inf.get(ref, 0)
@@ -4501,10 +4543,7 @@ def run_full_analysis():
     ax2.set_title('Scope 1+2 Components\n(Production + Retail + Waste)', fontsize=13, fontweight='bold')
     ax2.grid(axis='x', alpha=0.3)
     
-    for i, (bar, pct) in enumerate(zip(bars, breakdown_pcts)):
-        width = bar.get_width()
-        ax2.text(width, bar.get_y() + bar.get_height()/2, 
-                f' {pct:.1f}%', ha='left', va='center', fontsize=10, fontweight='bold')
+    ax2.bar_label(bars, labels=[f' {pct:.1f}%' for pct in breakdown_pcts], fontsize=10, fontweight='bold')
     
     # --- PANEL 3: Resource comparison ---
     ax3 = fig.add_subplot(gs[1, 1])
@@ -4517,26 +4556,25 @@ def run_full_analysis():
     ax3.set_title('Multi-Resource Footprint', fontsize=13, fontweight='bold')
     ax3.grid(axis='y', alpha=0.3)
     
-    for bar, val in zip(bars_res, resource_vals):
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2, height, 
-                f'{val:.1f}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax3.bar_label(bars_res, labels=[f'{val:.1f}' for val in resource_vals], fontsize=11, fontweight='bold')
     
     # --- PANEL 4: Food category emissions (top contributors) ---
     ax4 = fig.add_subplot(gs[2, :])
     
-    # Get total emissions by category
-    cat_emissions = {cat: results_scope12[monitor_diet][cat] + results_co2[monitor_diet][cat] 
-                    for cat in CAT_ORDER}
-    sorted_cats_top = sorted(CAT_ORDER, key=lambda c: cat_emissions[c], reverse=True)[:6]
-    mass_data_monitor = results_mass.get(monitor_diet, {})
-    total_mass_monitor = sum(mass_data_monitor.values()) if mass_data_monitor else 0
+    # Top 6 categories by total emissions, with their shares computed once (reused by the CSV export)
+    m = diet_pos[monitor_diet]
+    top_idx = np.argsort(-E[m], kind='stable')[:6]
+    sorted_cats_top = [CAT_ORDER[j] for j in top_idx]
+    total_mass_monitor = total_mass_arr[m]
+    mass_pcts_top = M[m, top_idx] / total_mass_monitor * 100 if total_mass_monitor else np.zeros(len(top_idx))
+    scope3_pcts_top = S3[m, top_idx] / total_scope3 * 100 if total_scope3 else np.zeros(len(top_idx))
     
     y_pos = np.arange(len(sorted_cats_top))
     # Values already scaled, just convert to kton
-    scope12_vals = [results_scope12[monitor_diet][c] / 1000 for c in sorted_cats_top]
-    scope3_vals = [results_co2[monitor_diet][c]/1000 for c in sorted_cats_top]
-    max_total = max((s1 + s3) for s1, s3 in zip(scope12_vals, scope3_vals)) if scope12_vals else 0
+    scope12_vals = S12[m, top_idx] / 1000
+    scope3_vals = S3[m, top_idx] / 1000
+    totals_top = scope12_vals + scope3_vals
+    max_total = totals_top.max() if len(totals_top) else 0
     label_offset = max_total * 0.04 if max_total else 5
     
     bars1 = ax4.barh(y_pos, scope12_vals, height=0.6, label='Scope 1+2', color='#F39C12', alpha=0.9)
@@ -4550,17 +4588,16 @@ def run_full_analysis():
     ax4.legend(loc='lower right', fontsize=10)
     ax4.grid(axis='x', alpha=0.3)
     
-    # Add total labels
-    for i, cat in enumerate(sorted_cats_top):
-        total = scope12_vals[i] + scope3_vals[i]
-        mass_pct = (mass_data_monitor.get(cat, 0) / total_mass_monitor * 100) if total_mass_monitor else 0
-        scope3_pct = (results_co2[monitor_diet][cat] / total_scope3 * 100) if total_scope3 else 0
-        ax4.text(total + label_offset, y_pos[i], f'{total:,.0f} kton', 
-            ha='left', va='center', fontsize=9, fontweight='bold')
-        ax4.text(total + label_offset * 3, y_pos[i], f'Mass {mass_pct:.0f}% | S3 {scope3_pct:.0f}%',
-            ha='left', va='center', fontsize=9, color='gray')
-    
-    safe_savefig(os.path.join(core_dir, '13_Amsterdam_Food_Infographic.png'), dpi=200)
+    # Add total labels, label_offset (data units) past the end of each stacked bar
+    for y, total, mass_pct, scope3_pct in zip(y_pos, totals_top, mass_pcts_top, scope3_pcts_top):
+        ax4.text(total + label_offset, y, f'{total:,.0f} kton',
+                 ha='left', va='center', fontsize=9, fontweight='bold')
+        ax4.text(total + label_offset * 3, y, f'Mass {mass_pct:.0f}% | S3 {scope3_pct:.0f}%',
+                 ha='left', va='center', fontsize=9, color='gray')
+    
+    # One render for both copies (appendix keeps the archival DPI, core stays at 200)
+    save_and_copy(os.path.join(core_dir, '13_Amsterdam_Food_Infographic.png'),
+                  os.path.join(appendix_dir, '13_Amsterdam_Food_Infographic.png'), fig=fig, dpi=APPENDIX_DPI, core_dpi=200)
     # CSV export for Chart 13 (infographic data blocks)
     infographic_data = {
         'Total_Scope12_tonnes': total_scope12_display,
@@ -4573,244 +4610,192 @@ def run_full_analysis():
         'Total_Water_L': total_water
     }
     pd.DataFrame([infographic_data]).to_csv(os.path.join(data_dir, '13_Infographic_Summary.csv'), index=False)
-    # Top 6 categories details
-    cat_emissions = {cat: results_scope12[monitor_diet][cat] + results_co2[monitor_diet][cat] for cat in CAT_ORDER}
-    sorted_cats_top = sorted(CAT_ORDER, key=lambda c: cat_emissions[c], reverse=True)[:6]
-    mass_data_monitor = results_mass.get(monitor_diet, {})
-    total_mass_monitor = sum(mass_data_monitor.values()) if mass_data_monitor else 0
-    infographic_top6 = []
-    for cat in sorted_cats_top:
-        total_cat = cat_emissions[cat]
-        mass_pct = (mass_data_monitor.get(cat, 0) / total_mass_monitor * 100) if total_mass_monitor else 0
-        scope3_pct = (results_co2[monitor_diet][cat] / total_scope3 * 100) if total_scope3 else 0
-        # Values already scaled
-        scope12_cat = results_scope12[monitor_diet][cat]
-        scope3_cat = results_co2[monitor_diet][cat]
-        infographic_top6.append({
-            'Category': cat,
-            'Scope1+2_kton': scope12_cat / 1000,
-            'Scope3_kton': scope3_cat / 1000,
-            'Total_kton': total_cat / 1000,
-            'Mass_share_pct': mass_pct,
-            'Scope3_share_pct': scope3_pct
-        })
-    pd.DataFrame(infographic_top6).to_csv(os.path.join(data_dir, '13_Infographic_Top6_Categories.csv'), index=False)
-    plt.close()
-    gc.collect()
-    # Save to appendix as well (same data for all versions)
-    try:
-        fig4_copy = ax4.get_figure()
-        fig4_copy.savefig(os.path.join(appendix_dir, '13_Amsterdam_Food_Infographic.png'), dpi=300, bbox_inches='tight')
-        plt.close()
-    except Exception as e:
-        print(f"Warning: Could not save appendix version of Chart 13: {e}")
-        plt.close('all')
+    # Top 6 categories details (same arrays as Panel 4; values already scaled)
+    infographic_top6 = pd.DataFrame({
+        'Category': sorted_cats_top,
+        'Scope1+2_kton': scope12_vals,
+        'Scope3_kton': scope3_vals,
+        'Total_kton': E[m, top_idx] / 1000,
+        'Mass_share_pct': mass_pcts_top,
+        'Scope3_share_pct': scope3_pcts_top
+    })
+    infographic_top6.to_csv(os.path.join(data_dir, '13_Infographic_Top6_Categories.csv'), index=False)
+    plt.close(fig)
 
     # ============================================================================
     # CHART 9: SHARE IN CO2 VS SHARE IN CONSUMPTION
     # ============================================================================
     print("[Chart 9] Generating: CO2 Share vs Mass Share...")
     diet_names = list(results_co2.keys())
-    fig9, axes = plt.subplots(3, 3, figsize=(22, 16))
-    axes = axes.flatten()
-    max_pct_val = 0
+    # Standalone Figure (not registered with pyplot): the 3x3 grids are the heaviest
+    # figures and are only ever saved, never shown
+    fig9 = Figure(figsize=(22, 16))
+    axes = fig9.subplots(3, 3).ravel()
+    # Shared x-limit from the share table up front, so each axis gets its limit once
+    max_pct_val = float(diet_shares.loc[diet_names[:9], ['scope3', 'mass']].to_numpy().max())
+    xlim_9 = max_pct_val * 1.12 if max_pct_val else 100
     
     for idx, diet_name in enumerate(diet_names):
         if idx >= 9: break
         ax = axes[idx]
-        mass_data = results_mass[diet_name]
-        co2_data = results_co2[diet_name]
-        total_mass = sum(mass_data.values())
-        total_co2 = sum(co2_data.values())
-        mass_pct = {cat: (mass_data[cat] / total_mass * 100) for cat in CAT_ORDER}
-        co2_pct = {cat: (co2_data[cat] / total_co2 * 100) for cat in CAT_ORDER}
-        sorted_cats = sorted(CAT_ORDER, key=lambda c: co2_pct[c], reverse=True)
+        ax.set_xlim(0, xlim_9)
+        shares = diet_shares.loc[diet_name].iloc[sort_orders[diet_name]['co2']]
+        sorted_cats = list(shares.index)
         y_pos = np.arange(len(sorted_cats))
         width = 0.35
-        co2_vals = [co2_pct[c] for c in sorted_cats]
-        mass_vals = [mass_pct[c] for c in sorted_cats]
-        max_pct_val = max(max_pct_val, max(co2_vals + mass_vals))
-        ax.barh(y_pos - width/2, co2_vals, width, label='Share in CO₂ emissions', color='#CC3311', alpha=0.8)
-        ax.barh(y_pos + width/2, mass_vals, width, label='Share in consumption (mass)', color='#0077BB', alpha=0.8)
+        co2_vals = shares['scope3'].to_numpy()
+        mass_vals = shares['mass'].to_numpy()
+        handles = paired_barh(ax, y_pos, co2_vals, mass_vals, width, ('#CC3311', '#0077BB'),
+                              ('Share in CO₂ emissions', 'Share in consumption (mass)'))
         ax.set_yticks(y_pos)
         ax.set_yticklabels(sorted_cats, fontsize=10)
         ax.set_xlabel('Percentage (%)', fontsize=11, fontweight='bold')
-        ax.set_title(diet_name.split('(')[0].strip(), fontsize=12, fontweight='bold')
-        ax.legend(loc='upper right', fontsize=9, frameon=True)
+        ax.set_title(short_diet_name(diet_name), fontsize=12, fontweight='bold')
+        ax.legend(handles=handles, loc='upper right', fontsize=9, frameon=True)
         ax.grid(axis='x', alpha=0.3, linestyle='--')
     
     for j in range(len(diet_names), 9): axes[j].axis('off')
-    for ax in axes:
-        ax.set_xlim(0, max_pct_val * 1.12 if max_pct_val else 100)
-    try:
-        plt.tight_layout(rect=[0, 0, 1, 0.97])
-    except:
-        plt.tight_layout()
-    plt.suptitle('Share in CO₂ vs Share in Mass by Food Category (All Diets)', fontsize=14, fontweight='bold', y=0.995)
-    plt.savefig(os.path.join(core_dir, '9_CO2_vs_Mass_Share.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '9_CO2_vs_Mass_Share.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '9_CO2_vs_Mass_Share.png'), dpi=300, bbox_inches='tight')
+    # Fixed 3x3 margins (wspace leaves room for the long category tick labels)
+    fig9.subplots_adjust(left=0.10, right=0.98, top=0.95, bottom=0.05, wspace=0.55, hspace=0.3)
+    fig9.suptitle('Share in CO₂ vs Share in Mass by Food Category (All Diets)', fontsize=14, fontweight='bold', y=0.995)
+    save_and_copy(os.path.join(core_dir, '9_CO2_vs_Mass_Share.png'),
+                  os.path.join(appendix_dir, '9_CO2_vs_Mass_Share.png'), fig=fig9, dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
     # CSV export for Chart 9 second variant (CO2 vs Mass share)
-    co2_mass_share_rows = []
-    for diet_name in diet_names:
-        mass_data = results_mass[diet_name]
-        co2_data = results_co2[diet_name]
-        total_mass = sum(mass_data.values())
-        total_co2 = sum(co2_data.values())
-        for cat in CAT_ORDER:
-            co2_pct = (co2_data[cat] / total_co2 * 100) if total_co2 else 0
-            mass_pct = (mass_data[cat] / total_mass * 100) if total_mass else 0
-            co2_mass_share_rows.append({
-                'Diet': clean_diet_label(diet_name),
-                'Category': cat,
-                'CO2_share_pct': co2_pct,
-                'Mass_share_pct': mass_pct
-            })
-    pd.DataFrame(co2_mass_share_rows).to_csv(os.path.join(data_dir, '9_CO2_vs_Mass_Share.csv'), index=False)
-    plt.close()
+    co2_mass_share = diet_shares.loc[diet_names, ['scope3', 'mass']].reset_index()
+    co2_mass_share.columns = ['Diet', 'Category', 'CO2_share_pct', 'Mass_share_pct']
+    co2_mass_share['Diet'] = co2_mass_share['Diet'].map(clean_diet_label)
+    co2_mass_share.to_csv(os.path.join(data_dir, '9_CO2_vs_Mass_Share.csv'), index=False)
     print("✓ Saved: 9_CO2_vs_Mass_Share.png (core + appendix)")
 
     # ============================================================================
     # CHART 10: ENVIRONMENTAL IMPACT BY FOOD TYPE
     # ============================================================================
     print("[Chart 10] Generating: Impact by Food Type...")
-    FOOD_TYPE_MAP = {
+    FOOD_TYPE_MAP_4 = {
         'Red Meat': 'Animal', 'Poultry': 'Animal', 'Fish': 'Animal',
         'Dairy (Solid) & Eggs': 'Mixed (Dairy/Eggs)', 'Dairy (Liquid)': 'Mixed (Dairy/Eggs)',
         'Plant Protein': 'Plant-based', 'Veg & Fruit': 'Plant-based', 'Staples': 'Plant-based', 'Rice': 'Plant-based',
         'Ultra-Processed': 'Processed', 'Beverages & Additions': 'Processed', 'Fats (Solid, Animal)': 'Animal',
         'Oils (Plant-based)': 'Plant-based', 'Condiments': 'Processed'
     }
+    FOOD_TYPES_4 = ['Plant-based', 'Animal', 'Mixed (Dairy/Eggs)', 'Processed']
+    TYPE_CODE_4 = np.array([FOOD_TYPES_4.index(FOOD_TYPE_MAP_4.get(cat, 'Processed')) for cat in CAT_ORDER])
+    # Scope 3 totals per food type (rows: diet_keys, columns: FOOD_TYPES_4)
+    type_totals_4 = S3 @ np.eye(len(FOOD_TYPES_4))[TYPE_CODE_4]
     fig10, axes = plt.subplots(2, 2, figsize=(16, 12))
-    axes = axes.flatten()
+    axes = axes.ravel()
     comparison_diets_4 = ['1. Monitor 2024 (Current)', '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)', '7. EAT-Lancet (Planetary)']
+    categories = ['Climate\nChange', 'Land Use', 'Water Use']
+    type_colors = ['#117733', '#CC3311', '#EE7733', '#999933']
+    x = np.arange(len(categories))
+    width = 0.6
+    # Food-type shares (rows: diet, columns: FOOD_TYPES_4; 0% for a zero total) and their
+    # stack bottoms for all four panels at once. A share is the same for every resource
+    # column, so each type is one bar call with scalar height/bottom across x.
+    type_rows_4 = type_totals_4[[diet_pos[d] for d in comparison_diets_4]]
+    row_totals_4 = type_rows_4.sum(axis=1, keepdims=True)
+    type_pct_4 = np.divide(type_rows_4, row_totals_4, out=np.zeros_like(type_rows_4),
+                           where=row_totals_4 != 0) * 100
+    bottoms_4 = np.zeros_like(type_pct_4)
+    bottoms_4[:, 1:] = np.cumsum(type_pct_4[:, :-1], axis=1)
     
     for idx, diet_name in enumerate(comparison_diets_4):
         ax = axes[idx]
-        type_totals = {'Plant-based': 0, 'Animal': 0, 'Mixed (Dairy/Eggs)': 0, 'Processed': 0}
-        for cat in CAT_ORDER:
-            food_type = FOOD_TYPE_MAP.get(cat, 'Processed')
-            type_totals[food_type] += results_co2[diet_name][cat]
-        
-        total = sum(type_totals.values())
-        type_pct = {k: (v/total*100) for k, v in type_totals.items()}
-        categories = ['Climate\nChange', 'Land Use', 'Water Use']
-        plant_vals = [type_pct['Plant-based']] * 3
-        animal_vals = [type_pct['Animal']] * 3
-        mixed_vals = [type_pct['Mixed (Dairy/Eggs)']] * 3
-        processed_vals = [type_pct['Processed']] * 3
-        x = np.arange(len(categories))
-        width = 0.6
-        ax.bar(x, plant_vals, width, label='Plant-based', color='#117733')
-        ax.bar(x, animal_vals, width, bottom=plant_vals, label='Animal', color='#CC3311')
-        ax.bar(x, mixed_vals, width, bottom=np.array(plant_vals)+np.array(animal_vals), label='Mixed (Dairy/Eggs)', color='#EE7733')
-        ax.bar(x, processed_vals, width, bottom=np.array(plant_vals)+np.array(animal_vals)+np.array(mixed_vals), label='Processed', color='#999933')
+        for pct, bottom, label, color in zip(type_pct_4[idx], bottoms_4[idx], FOOD_TYPES_4, type_colors):
+            ax.bar(x, pct, width, bottom=bottom, label=label, color=color)
         ax.set_ylabel('Percentage (%)', fontsize=11, fontweight='bold')
-        ax.set_title(diet_name.split('(')[0].strip(), fontsize=12, fontweight='bold')
+        ax.set_title(short_diet_name(diet_name), fontsize=12, fontweight='bold')
         ax.set_xticks(x)
         ax.set_xticklabels(categories, fontsize=10)
-        ax.set_ylim(0, 100)
         ax.legend(loc='upper right', fontsize=9, frameon=True)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         ax.set_ylim(0, 100)
     
-    try:
-        plt.tight_layout(rect=[0, 0, 1, 0.95])
-    except:
-        plt.tight_layout()
+    fig10.subplots_adjust(left=0.06, right=0.97, top=0.93, bottom=0.06, wspace=0.2, hspace=0.25)
     plt.suptitle('Environmental Impact by Food Type (Plant / Animal / Mixed / Processed)', fontsize=14, fontweight='bold', y=0.995)
-    plt.savefig(os.path.join(core_dir, '10_Impact_by_Food_Type.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '10_Impact_by_Food_Type.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '10_Impact_by_Food_Type.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '10_Impact_by_Food_Type.png'),
+                  os.path.join(appendix_dir, '10_Impact_by_Food_Type.png'), dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
     # CSV export for Chart 10 second variant (impact by food type)
-    impact_type_rows = []
-    for diet_name in comparison_diets_4:
-        type_totals = {'Plant-based': 0, 'Animal': 0, 'Mixed (Dairy/Eggs)': 0, 'Processed': 0}
-        for cat in CAT_ORDER:
-            food_type = FOOD_TYPE_MAP.get(cat, 'Processed')
-            type_totals[food_type] += results_co2[diet_name][cat]
-        total = sum(type_totals.values())
-        for food_type, val in type_totals.items():
-            pct = (val / total * 100) if total else 0
-            impact_type_rows.append({
-                'Diet': clean_diet_label(diet_name),
-                'Food_Type': food_type,
-                'CO2_pct': pct
-            })
-    pd.DataFrame(impact_type_rows).to_csv(os.path.join(data_dir, '10_Impact_by_Food_Type.csv'), index=False)
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in comparison_diets_4], len(FOOD_TYPES_4)),
+                  'Food_Type': np.tile(FOOD_TYPES_4, len(comparison_diets_4)),
+                  'CO2_pct': type_pct_4.ravel()}).to_csv(os.path.join(data_dir, '10_Impact_by_Food_Type.csv'), index=False)
     plt.close()
     print("✓ Saved: 10_Impact_by_Food_Type.png (core + appendix)")
 
     # ============================================================================
-    # CHART 11: MASS VS PROTEIN CONTRIBUTION
+    # CHART 11: MASS VS PROTEIN CONTRIBUTION (+ emissions vs protein shares, CSV only)
     # ============================================================================
     print("[Chart 11] Generating: Mass vs Protein...")
-    PROTEIN_CONTENT = {
-        'Red Meat': 0.20, 'Poultry': 0.25, 'Fish': 0.20, 'Dairy (Solid) & Eggs': 0.12, 'Dairy (Liquid)': 0.03,
-        'Plant Protein': 0.20, 'Staples': 0.10, 'Rice': 0.08, 'Veg & Fruit': 0.02, 'Ultra-Processed': 0.05,
-        'Beverages & Additions': 0.01, 'Fats (Solid, Animal)': 0.0, 'Oils (Plant-based)': 0.0, 'Condiments': 0.05
-    }
-    fig11, axes = plt.subplots(3, 3, figsize=(24, 18))
-    axes = axes.flatten()
-    max_pct_11 = 0
+    protein_totals_11 = protein_arr_11.sum(axis=1)
+    # Oils and animal fats carry no protein, so the shared plant/animal masks give the same split
+    plant_totals_11 = protein_arr_11[:, PLANT_MASK].sum(axis=1)
+    animal_totals_11 = protein_arr_11[:, ANIMAL_MASK].sum(axis=1)
+    source_totals_11 = plant_totals_11 + animal_totals_11
+    plant_share_11 = np.divide(plant_totals_11, source_totals_11, out=np.zeros_like(source_totals_11),
+                               where=source_totals_11 > 0) * 100
+    fig11 = Figure(figsize=(24, 18))
+    axes = fig11.subplots(3, 3).ravel()
+    # Share matrices (rows: diet_keys) give the shared x-limit before any subplot is drawn
+    mass_pct_mat = np.divide(M, total_mass_arr[:, None], out=np.zeros_like(M),
+                             where=total_mass_arr[:, None] != 0) * 100
+    protein_pct_mat = np.divide(protein_arr_11, protein_totals_11[:, None], out=np.zeros_like(protein_arr_11),
+                                where=protein_totals_11[:, None] > 0) * 100
+    shown_11 = [diet_pos[diet_name] for diet_name in diet_names[:9]]
+    max_pct_11 = float(np.maximum(mass_pct_mat[shown_11], protein_pct_mat[shown_11]).max())
+    xlim_11 = max_pct_11 * 1.12 if max_pct_11 else 100
     
     for idx, diet_name in enumerate(diet_names):
         if idx >= 9: break
         ax = axes[idx]
-        mass_data = results_mass[diet_name]
-        total_mass = sum(mass_data.values())
-        protein_data = {cat: mass_data.get(cat, 0) * PROTEIN_CONTENT.get(cat, 0) for cat in CAT_ORDER}
-        total_protein = sum(protein_data.values())
-        mass_pct = {cat: (mass_data[cat] / total_mass * 100) for cat in CAT_ORDER}
-        protein_pct = {cat: (protein_data[cat] / total_protein * 100) if total_protein > 0 else 0 for cat in CAT_ORDER}
-        sorted_cats = sorted(CAT_ORDER, key=lambda c: protein_pct[c], reverse=True)
+        ax.set_xlim(0, xlim_11)
+        d = diet_pos[diet_name]
+        mass_pct = mass_pct_mat[d]
+        protein_pct = protein_pct_mat[d]
+        order = sort_orders[diet_name]['protein']
+        sorted_cats = [CAT_ORDER[j] for j in order]
         y_pos = np.arange(len(sorted_cats))
         width = 0.35
-        mass_vals = [mass_pct[c] for c in sorted_cats]
-        protein_vals = [protein_pct[c] for c in sorted_cats]
-        max_pct_11 = max(max_pct_11, max(mass_vals + protein_vals))
-        ax.barh(y_pos - width/2, mass_vals, width, label='Share in consumption (mass)', color='#0077BB', alpha=0.8)
-        ax.barh(y_pos + width/2, protein_vals, width, label='Share in protein intake', color='#009988', alpha=0.8)
+        mass_vals = mass_pct[order]
+        protein_vals = protein_pct[order]
+        handles = paired_barh(ax, y_pos, mass_vals, protein_vals, width, ('#0077BB', '#009988'),
+                              ('Share in consumption (mass)', 'Share in protein intake'))
         ax.set_yticks(y_pos)
         ax.set_yticklabels(sorted_cats, fontsize=10)
         ax.set_xlabel('Percentage (%)', fontsize=11, fontweight='bold')
-        ax.set_title(diet_name.split('(')[0].strip(), fontsize=12, fontweight='bold')
-        ax.legend(loc='lower right', fontsize=9, frameon=True)
+        ax.set_title(short_diet_name(diet_name), fontsize=12, fontweight='bold')
+        ax.legend(handles=handles, loc='lower right', fontsize=9, frameon=True)
         ax.grid(axis='x', alpha=0.3, linestyle='--')
-        plant_protein = sum([protein_data.get(c, 0) for c in ['Plant Protein', 'Staples', 'Rice', 'Veg & Fruit', 'Oils (Plant-based)']])
-        animal_protein = sum([protein_data.get(c, 0) for c in ['Red Meat', 'Poultry', 'Fish', 'Dairy (Solid) & Eggs', 'Dairy (Liquid)', 'Fats (Solid, Animal)']])
-        plant_pct_total = (plant_protein / (plant_protein + animal_protein) * 100) if (plant_protein + animal_protein) > 0 else 0
+        plant_pct_total = plant_share_11[d]
         ax.text(0.98, 0.98, f'Plant: {plant_pct_total:.0f}%\nAnimal: {100-plant_pct_total:.0f}%', transform=ax.transAxes, ha='right', va='top', fontsize=9, bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
     
     for j in range(len(diet_names), 9): axes[j].axis('off')
-    for ax in axes:
-        ax.set_xlim(0, max_pct_11 * 1.12 if max_pct_11 else 100)
-    try:
-        plt.tight_layout(rect=[0, 0, 1, 0.97])
-    except:
-        plt.tight_layout()
-    plt.suptitle('Mass vs Protein Contribution by Food Category (All Diets)', fontsize=14, fontweight='bold', y=0.995)
-    plt.savefig(os.path.join(core_dir, '11_Emissions_vs_Protein.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '11_Emissions_vs_Protein.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '11_Emissions_vs_Protein.png'), dpi=300, bbox_inches='tight')
-    # CSV export for Chart 11 second variant (mass vs protein)
-    mass_protein_rows = []
-    for diet_name in diet_names:
-        mass_data = results_mass[diet_name]
-        total_mass = sum(mass_data.values())
-        protein_data = {cat: mass_data.get(cat, 0) * PROTEIN_CONTENT.get(cat, 0) for cat in CAT_ORDER}
-        total_protein = sum(protein_data.values())
-        for cat in CAT_ORDER:
-            mass_pct = (mass_data[cat] / total_mass * 100) if total_mass else 0
-            protein_pct = (protein_data[cat] / total_protein * 100) if total_protein else 0
-            mass_protein_rows.append({
-                'Diet': clean_diet_label(diet_name),
-                'Category': cat,
-                'Mass_share_pct': mass_pct,
-                'Protein_share_pct': protein_pct
-            })
-    pd.DataFrame(mass_protein_rows).to_csv(os.path.join(data_dir, '11_Mass_vs_Protein.csv'), index=False)
-    plt.close()
+    fig11.subplots_adjust(left=0.10, right=0.98, top=0.95, bottom=0.05, wspace=0.55, hspace=0.3)
+    fig11.suptitle('Mass vs Protein Contribution by Food Category (All Diets)', fontsize=14, fontweight='bold', y=0.995)
+    save_and_copy(os.path.join(core_dir, '11_Emissions_vs_Protein.png'),
+                  os.path.join(appendix_dir, '11_Emissions_vs_Protein.png'), fig=fig11, dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
+    # CSV exports for Chart 11: the mass vs protein shares drawn above, and the emissions vs protein
+    # shares (PROTEIN_CONTENT factors) whose panels used to be drawn to the same PNG and overwritten here
+    rows_11 = [diet_pos[diet_name] for diet_name in diet_names]
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in diet_names], len(CAT_ORDER)),
+                  'Category': np.tile(CAT_ORDER, len(diet_names)),
+                  'Mass_share_pct': mass_pct_mat[rows_11].ravel(),
+                  'Protein_share_pct': protein_pct_mat[rows_11].ravel()}).to_csv(os.path.join(data_dir, '11_Mass_vs_Protein.csv'), index=False)
+    all_comparison_diets_11 = ['1. Monitor 2024 (Current)', '2. Amsterdam Theoretical',
+                            '3. Metropolitan (High Risk)', '4. Metabolic Balance',
+                            '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)',
+                            '7. EAT-Lancet (Planetary)', '8. Schijf van 5 (Guideline)', '9. Mediterranean Diet']
+    rows_11 = [diet_pos[diet_name] for diet_name in all_comparison_diets_11]
+    protein_by_cat_11 = M[rows_11] * PROTEIN_ARR[None, :]
+    protein_tot_11 = protein_by_cat_11.sum(axis=1)
+    emission_tot_11 = total_E[rows_11]
+    emission_pct_11 = np.divide(E[rows_11], emission_tot_11[:, None], out=np.zeros_like(E[rows_11]),
+                                where=emission_tot_11[:, None] != 0) * 100
+    protein_pct_11 = np.divide(protein_by_cat_11, protein_tot_11[:, None], out=np.zeros_like(protein_by_cat_11),
+                               where=protein_tot_11[:, None] != 0) * 100
+    pd.DataFrame({'Diet': np.repeat([clean_diet_label(d) for d in all_comparison_diets_11], len(CAT_ORDER)),
+                  'Category': np.tile(CAT_ORDER, len(all_comparison_diets_11)),
+                  'Emissions_share_pct': emission_pct_11.ravel(),
+                  'Protein_share_pct': protein_pct_11.ravel()}).to_csv(os.path.join(data_dir, '11_Emissions_vs_Protein.csv'), index=False)
     print("✓ Saved: 11_Emissions_vs_Protein.png (core + appendix)")
 
     # ============================================================================
@@ -4820,17 +4805,19 @@ def run_full_analysis():
     reference_diet = '8. Schijf van 5 (Guideline)'
     comparison_diets_ref = ['1. Monitor 2024 (Current)', '3. Metropolitan (High Risk)', '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)', '7. EAT-Lancet (Planetary)']
     fig12, ax = plt.subplots(figsize=(14, 10))
-    ref_mass = results_mass[reference_diet]
-    sorted_cats = sorted(CAT_ORDER, key=lambda c: ref_mass[c], reverse=True)
+    # % of reference intake (rows: comparison_diets_ref, columns: CAT_ORDER); 0 where the reference is 0
+    ref_mass_arr = M[diet_pos[reference_diet]]
+    comp_mass = M[[diet_pos[diet_name] for diet_name in comparison_diets_ref]]
+    pct_of_ref_mat = np.divide(comp_mass, ref_mass_arr, out=np.zeros_like(comp_mass), where=ref_mass_arr > 0) * 100
+    order = sort_orders[reference_diet]['mass']
+    sorted_cats = [CAT_ORDER[j] for j in order]
     y_pos = np.arange(len(sorted_cats))
     width = 0.15
     colors_diets = ['#0077BB', '#CC3311', '#EE7733', '#009988', '#117733']
     
-    for idx, diet_name in enumerate(comparison_diets_ref):
-        diet_mass = results_mass[diet_name]
-        pct_of_ref = [(diet_mass[cat] / ref_mass[cat] * 100) if ref_mass[cat] > 0 else 0 for cat in sorted_cats]
+    for idx, (diet_name, pct_row) in enumerate(zip(comparison_diets_ref, pct_of_ref_mat[:, order])):
         offset = (idx - len(comparison_diets_ref)/2 + 0.5) * width
-        ax.barh(y_pos + offset, pct_of_ref, width, label=diet_name.split('(')[0].strip()[:20], color=colors_diets[idx], alpha=0.8)
+        ax.barh(y_pos + offset, pct_row, width, label=short_diet_name(diet_name)[:20], color=colors_diets[idx], alpha=0.8)
     
     ax.set_yticks(y_pos)
     ax.set_yticklabels(sorted_cats, fontsize=11)
@@ -4845,21 +4832,18 @@ def run_full_analysis():
     except:
         plt.tight_layout()
     plt.suptitle('Dietary Intake vs Schijf van 5 Reference (Selected Diets)', fontsize=14, fontweight='bold', y=0.995)
-    plt.savefig('images/12_Dietary_Intake_Comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '12_Dietary_Intake_Comparison.png'), dpi=300, bbox_inches='tight')
+    save_and_copy('images/12_Dietary_Intake_Comparison.png',
+                  os.path.join(appendix_dir, '12_Dietary_Intake_Comparison.png'), dpi=300)
     # CSV export for Chart 12 (dietary intake vs reference)
     intake_ref_rows = []
-    ref_mass = results_mass[reference_diet]
-    for diet_name in comparison_diets_ref:
-        diet_mass = results_mass[diet_name]
-        for cat in CAT_ORDER:
-            pct_of_ref = (diet_mass[cat] / ref_mass[cat] * 100) if ref_mass[cat] > 0 else 0
+    for i, diet_name in enumerate(comparison_diets_ref):
+        for j, cat in enumerate(CAT_ORDER):
             intake_ref_rows.append({
                 'Diet': clean_diet_label(diet_name),
                 'Category': cat,
-                'Pct_of_reference': pct_of_ref,
-                'Diet_mass_grams': diet_mass[cat],
-                'Reference_mass_grams': ref_mass[cat]
+                'Pct_of_reference': pct_of_ref_mat[i, j],
+                'Diet_mass_grams': comp_mass[i, j],
+                'Reference_mass_grams': ref_mass_arr[j]
             })
     pd.DataFrame(intake_ref_rows).to_csv(os.path.join(data_dir, '12_Dietary_Intake_Comparison.csv'), index=False)
     plt.close()
@@ -4873,41 +4857,35 @@ def run_full_analysis():
     focus_diets = ['1. Monitor 2024 (Current)', '3. Metropolitan (High Risk)', '9. Mediterranean Diet']
     goal_diets = ['5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)', '7. EAT-Lancet (Planetary)', '8. Schijf van 5 (Guideline)']
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 10))
+    fig = template_figure((16, 10))
+    fig.clear()
+    axes = fig.subplots(2, 2)
     fig.suptitle('Total Emissions Change to Achieve Dietary Goals\n(Positive = Increase, Negative = Decrease)', 
                 fontsize=16, fontweight='bold')
-    axes = axes.flatten()
+    axes = axes.ravel()
     
     # Prepare data for all baseline diets
     all_baselines = focus_diets + ['4. Metabolic Balance']  # Add 4th baseline to fill 2x2 grid
+    # Goal totals and labels are the same for every panel (total_E is already scaled)
+    goal_rows = np.array([diet_pos[g] for g in goal_diets])
+    goal_totals = total_E[goal_rows]
+    goal_labels = [clean_diet_label(g) for g in goal_diets]
     
     for idx, baseline_diet in enumerate(all_baselines[:4]):  # Use 4 baselines for 2x2 grid
         ax = axes[idx]
         # Sum across all categories for baseline
-        baseline_scope12 = sum(results_scope12.get(baseline_diet, {}).values())
-        baseline_co2 = sum(results_co2.get(baseline_diet, {}).values())
-        baseline_total = baseline_scope12 + baseline_co2  # Already scaled, don't multiply again
-        
-        goal_labels = []
-        deltas_kton = []
-        
-        for goal_diet in goal_diets:
-            goal_scope12 = sum(results_scope12.get(goal_diet, {}).values())
-            goal_co2 = sum(results_co2.get(goal_diet, {}).values())
-            goal_total = goal_scope12 + goal_co2  # Already scaled, don't multiply again
-            delta = (goal_total - baseline_total) / 1000  # Convert to kton
-            deltas_kton.append(delta)
-            goal_labels.append(clean_diet_label(goal_diet))
+        baseline_total = total_E[diet_pos[baseline_diet]]  # Already scaled, don't multiply again
+        deltas_kton = (goal_totals - baseline_total) / 1000  # Convert to kton
         
         # Sort by delta (most negative first)
-        sorted_pairs = sorted(zip(goal_labels, deltas_kton), key=lambda x: x[1])
-        goal_labels_sorted = [p[0] for p in sorted_pairs]
-        deltas_sorted = [p[1] for p in sorted_pairs]
+        order = np.argsort(deltas_kton, kind='stable')
+        goal_labels_sorted = [goal_labels[j] for j in order]
+        deltas_sorted = deltas_kton[order]
         
         colors_delta = ['#27AE60' if v < 0 else '#E74C3C' for v in deltas_sorted]
         
         y_pos = np.arange(len(goal_labels_sorted))
-        ax.barh(y_pos, deltas_sorted, color=colors_delta, alpha=0.8, edgecolor='black', linewidth=0.8)
+        bars = ax.barh(y_pos, deltas_sorted, color=colors_delta, alpha=0.8, edgecolor='black', linewidth=0.8)
         ax.set_yticks(y_pos)
         ax.set_yticklabels(goal_labels_sorted, fontsize=10)
         ax.set_xlabel('Total Emissions Change (kton CO₂e)', fontsize=11, fontweight='bold')
@@ -4915,36 +4893,25 @@ def run_full_analysis():
         ax.axvline(x=0, color='black', linestyle='-', linewidth=1.2)
         ax.grid(axis='x', alpha=0.3, linestyle='--')
         
-        for i, val in enumerate(deltas_sorted):
-            # Add extra padding to prevent overlap with axis
-            offset = 80 if val > 0 else -80
-            ax.text(val + offset, i, f'{val:,.0f}', 
-                ha='left' if val > 0 else 'right', va='center', fontsize=9, fontweight='bold')
+        # bar_label puts each label past the bar end on the side matching its sign
+        ax.bar_label(bars, labels=[f'{val:,.0f}' for val in deltas_sorted], padding=4, fontsize=9, fontweight='bold')
     
-    plt.subplots_adjust(left=0.12, right=0.95, top=0.93, bottom=0.1)
-    plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '14a_Delta_Analysis_Total_Emissions.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '14a_Delta_Analysis_Total_Emissions.png'), dpi=300, bbox_inches='tight')
+    fig.subplots_adjust(left=0.12, right=0.97, top=0.87, bottom=0.08, wspace=0.45, hspace=0.3)
+    save_and_copy(os.path.join(core_dir, '14a_Delta_Analysis_Total_Emissions.png'),
+                  os.path.join(appendix_dir, '14a_Delta_Analysis_Total_Emissions.png'), fig=fig, dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
     # CSV export for Chart 14a (total emissions change vs goals)
-    delta_14a_rows = []
+    delta_14a_frames = []
     for focus_diet in focus_diets:
-        baseline_scope12 = sum(results_scope12.get(focus_diet, {}).values())
-        baseline_co2 = sum(results_co2.get(focus_diet, {}).values())
-        baseline_total = baseline_scope12 + baseline_co2  # Already scaled, don't multiply again
-        for goal_diet in goal_diets:
-            goal_scope12 = sum(results_scope12.get(goal_diet, {}).values())
-            goal_co2 = sum(results_co2.get(goal_diet, {}).values())
-            goal_total = goal_scope12 + goal_co2  # Already scaled, don't multiply again
-            reduction_pct = ((baseline_total - goal_total) / baseline_total * 100) if baseline_total else 0
-            delta_14a_rows.append({
-                'Baseline_Diet': clean_diet_label(focus_diet),
-                'Goal_Diet': clean_diet_label(goal_diet),
-                'Baseline_total_tonnes': baseline_total,
-                'Goal_total_tonnes': goal_total,
-                'Reduction_pct': reduction_pct
-            })
-    pd.DataFrame(delta_14a_rows).to_csv(os.path.join(data_dir, '14a_Delta_Analysis_Total_Emissions.csv'), index=False)
-    plt.close()
+        baseline_total = total_E[diet_pos[focus_diet]]  # Already scaled, don't multiply again
+        reductions = ((baseline_total - goal_totals) / baseline_total * 100) if baseline_total else np.zeros(len(goal_totals))
+        delta_14a_frames.append(pd.DataFrame({
+            'Baseline_Diet': clean_diet_label(focus_diet),
+            'Goal_Diet': goal_labels,
+            'Baseline_total_tonnes': baseline_total,
+            'Goal_total_tonnes': goal_totals,
+            'Reduction_pct': reductions
+        }))
+    pd.concat(delta_14a_frames, ignore_index=True).to_csv(os.path.join(data_dir, '14a_Delta_Analysis_Total_Emissions.csv'), index=False)
     print("✓ Saved: 14a_Delta_Analysis_Total_Emissions.png")
 
     # ============================================================================
@@ -4952,72 +4919,62 @@ def run_full_analysis():
     # ============================================================================
     print("[Chart 14b] Generating: Category-Level Emissions Deltas...")
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = template_figure((16, 12))
+    fig.clear()
+    axes = fig.subplots(2, 2)
     fig.suptitle('Category-by-Category Emissions Change to Achieve Goals\n(Positive = Increase, Negative = Decrease)', 
                 fontsize=16, fontweight='bold')
-    axes = axes.flatten()
+    axes = axes.ravel()
     
     for idx, goal_diet in enumerate(goal_diets):
         ax = axes[idx]
         baseline_diet = '1. Monitor 2024 (Current)'
         
-        # NOTE: results_scope12 is ALREADY scaled for Monitor 2024, so don't multiply by scope12_scale again
-        baseline_cats = {cat: results_scope12.get(baseline_diet, {}).get(cat, 0) + 
-                        results_co2.get(baseline_diet, {}).get(cat, 0) for cat in CAT_ORDER}
-        goal_cats = {cat: results_scope12.get(goal_diet, {}).get(cat, 0) + 
-                    results_co2.get(goal_diet, {}).get(cat, 0) for cat in CAT_ORDER}
+        # NOTE: S12 is ALREADY scaled for Monitor 2024, so don't multiply by scope12_scale again
+        deltas = E[diet_pos[goal_diet]] - E[diet_pos[baseline_diet]]
+        order = np.argsort(deltas, kind='stable')
         
-        deltas = {cat: (goal_cats.get(cat, 0) - baseline_cats.get(cat, 0)) for cat in CAT_ORDER}
-        sorted_deltas = sorted(deltas.items(), key=lambda x: x[1])
-        
-        cats_sorted = [c[0] for c in sorted_deltas]
-        vals_sorted = [c[1] for c in sorted_deltas]
+        cats_sorted = [CAT_ORDER[j] for j in order]
+        vals_sorted = deltas[order]
         
         colors_delta = ['#27AE60' if v < 0 else '#E74C3C' for v in vals_sorted]
         
         y_pos = np.arange(len(cats_sorted))
-        ax.barh(y_pos, vals_sorted, color=colors_delta, alpha=0.8, edgecolor='black', linewidth=0.8)
+        bars = ax.barh(y_pos, vals_sorted, color=colors_delta, alpha=0.8, edgecolor='black', linewidth=0.8)
         ax.set_yticks(y_pos)
         ax.set_yticklabels(cats_sorted, fontsize=10)
         ax.set_xlabel('Emissions Change (kton CO₂e)', fontsize=11, fontweight='bold')
-        ax.set_title(goal_diet.split('(')[0].strip(), fontsize=13, fontweight='bold')
+        ax.set_title(short_diet_name(goal_diet), fontsize=13, fontweight='bold')
         ax.axvline(x=0, color='black', linestyle='-', linewidth=1.2)
         ax.grid(axis='x', alpha=0.3, linestyle='--')
         
-        for i, val in enumerate(vals_sorted):
-            # Add extra padding to prevent overlap with axis
-            offset = 80 if val > 0 else -80
-            ax.text(val + offset, i, f'{val:,.0f}', 
-                ha='left' if val > 0 else 'right', va='center', fontsize=9, fontweight='bold')
+        # bar_label puts each label past the bar end on the side matching its sign
+        ax.bar_label(bars, labels=[f'{val:,.0f}' for val in vals_sorted], padding=4, fontsize=9, fontweight='bold')
         
         # Add right margin to accommodate labels
         ax.margins(x=0.15)
     
-    plt.subplots_adjust(left=0.15, right=0.93, top=0.93, bottom=0.08)
-    plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '14b_Delta_Analysis_By_Category.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '14b_Delta_Analysis_By_Category.png'), dpi=300, bbox_inches='tight')
+    fig.subplots_adjust(left=0.15, right=0.95, top=0.89, bottom=0.06, wspace=0.5, hspace=0.25)
+    save_and_copy(os.path.join(core_dir, '14b_Delta_Analysis_By_Category.png'),
+                  os.path.join(appendix_dir, '14b_Delta_Analysis_By_Category.png'), fig=fig, dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
     # CSV export for Chart 14b (category-level deltas)
     delta_14b_rows = []
     baseline_diet = '1. Monitor 2024 (Current)'
+    baseline_cats = E[diet_pos[baseline_diet]]
     for goal_diet in goal_diets:
-        baseline_cats = {cat: results_scope12.get(baseline_diet, {}).get(cat, 0) + 
-                        results_co2.get(baseline_diet, {}).get(cat, 0) for cat in CAT_ORDER}
-        goal_cats = {cat: results_scope12.get(goal_diet, {}).get(cat, 0) + 
-                    results_co2.get(goal_diet, {}).get(cat, 0) for cat in CAT_ORDER}
-        for cat in CAT_ORDER:
-            delta = goal_cats.get(cat, 0) - baseline_cats.get(cat, 0)
-            delta_pct = (delta / baseline_cats.get(cat, 1) * 100) if baseline_cats.get(cat, 0) else 0
+        goal_cats = E[diet_pos[goal_diet]]
+        for j, cat in enumerate(CAT_ORDER):
+            delta = goal_cats[j] - baseline_cats[j]
+            delta_pct = (delta / baseline_cats[j] * 100) if baseline_cats[j] else 0
             delta_14b_rows.append({
                 'Goal_Diet': clean_diet_label(goal_diet),
                 'Category': cat,
-                'Baseline_tonnes': baseline_cats.get(cat, 0),
-                'Goal_tonnes': goal_cats.get(cat, 0),
+                'Baseline_tonnes': baseline_cats[j],
+                'Goal_tonnes': goal_cats[j],
                 'Delta_kton': delta / 1000,
                 'Delta_pct': delta_pct
             })
     pd.DataFrame(delta_14b_rows).to_csv(os.path.join(data_dir, '14b_Delta_Analysis_By_Category.csv'), index=False)
-    plt.close()
     print("✓ Saved: 14b_Delta_Analysis_By_Category.png")
 
     # ============================================================================
@@ -5025,36 +4982,24 @@ def run_full_analysis():
     # ============================================================================
     print("[Chart 14c] Generating: Mass vs CO₂ Share Analysis...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(16, 6))
+    fig = template_figure((16, 6))
+    fig.clear()
+    axes = fig.subplots(1, 3)
     fig.suptitle('Food Category Share: Mass vs Emissions\n(Gap = Over-Emitting Category)', 
                 fontsize=16, fontweight='bold', y=0.98)
     
     for idx, focus_diet in enumerate(focus_diets):
         ax = axes[idx]
         
-        mass_data = results_mass.get(focus_diet, {})
-        total_mass = sum(mass_data.values()) if mass_data else 1
-        
-        scope12_data = results_scope12.get(focus_diet, {})
-        co2_data = results_co2.get(focus_diet, {})
-        
-        emissions_by_cat = {}
-        for cat in CAT_ORDER:
-            emissions_by_cat[cat] = (scope12_data.get(cat, 0) + co2_data.get(cat, 0))
-        
-        total_emissions = sum(emissions_by_cat.values()) if emissions_by_cat else 1
-        
-        mass_share = {cat: (mass_data.get(cat, 0) / total_mass * 100) if total_mass else 0 for cat in CAT_ORDER}
-        emissions_share = {cat: (emissions_by_cat.get(cat, 0) / total_emissions * 100) if total_emissions else 0 for cat in CAT_ORDER}
-        
         # Sort by emission share (descending)
-        sorted_cats_mass = sorted(CAT_ORDER, key=lambda c: emissions_share.get(c, 0), reverse=True)[:8]
+        shares = diet_shares.loc[focus_diet].sort_values('total', ascending=False, kind='stable').head(8)
+        sorted_cats_mass = list(shares.index)
         
         x = np.arange(len(sorted_cats_mass))
         width = 0.35
         
-        mass_vals = [mass_share.get(cat, 0) for cat in sorted_cats_mass]
-        emis_vals = [emissions_share.get(cat, 0) for cat in sorted_cats_mass]
+        mass_vals = shares['mass'].to_numpy()
+        emis_vals = shares['total'].to_numpy()
         
         bars1 = ax.bar(x - width/2, mass_vals, width, label='Mass Share (%)', 
                     color='#3498DB', alpha=0.8, edgecolor='black', linewidth=0.8)
@@ -5070,30 +5015,15 @@ def run_full_analysis():
         ax.legend(fontsize=10, loc='upper right')
         ax.grid(axis='y', alpha=0.3, linestyle='--')
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '14c_Mass_vs_Emissions_Share.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '14c_Mass_vs_Emissions_Share.png'), dpi=300, bbox_inches='tight')
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.78, bottom=0.30, wspace=0.3)
+    save_and_copy(os.path.join(core_dir, '14c_Mass_vs_Emissions_Share.png'),
+                  os.path.join(appendix_dir, '14c_Mass_vs_Emissions_Share.png'), fig=fig, dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
     # CSV export for Chart 14c (mass vs emissions share)
-    mass_emissions_share_rows = []
-    for focus_diet in focus_diets:
-        mass_data = results_mass.get(focus_diet, {})
-        total_mass = sum(mass_data.values()) if mass_data else 1
-        scope12_data = results_scope12.get(focus_diet, {})
-        co2_data = results_co2.get(focus_diet, {})
-        emissions_by_cat = {cat: (scope12_data.get(cat, 0) + co2_data.get(cat, 0)) for cat in CAT_ORDER}
-        total_emissions = sum(emissions_by_cat.values()) if emissions_by_cat else 1
-        for cat in CAT_ORDER:
-            mass_share_pct = (mass_data.get(cat, 0) / total_mass * 100) if total_mass else 0
-            emissions_share_pct = (emissions_by_cat.get(cat, 0) / total_emissions * 100) if total_emissions else 0
-            mass_emissions_share_rows.append({
-                'Diet': clean_diet_label(focus_diet),
-                'Category': cat,
-                'Mass_share_pct': mass_share_pct,
-                'Emissions_share_pct': emissions_share_pct,
-                'Gap_pct': emissions_share_pct - mass_share_pct
-            })
-    pd.DataFrame(mass_emissions_share_rows).to_csv(os.path.join(data_dir, '14c_Mass_vs_Emissions_Share.csv'), index=False)
-    plt.close()
+    mass_emissions_share = diet_shares.loc[focus_diets, ['mass', 'total']].reset_index()
+    mass_emissions_share.columns = ['Diet', 'Category', 'Mass_share_pct', 'Emissions_share_pct']
+    mass_emissions_share['Diet'] = mass_emissions_share['Diet'].map(clean_diet_label)
+    mass_emissions_share['Gap_pct'] = mass_emissions_share['Emissions_share_pct'] - mass_emissions_share['Mass_share_pct']
+    mass_emissions_share.to_csv(os.path.join(data_dir, '14c_Mass_vs_Emissions_Share.csv'), index=False)
     print("✓ Saved: 14c_Mass_vs_Emissions_Share.png")
 
     # ============================================================================
@@ -5101,7 +5031,9 @@ def run_full_analysis():
     # ============================================================================
     print("[Chart 14d] Generating: Scope 1+2 vs Scope 3 Breakdown...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(16, 6))
+    fig = template_figure((16, 6))
+    fig.clear()
+    axes = fig.subplots(1, 3)
     fig.suptitle('Emissions Scope Breakdown: Baseline vs Dietary Goals\n(Scope 1+2 = Production/Retail | Scope 3 = Supply Chain)', 
             fontsize=16, fontweight='bold', y=0.98)
     
@@ -5109,8 +5041,8 @@ def run_full_analysis():
         ax = axes[idx]
         
         # Baseline totals (sum categories)
-        baseline_s12 = sum(results_scope12.get(focus_diet, {}).values())
-        baseline_s3 = sum(results_co2.get(focus_diet, {}).values())
+        baseline_s12 = total_S12[diet_pos[focus_diet]]
+        baseline_s3 = total_S3[diet_pos[focus_diet]]
         baseline_total = baseline_s12 + baseline_s3
         
         # Create data for stacked bar
@@ -5119,8 +5051,8 @@ def run_full_analysis():
         scope3_vals = [baseline_s3]
         
         for goal_diet in goal_diets:
-            goal_s12 = sum(results_scope12.get(goal_diet, {}).values())
-            goal_s3 = sum(results_co2.get(goal_diet, {}).values())
+            goal_s12 = total_S12[diet_pos[goal_diet]]
+            goal_s3 = total_S3[diet_pos[goal_diet]]
             scope12_vals.append(goal_s12)
             scope3_vals.append(goal_s3)
         
@@ -5131,7 +5063,7 @@ def run_full_analysis():
         bars2 = ax.bar(x, scope3_vals, width, bottom=scope12_vals, label='Scope 3', color='#F39C12', alpha=0.8, edgecolor='black', linewidth=0.8)
         
         ax.set_ylabel('Emissions (kton CO₂e)', fontsize=11, fontweight='bold')
-        ax.set_title(focus_diet.split('(')[0].strip(), fontsize=13, fontweight='bold')
+        ax.set_title(short_diet_name(focus_diet), fontsize=13, fontweight='bold')
         ax.set_xticks(x)
         ax.set_xticklabels(scenarios, fontsize=10)
         ax.legend(fontsize=10, loc='upper right')
@@ -5140,18 +5072,17 @@ def run_full_analysis():
         # Add total labels
         max_total = max([s12 + s3 for s12, s3 in zip(scope12_vals, scope3_vals)]) if scope12_vals else 0
         ax.set_ylim(0, max_total * 1.12 if max_total else None)
-        for i in range(len(scenarios)):
-            total = scope12_vals[i] + scope3_vals[i]
-            ax.text(i, total + max_total * 0.02, f'{total:.0f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax.bar_label(bars2, labels=[f'{s12 + s3:.0f}' for s12, s3 in zip(scope12_vals, scope3_vals)],
+                     padding=3, fontsize=10, fontweight='bold')
     
-    plt.subplots_adjust(top=0.92, bottom=0.10, left=0.08, right=0.95, wspace=0.3, hspace=0.3)
-    plt.savefig(os.path.join(core_dir, '14d_Scope_Breakdown_Baseline_vs_Goals.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '14d_Scope_Breakdown_Baseline_vs_Goals.png'), dpi=300, bbox_inches='tight')
+    fig.subplots_adjust(top=0.80, bottom=0.10, left=0.08, right=0.95, wspace=0.3, hspace=0.3)
+    save_and_copy(os.path.join(core_dir, '14d_Scope_Breakdown_Baseline_vs_Goals.png'),
+                  os.path.join(appendix_dir, '14d_Scope_Breakdown_Baseline_vs_Goals.png'), fig=fig, dpi=APPENDIX_DPI, core_dpi=CORE_DPI, tight=False)
     # CSV export for Chart 14d (scope breakdown baseline vs goals)
     scope_breakdown_14d_rows = []
     for focus_diet in focus_diets:
-        baseline_s12 = sum(results_scope12.get(focus_diet, {}).values())
-        baseline_s3 = sum(results_co2.get(focus_diet, {}).values())
+        baseline_s12 = total_S12[diet_pos[focus_diet]]
+        baseline_s3 = total_S3[diet_pos[focus_diet]]
         scope_breakdown_14d_rows.append({
             'Focus_Diet': clean_diet_label(focus_diet),
             'Scenario': 'Baseline (Monitor)',
@@ -5160,8 +5091,8 @@ def run_full_analysis():
             'Total_kton': (baseline_s12 + baseline_s3) / 1000
         })
         for goal_diet in goal_diets:
-            goal_s12 = sum(results_scope12.get(goal_diet, {}).values())
-            goal_s3 = sum(results_co2.get(goal_diet, {}).values())
+            goal_s12 = total_S12[diet_pos[goal_diet]]
+            goal_s3 = total_S3[diet_pos[goal_diet]]
             scope_breakdown_14d_rows.append({
                 'Focus_Diet': clean_diet_label(focus_diet),
                 'Scenario': clean_diet_label(goal_diet),
@@ -5170,7 +5101,6 @@ def run_full_analysis():
                 'Total_kton': (goal_s12 + goal_s3) / 1000
             })
     pd.DataFrame(scope_breakdown_14d_rows).to_csv(os.path.join(data_dir, '14d_Scope_Breakdown_Baseline_vs_Goals.csv'), index=False)
-    plt.close()
     print("✓ Saved: 14d_Scope_Breakdown_Baseline_vs_Goals.png (core + appendix)")
 
     # ============================================================================
@@ -5183,8 +5113,8 @@ def run_full_analysis():
     
     for diet_name in ['1. Monitor 2024 (Current)', '5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)', '7. EAT-Lancet (Planetary)']:
         diet_short = clean_diet_label(diet_name)
-        scope12_total = sum(results_scope12.get(diet_name, {}).values())
-        scope3_total = sum(results_co2.get(diet_name, {}).values())
+        scope12_total = total_S12[diet_pos[diet_name]]
+        scope3_total = total_S3[diet_pos[diet_name]]
         grand_total = scope12_total + scope3_total
         
         table_data.append({
@@ -5202,35 +5132,41 @@ def run_full_analysis():
     fig, ax = plt.subplots(figsize=(12, 6))
     ax.axis('off')
     
-    table = ax.table(cellText=table_df.values, colLabels=table_df.columns,
-                    cellLoc='center', loc='center', bbox=[0, 0, 1, 1])
-    table.auto_set_font_size(False)
-    table.set_fontsize(11)
-    table.scale(1, 2.2)
-    
-    # Format header
-    for i in range(len(table_df.columns)):
-        table[(0, i)].set_facecolor('#2C3E50')
-        table[(0, i)].set_text_props(weight='bold', color='white', fontsize=12)
-    
-    # Alternate row colors
-    for i in range(1, len(table_df) + 1):
-        for j in range(len(table_df.columns)):
-            if i % 2 == 0:
-                table[(i, j)].set_facecolor('#ECF0F1')
-            else:
-                table[(i, j)].set_facecolor('#FFFFFF')
+    # Fixed grid of cells drawn as one PatchCollection (skips ax.table's per-cell layout
+    # and font-size probing); row 0 is the header, data rows alternate white/grey
+    n_rows, n_cols = len(table_df) + 1, len(table_df.columns)
+    xs = np.linspace(0, 1, n_cols + 1)
+    ys = np.linspace(1, 0, n_rows + 1)
+    cell_w, cell_h = xs[1] - xs[0], ys[0] - ys[1]
+    row_colors = ['#2C3E50'] + ['#ECF0F1' if i % 2 == 0 else '#FFFFFF' for i in range(1, n_rows)]
+    cells = [Rectangle((xs[j], ys[i + 1]), cell_w, cell_h) for i in range(n_rows) for j in range(n_cols)]
+    ax.add_collection(PatchCollection(cells, facecolors=np.repeat(row_colors, n_cols),
+                                      edgecolors='black', linewidths=0.8))
+    cell_text = [list(table_df.columns)] + table_df.astype(str).values.tolist()
+    x_mid = (xs[:-1] + xs[1:]) / 2
+    y_mid = (ys[:-1] + ys[1:]) / 2
+    for i, row in enumerate(cell_text):
+        header = i == 0
+        for j, text in enumerate(row):
+            ax.text(x_mid[j], y_mid[i], text, ha='center', va='center',
+                    fontsize=12 if header else 11, fontweight='bold' if header else 'normal',
+                    color='white' if header else 'black')
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
     
     plt.title('Table 15: Emissions by Scope and Dietary Scenario (APA Format)\n', 
             fontsize=14, fontweight='bold', pad=20)
     plt.figtext(0.5, 0.02, 'Note: Scope 1+2 includes production, retail, and household emissions. Scope 3 includes supply chain impacts.',
             ha='center', fontsize=10, style='italic', wrap=True)
     
-    plt.savefig(os.path.join(core_dir, '15_Table_APA_Emissions.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '15_Table_APA_Emissions.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '15_Table_APA_Emissions.png'),
+                  os.path.join(appendix_dir, '15_Table_APA_Emissions.png'), dpi=APPENDIX_DPI, core_dpi=TABLE_DPI)
     table_df.to_csv(os.path.join(data_dir, '15_APA_emissions_summary.csv'), index=False)
+    # Text-native copy of the table (selectable, no rasterisation) for reports/web
+    table_df.to_html(os.path.join(data_dir, '15_APA_emissions_summary.html'), index=False,
+                     classes='apa-table', border=0)
     plt.close()
-    print("✓ Saved: 15_Table_APA_Emissions (core + appendix) + data/15_APA_emissions_summary.csv")
+    print("✓ Saved: 15_Table_APA_Emissions (core + appendix) + data/15_APA_emissions_summary.csv/.html")
 
     # ============================================================================
     # CHART 17: EMISSIONS BY CATEGORY - MULTI-DIET vs GOAL REFERENCES
@@ -5238,12 +5174,14 @@ def run_full_analysis():
     print("Generating 17_Emissions_by_Category_vs_Reference.png...")
     
     # CORE: 3 Focus Diets vs 4 Goal References (one graph per goal)
-    fig17_core, axes17_core = plt.subplots(2, 2, figsize=(16, 12))
-    axes17_core = axes17_core.flatten()
+    fig17_core, axes17_core = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
+    axes17_core = axes17_core.ravel()
     
     baseline_diets_names = ['1. Monitor 2024 (Current)', '2. Amsterdam Theoretical', '3. Metropolitan (High Risk)']
     goal_refs = ['5. Dutch Goal (60:40)', '6. Amsterdam Goal (70:30)', '7. EAT-Lancet (Planetary)', '8. Schijf van 5 (Guideline)']
     diet_colors_core = ['#1f77b4', '#ff7f0e', '#2ca02c']  # Blue, Orange, Green
+    # Diet names without the "N. " prefix, split once for the Chart 17/18 labels and titles
+    diet_short_names = {d: d.split('. ', 1)[1] for d in diet_keys}
     
     for ref_idx, goal_ref in enumerate(goal_refs):
         ax = axes17_core[ref_idx]
@@ -5253,42 +5191,32 @@ def run_full_analysis():
         width = 0.25
         
         for base_idx, baseline in enumerate(baseline_diets_names):
-            # Total emissions = Scope 1+2 + Scope 3
-            vals = [(results_scope12[baseline].get(cat, 0) + results_co2[baseline].get(cat, 0)) for cat in CAT_ORDER]
-            ax.barh(x_pos + base_idx * width, vals, width, label=baseline.split('. ')[1][:20], 
+            # Total emissions = Scope 1+2 + Scope 3 (row of E, CAT_ORDER columns)
+            vals = E[diet_pos[baseline]]
+            ax.barh(x_pos + base_idx * width, vals, width, label=diet_short_names[baseline][:20], 
                 color=diet_colors_core[base_idx], alpha=0.85, edgecolor='black', linewidth=0.5)
         
         # Add reference line
-        ref_vals = [(results_scope12[goal_ref].get(cat, 0) + results_co2[goal_ref].get(cat, 0)) for cat in CAT_ORDER]
-        ax.axvline(sum(ref_vals) / len(CAT_ORDER), color='red', linestyle='--', linewidth=2.0, label=f'{goal_ref.split(". ")[1]} (Avg)', alpha=0.8)
+        ax.axvline(E[diet_pos[goal_ref]].mean(), color='red', linestyle='--', linewidth=2.0, label=f'{diet_short_names[goal_ref]} (Avg)', alpha=0.8)
         
         ax.set_yticks(x_pos + width)
         ax.set_yticklabels(CAT_ORDER, fontsize=9)
         ax.set_xlabel('Total Emissions (kton CO₂e/year)', fontsize=10, fontweight='bold')
-        ax.set_title(f'vs {goal_ref.split(". ")[1]}', fontsize=11, fontweight='bold')
+        ax.set_title(f'vs {diet_short_names[goal_ref]}', fontsize=11, fontweight='bold')
         ax.legend(fontsize=8, loc='upper left')
         ax.grid(axis='x', alpha=0.3, linestyle='--')
     
     fig17_core.suptitle('Emissions by Category: 3 Focus Diets vs 4 Goal References (Total: Scope 1+2+3)',
-                    fontsize=13, fontweight='bold', y=0.995)
-    try:
-        fig17_core.tight_layout()
-    except:
-        pass
-    safe_savefig(os.path.join(core_dir, '17_Emissions_by_Category_vs_Reference.png'), dpi=300)
+                    fontsize=13, fontweight='bold')
+    safe_savefig(os.path.join(core_dir, '17_Emissions_by_Category_vs_Reference.png'), dpi=CORE_DPI)
     # CSV export for Chart 17 core
-    chart17_core_rows = []
-    for goal_ref in goal_refs:
-        for baseline in baseline_diets_names:
-            for cat in CAT_ORDER:
-                val = results_scope12[baseline].get(cat, 0) + results_co2[baseline].get(cat, 0)
-                chart17_core_rows.append({
-                    'Baseline_Diet': clean_diet_label(baseline),
-                    'Goal_Reference': clean_diet_label(goal_ref),
-                    'Category': cat,
-                    'Total_emissions_tonnes_per_year': val
-                })
-    pd.DataFrame(chart17_core_rows).to_csv(os.path.join(data_dir, '17_Emissions_by_Category_vs_Reference_core.csv'), index=False)
+    chart17_core_frames = [pd.DataFrame({
+                               'Baseline_Diet': clean_diet_label(baseline),
+                               'Goal_Reference': clean_diet_label(goal_ref),
+                               'Category': CAT_ORDER,
+                               'Total_emissions_tonnes_per_year': E[diet_pos[baseline]]
+                           }) for goal_ref in goal_refs for baseline in baseline_diets_names]
+    pd.concat(chart17_core_frames, ignore_index=True).to_csv(os.path.join(data_dir, '17_Emissions_by_Category_vs_Reference_core.csv'), index=False)
     plt.close()
     
     # APPENDIX: 9 Diets vs 9 Goals (excluding self-comparison, like dietary intake chart)
@@ -5296,10 +5224,15 @@ def run_full_analysis():
     all_diets_list = list(diets.keys())
     n_diets = len(all_diets_list)
     
-    fig17_app, axes17_app = plt.subplots(3, 3, figsize=(20, 15))
-    axes17_app = axes17_app.flatten()
+    # Every panel plots the same categories on comparable scales: shared axes keep one
+    # tick layout (inner tick labels hidden) and constrained_layout does the single layout pass
+    fig17_app, axes17_app = plt.subplots(3, 3, figsize=(20, 15), sharex=True, sharey=True,
+                                         constrained_layout=True)
+    axes17_app = axes17_app.ravel()
     
     diet_colors_app = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22']
+    # One colour per diet (all_diets_list order), sliced per panel below
+    diet_color_arr = np.array([diet_colors_app[k % len(diet_colors_app)] for k in range(n_diets)])
     
     for goal_idx, goal_ref in enumerate(all_diets_list):
         ax = axes17_app[goal_idx]
@@ -5310,43 +5243,36 @@ def run_full_analysis():
         x_pos = np.arange(len(CAT_ORDER))
         width = 1.0 / (len(baseline_list) + 0.5)  # Dynamic bar width based on number of diets
         
-        for base_idx, baseline in enumerate(baseline_list):
-            vals = [(results_scope12[baseline].get(cat, 0) + results_co2[baseline].get(cat, 0)) for cat in CAT_ORDER]
-            color_idx = all_diets_list.index(baseline)
-            ax.barh(x_pos + base_idx * width, vals, width, 
-                color=diet_colors_app[color_idx % len(diet_colors_app)], alpha=0.75, edgecolor='black', linewidth=0.3)
+        # All baselines in one barh call: row b of V sits at x_pos + b * width
+        V = E[[diet_pos[baseline] for baseline in baseline_list]]
+        y_bars = x_pos[None, :] + np.arange(len(baseline_list))[:, None] * width
+        bar_colors = np.repeat(diet_color_arr[np.arange(n_diets) != goal_idx], len(CAT_ORDER))
+        # No bar outlines: ~1000 thin bars per figure, the edges are sub-pixel at this size
+        ax.barh(y_bars.ravel(), V.ravel(), width, color=bar_colors, alpha=0.75, linewidth=0)
         
         # Reference line (goal diet average)
-        ref_vals = [(results_scope12[goal_ref].get(cat, 0) + results_co2[goal_ref].get(cat, 0)) for cat in CAT_ORDER]
-        ax.axvline(sum(ref_vals) / len(CAT_ORDER), color='black', linestyle='--', linewidth=2.0, alpha=0.7)
+        ax.axvline(E[diet_pos[goal_ref]].mean(), color='black', linestyle='--', linewidth=2.0, alpha=0.7)
         
-        ax.set_yticks(x_pos + width * len(baseline_list) / 2)
-        ax.set_yticklabels(CAT_ORDER, fontsize=8)
-        ax.set_xlabel('Emissions (kton CO₂e/year)', fontsize=9, fontweight='bold')
-        ax.set_title(f'vs {goal_ref.split(". ")[1][:20]}', fontsize=10, fontweight='bold')
+        ax.set_title(f'vs {diet_short_names[goal_ref][:20]}', fontsize=10, fontweight='bold')
         ax.grid(axis='x', alpha=0.3, linestyle='--')
     
+    # Shared y axis: one set of category ticks, one x label for the whole grid
+    axes17_app[0].set_yticks(x_pos + width * (n_diets - 1) / 2)
+    axes17_app[0].set_yticklabels(CAT_ORDER)
+    for ax in axes17_app:
+        ax.tick_params(axis='y', labelsize=8)
+    fig17_app.supxlabel('Emissions (kton CO₂e/year)', fontsize=11, fontweight='bold')
     fig17_app.suptitle('Emissions by Category: All 9 Diets vs All 9 Goals (Excluding Self-Comparison, Total: Scope 1+2+3)',
-                    fontsize=13, fontweight='bold', y=0.995)
-    try:
-        fig17_app.tight_layout()
-    except:
-        pass
-    safe_savefig(os.path.join(appendix_dir, '17_Emissions_by_Category_vs_Reference.png'), dpi=300)
+                    fontsize=13, fontweight='bold')
+    safe_savefig(os.path.join(appendix_dir, '17_Emissions_by_Category_vs_Reference.png'), dpi=APPENDIX_DPI, tight=False)
     # CSV export for Chart 17 appendix (all 9 diets)
-    chart17_all_rows = []
-    for goal_ref in all_diets_list:
-        baseline_list = [d for d in all_diets_list if d != goal_ref]
-        for baseline in baseline_list:
-            for cat in CAT_ORDER:
-                val = results_scope12[baseline].get(cat, 0) + results_co2[baseline].get(cat, 0)
-                chart17_all_rows.append({
-                    'Baseline_Diet': clean_diet_label(baseline),
-                    'Goal_Reference': clean_diet_label(goal_ref),
-                    'Category': cat,
-                    'Total_emissions_tonnes_per_year': val
-                })
-    pd.DataFrame(chart17_all_rows).to_csv(os.path.join(data_dir, '17_Emissions_by_Category_vs_Reference_all.csv'), index=False)
+    chart17_all_frames = [pd.DataFrame({
+                              'Baseline_Diet': clean_diet_label(baseline),
+                              'Goal_Reference': clean_diet_label(goal_ref),
+                              'Category': CAT_ORDER,
+                              'Total_emissions_tonnes_per_year': E[diet_pos[baseline]]
+                          }) for goal_ref in all_diets_list for baseline in all_diets_list if baseline != goal_ref]
+    pd.concat(chart17_all_frames, ignore_index=True).to_csv(os.path.join(data_dir, '17_Emissions_by_Category_vs_Reference_all.csv'), index=False)
     plt.close()
     print("✓ Saved: 17_Emissions_by_Category_vs_Reference (core + appendix)")
 
@@ -5361,37 +5287,37 @@ def run_full_analysis():
     comparison_all_diets = [d for d in diets.keys() if d != ref_diet_key]
     
     fig_intake, axes_intake = plt.subplots(2, 3, figsize=(18, 10))
-    axes_intake = axes_intake.flatten()
+    axes_intake = axes_intake.ravel()
     
     ref_diet_intake = diets[ref_diet_key]  # Schijf van 5 as reference
     
+    # One food-item x diet table (alphabetical rows, missing items = 0 g) and its % of reference:
+    # diet / ref * 100 where the reference is positive, else 0 (both absent) or 100 (diet-only item)
+    # Global food-item index: every item of every diet profile, sorted once
+    food_index = pd.Index(sorted(set().union(*diets.values())))
+    ref_intake_s = pd.Series(ref_diet_intake).reindex(food_index, fill_value=0)
+    intake_df = pd.DataFrame({d: pd.Series(diets[d]).reindex(food_index, fill_value=0) for d in comparison_all_diets})
+    ref_col = ref_intake_s.to_numpy()[:, None]
+    amt = intake_df.to_numpy()
+    ratio = np.divide(amt, ref_col, out=np.zeros(amt.shape), where=ref_col > 0)
+    pct_ref_df = pd.DataFrame(np.where(ref_col > 0, ratio * 100, np.where(amt == 0, 0.0, 100.0)),
+                              index=food_index, columns=comparison_all_diets)
+    in_ref = food_index.isin(list(ref_diet_intake))
+    
     for idx, diet_key in enumerate(comparison_all_diets[:6]):
         ax = axes_intake[idx]
-        diet_intake = diets[diet_key]
         
-        # Calculate % of reference for each food item
-        food_items = sorted(set(list(ref_diet_intake.keys()) + list(diet_intake.keys())))
-        pct_of_ref = []
-        
-        for item in food_items:
-            ref_amt = ref_diet_intake.get(item, 0)
-            diet_amt = diet_intake.get(item, 0)
-            if ref_amt > 0:
-                pct = (diet_amt / ref_amt) * 100
-            else:
-                pct = 0 if diet_amt == 0 else 100
-            pct_of_ref.append(pct)
-        
-        # Sort by percentage and plot top 15
-        sorted_pairs = sorted(zip(food_items, pct_of_ref), key=lambda x: x[1], reverse=True)[:15]
-        items_sorted = [x[0] for x in sorted_pairs]
-        pcts_sorted = [x[1] for x in sorted_pairs]
+        # Items in the reference or this diet, sorted by % (stable: ties stay alphabetical), top 15
+        listed = in_ref | food_index.isin(list(diets[diet_key]))
+        top = pct_ref_df.loc[listed, diet_key].sort_values(ascending=False, kind='stable').head(15)
+        items_sorted = list(top.index)
+        pcts_sorted = top.to_numpy()
         
         colors_intake = ['#CC3311' if p > 100 else '#0077BB' for p in pcts_sorted]
         ax.barh(items_sorted, pcts_sorted, color=colors_intake, alpha=0.8, edgecolor='black', linewidth=0.5)
         ax.axvline(100, color='black', linestyle='--', linewidth=2, label='Reference (100%)')
         ax.set_xlabel('% of Reference Intake', fontsize=10, fontweight='bold')
-        ax.set_title(f'{diet_key.split(". ")[1]} vs Reference', fontsize=11, fontweight='bold')
+        ax.set_title(f'{diet_short_names[diet_key]} vs Reference', fontsize=11, fontweight='bold')
         ax.legend(fontsize=8)
         ax.grid(axis='x', alpha=0.3, linestyle='--')
     
@@ -5402,27 +5328,18 @@ def run_full_analysis():
     plt.suptitle('Dietary Intake Comparison Against Schijf van 5 Reference\n2024 dietary intake versus reference intake (%)',
                 fontsize=14, fontweight='bold', y=1.00)
     plt.tight_layout()
-    plt.savefig(os.path.join(core_dir, '18_Dietary_Intake_vs_Reference.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(appendix_dir, '18_Dietary_Intake_vs_Reference.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '18_Dietary_Intake_vs_Reference.png'),
+                  os.path.join(appendix_dir, '18_Dietary_Intake_vs_Reference.png'), dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     # CSV export for Chart 18 (dietary intake vs reference)
-    chart18_rows = []
-    for diet_key in comparison_all_diets:
-        diet_intake = diets[diet_key]
-        for item in ref_diet_intake.keys():
-            ref_amt = ref_diet_intake.get(item, 0)
-            diet_amt = diet_intake.get(item, 0)
-            if ref_amt > 0:
-                pct = (diet_amt / ref_amt) * 100
-            else:
-                pct = 0 if diet_amt == 0 else 100
-            chart18_rows.append({
-                'Diet': clean_diet_label(diet_key),
-                'Food_Item': item,
-                'Reference_grams_per_day': ref_amt,
-                'Diet_grams_per_day': diet_amt,
-                'Pct_of_reference': pct
-            })
-    pd.DataFrame(chart18_rows).to_csv(os.path.join(data_dir, '18_Dietary_Intake_vs_Reference.csv'), index=False)
+    ref_items = list(ref_diet_intake)
+    chart18_frames = [pd.DataFrame({
+                          'Diet': clean_diet_label(diet_key),
+                          'Food_Item': ref_items,
+                          'Reference_grams_per_day': ref_intake_s[ref_items].to_numpy(),
+                          'Diet_grams_per_day': intake_df.loc[ref_items, diet_key].to_numpy(),
+                          'Pct_of_reference': pct_ref_df.loc[ref_items, diet_key].to_numpy()
+                      }) for diet_key in comparison_all_diets]
+    pd.concat(chart18_frames, ignore_index=True).to_csv(os.path.join(data_dir, '18_Dietary_Intake_vs_Reference.csv'), index=False)
     plt.close()
     print("✓ Saved: 18_Dietary_Intake_vs_Reference.png")
 
@@ -5488,10 +5405,7 @@ def run_full_analysis():
                     error_kw=dict(ecolor='black', capsize=8, capthick=2, elinewidth=2, alpha=0.6))
     
     # Add legend for colors - positioned outside plot area to avoid overlap
-    from matplotlib.patches import Patch
-    legend_elements = [Patch(facecolor='#E74C3C', edgecolor='black', label='Increase (worse)'),
-                    Patch(facecolor='#27AE60', edgecolor='black', label='Decrease (better)')]
-    ax16a.legend(handles=legend_elements, loc='upper right', fontsize=11, frameon=True, 
+    ax16a.legend(handles=SENS_LEGEND, loc='upper right', fontsize=11, frameon=True, 
                 bbox_to_anchor=(0.99, 0.99), edgecolor='black', fancybox=True, shadow=True)
     
     ax16a.set_yticks(y_pos)
@@ -5502,28 +5416,25 @@ def run_full_analysis():
     ax16a.axvline(x=0, color='black', linestyle='-', linewidth=2)
     ax16a.grid(axis='x', alpha=0.3, linestyle='--')
     
-    # Add value labels with better positioning to avoid overlap with error bars
+    # Value labels sit label_offset past the bar end to avoid overlap with error bars
     max_val = max(abs(v) for v in param_values_sorted)
     label_offset = max_val * 0.10  # Increased from 0.06 to 0.10 for more space
     
-    for i, val in enumerate(param_values_sorted):
-        label_x = val + label_offset if val > 0 else val - label_offset
+    for y, val, err in zip(y_pos, param_values_sorted, uncertainty_margins):
         # Format label with value and uncertainty on separate lines for clarity
-        label_text = f'{val:+.0f}\n(±{uncertainty_margins[i]:.0f})'
-        ax16a.text(label_x, i, label_text, 
-                ha='left' if val > 0 else 'right', va='center', 
-                fontsize=9, fontweight='bold', color='black', 
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7, edgecolor='none'))
+        ax16a.text(val + label_offset if val > 0 else val - label_offset, y, f'{val:+.0f}\n(±{err:.0f})',
+                   ha='left' if val > 0 else 'right', va='center',
+                   fontsize=9, fontweight='bold', color='black',
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7, edgecolor='none'))
     
     # Set x-axis limits with extra headroom for labels and legend
     ax16a.set_xlim(min(param_values_sorted) - label_offset * 3.5, 
                    max(param_values_sorted) + label_offset * 3.5)
     
     fig16a.tight_layout()
-    fig16a.savefig(os.path.join(core_dir, '16a_Sensitivity_Tornado_Diagram.png'), dpi=300, bbox_inches='tight')
-    fig16a.savefig(os.path.join(appendix_dir, '16a_Sensitivity_Tornado_Diagram.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Saved: 16a_Sensitivity_Tornado_Diagram.png")
+    # 16a-16e are independent once built: queue (figure, filename) and save them one by one
+    # after 16e (rendering stays on this thread; save_and_copy queues the file writes)
+    chart16_saves = [(fig16a, '16a_Sensitivity_Tornado_Diagram.png')]
     # Export 16a tornado data to CSV
     tornado_df = pd.DataFrame({
         'Parameter': param_names_sorted,
@@ -5555,21 +5466,18 @@ def run_full_analysis():
     table16b.set_fontsize(10)
     table16b.scale(1, 2.2)
     
-    # Format header row
-    for i in range(4):
-        table16b[(0, i)].set_facecolor('#34495E')
-        table16b[(0, i)].set_text_props(weight='bold', color='white', fontsize=11)
-    
-    # Alternate row colors
-    for i in range(1, len(table_data_sens)):
-        bg_color = '#ECF0F1' if i % 2 == 0 else 'white'
-        for j in range(4):
-            table16b[(i, j)].set_facecolor(bg_color)
-            if i < len(table_data_sens) - 1:  # Not baseline row
-                table16b[(i, j)].set_text_props(fontsize=10)
-            else:  # Baseline row
-                table16b[(i, j)].set_facecolor('#F39C12')
-                table16b[(i, j)].set_text_props(fontsize=10, weight='bold')
+    # Header row, alternating row colors and the highlighted baseline (last) row in one pass
+    baseline_row = len(table_data_sens) - 1
+    for (i, j), cell in table16b.get_celld().items():
+        if i == 0:
+            cell.set_facecolor('#34495E')
+            cell.set_text_props(weight='bold', color='white', fontsize=11)
+        elif i < baseline_row:
+            cell.set_facecolor('#ECF0F1' if i % 2 == 0 else 'white')
+            cell.set_text_props(fontsize=10)
+        else:
+            cell.set_facecolor('#F39C12')
+            cell.set_text_props(fontsize=10, weight='bold')
     
     ax16b.text(0.5, 0.98, 'Sensitivity Analysis Results Table', 
             ha='center', va='top', fontsize=14, fontweight='bold', transform=ax16b.transAxes)
@@ -5578,10 +5486,7 @@ def run_full_analysis():
     
     fig16b.tight_layout()
     fig16b.subplots_adjust(top=0.88)
-    fig16b.savefig(os.path.join(core_dir, '16b_Sensitivity_Analysis_Table.png'), dpi=300, bbox_inches='tight')
-    fig16b.savefig(os.path.join(appendix_dir, '16b_Sensitivity_Analysis_Table.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Saved: 16b_Sensitivity_Analysis_Table.png")
+    chart16_saves.append((fig16b, '16b_Sensitivity_Analysis_Table.png'))
     # Export 16b sensitivity table to CSV
     table_df_16b = pd.DataFrame(table_data_sens[1:], columns=table_data_sens[0])
     table_df_16b.to_csv(os.path.join(data_dir, '16b_Sensitivity_Analysis_Table.csv'), index=False)
@@ -5597,11 +5502,7 @@ def run_full_analysis():
     comparison_data = {}
     
     for diet in comparison_diets:
-        s12_cat = results_scope12.get(diet, {})
-        s12 = sum(s12_cat.values()) if s12_cat else 0
-        s3_cat = results_co2.get(diet, {})
-        s3 = sum(s3_cat.values()) if s3_cat else 0
-        diet_total = s12 + s3
+        diet_total = total_footprints.get(diet, 0)  # Scope 1+2+3, cached after calibration
         
         comparison_data[diet] = {
             'Impact Factors': diet_total * 0.10,
@@ -5619,15 +5520,11 @@ def run_full_analysis():
     params_short = ['Impact Factors', 'Diet Adherence', 'Waste Rate']
     colors_bars = [TOL_ORANGE, TOL_BLUE, TOL_YELLOW]
     
+    bars16c = []
     for idx, param in enumerate(params_short):
         values = [comparison_data[diet][param] for diet in comparison_diets]
-        ax16c.bar(x_pos + idx*width, values, width, label=param, color=colors_bars[idx], 
-                alpha=0.85, edgecolor='black', linewidth=1)
-        
-        # Add value labels on bars
-        for i, v in enumerate(values):
-            ax16c.text(x_pos[i] + idx*width, v + max(values)*0.02, f'{v:.0f}', 
-                    ha='center', va='bottom', fontsize=9, fontweight='bold')
+        bars16c.append(ax16c.bar(x_pos + idx*width, values, width, label=param, color=colors_bars[idx], 
+                alpha=0.85, edgecolor='black', linewidth=1))
     
     ax16c.set_xlabel('Diet Scenario', fontsize=12, fontweight='bold')
     ax16c.set_ylabel('Emission Impact (kton CO₂e/year)', fontsize=12, fontweight='bold')
@@ -5653,14 +5550,16 @@ def run_full_analysis():
     df16c.to_csv(os.path.join(data_dir, '16c_Sensitivity_Grouped_Comparison.csv'), index=False)
     print("[Data Export] ✓ 16c_Sensitivity_Grouped_Comparison.csv")
 
+    # Add value labels on bars, 2% of each group's largest bar above the top (data units)
+    for idx, bar_group in enumerate(bars16c):
+        heights = bar_group.datavalues
+        for x, v in zip(x_pos + idx*width, heights):
+            ax16c.text(x, v + heights.max()*0.02, f'{v:.0f}',
+                       ha='center', va='bottom', fontsize=9, fontweight='bold')
     fig16c.tight_layout()
-    fig16c.savefig(os.path.join(core_dir, '16c_Sensitivity_Grouped_Comparison.png'), dpi=300, bbox_inches='tight')
-    fig16c.savefig(os.path.join(appendix_dir, '16c_Sensitivity_Grouped_Comparison.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Saved: 16c_Sensitivity_Grouped_Comparison.png")
+    chart16_saves.append((fig16c, '16c_Sensitivity_Grouped_Comparison.png'))
     
     # ===== 16D: SPIDER/RADAR CHART =====
-    from math import pi
     fig16d, ax16d = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
     
     # Normalize sensitivity values to 0-100 scale for radar
@@ -5669,9 +5568,9 @@ def run_full_analysis():
                     'Waste\nRate (+)', 'Waste\nRate (-)']
     spider_values = [v / baseline_total * 100 for v in param_values_sorted]
     
-    angles = [n / float(len(spider_params)) * 2 * pi for n in range(len(spider_params))]
+    angles = np.linspace(0, 2 * np.pi, len(spider_params), endpoint=False)
     spider_values += spider_values[:1]  # Complete the circle
-    angles += angles[:1]
+    angles = np.concatenate([angles, angles[:1]])
     
     ax16d.plot(angles, spider_values, 'o-', linewidth=2.5, color='#E74C3C', markersize=8, label='Magnitude (%)')
     ax16d.fill(angles, spider_values, alpha=0.25, color='#E74C3C')
@@ -5685,20 +5584,7 @@ def run_full_analysis():
     ax16d.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1), fontsize=11, frameon=True)
     
     fig16d.tight_layout()
-    # Use try-except for radar chart save to handle PIL issues
-    try:
-        fig16d.savefig(os.path.join(core_dir, '16d_Sensitivity_Radar_Chart.png'), dpi=300, bbox_inches='tight')
-        fig16d.savefig(os.path.join(appendix_dir, '16d_Sensitivity_Radar_Chart.png'), dpi=300, bbox_inches='tight')
-    except Exception as e:
-        print(f"Warning: Could not save radar chart PNG (PIL issue): {e}")
-        # Try alternative save without bbox_inches
-        try:
-            fig16d.savefig(os.path.join(core_dir, '16d_Sensitivity_Radar_Chart.png'), dpi=300)
-            fig16d.savefig(os.path.join(appendix_dir, '16d_Sensitivity_Radar_Chart.png'), dpi=300)
-        except:
-            print("Skipping 16d PNG save - continuing with CSV export")
-    plt.close(fig16d)
-    print("✓ Saved: 16d_Sensitivity_Radar_Chart.png")
+    chart16_saves.append((fig16d, '16d_Sensitivity_Radar_Chart.png'))
     # Export 16d radar chart data to CSV (magnitude % per parameter)
     df16d = pd.DataFrame({
         'Parameter': param_names_sorted,
@@ -5710,48 +5596,35 @@ def run_full_analysis():
     # ===== 16E: WATERFALL CHART =====
     fig16e, ax16e = plt.subplots(figsize=(13, 7))
     
-    # Build waterfall: baseline -> apply impacts -> final
-    waterfall_labels = ['Baseline']
-    waterfall_values = [baseline_total]
-    waterfall_colors = ['#95A5A6']
-    
-    # Add only significant parameters in order
-    cumulative = baseline_total
-    for param, val in sorted_params[:4]:  # Top 4 impacts
-        waterfall_labels.append(param.replace(' (+', '\n(+').replace(' (-', '\n(-'))
-        waterfall_values.append(val)
-        waterfall_colors.append('#E74C3C' if val > 0 else '#27AE60')
-        cumulative += val
-    
-    waterfall_labels.append('Final')
-    waterfall_values.append(cumulative)
-    waterfall_colors.append('#34495E')
-    
-    # Create waterfall effect
+    # Build waterfall: baseline -> apply the top 4 impacts in order -> final
+    top_params = sorted_params[:4]
+    step_vals = np.array([val for _, val in top_params], dtype=float)
+    cumulative = np.cumsum(np.concatenate(([baseline_total], step_vals)))[-1]
+    waterfall_labels = (['Baseline']
+                        + [param.replace(' (+', '\n(+').replace(' (-', '\n(-') for param, _ in top_params]
+                        + ['Final'])
+    waterfall_values = np.concatenate(([baseline_total], step_vals, [cumulative]))
+    waterfall_colors = ['#95A5A6', *np.where(step_vals > 0, '#E74C3C', '#27AE60'), '#34495E']
+    
+    # Create waterfall effect: step bars float at cumulative - running sum of the steps,
+    # the baseline and final bars stand on zero
     x_pos = np.arange(len(waterfall_labels))
-    bottom_vals = [0]
-    for i in range(1, len(waterfall_values) - 1):
-        bottom_vals.append(cumulative - sum(waterfall_values[1:i+1]))
-    bottom_vals.append(0)
-    
-    for i, (label, value, color, bottom) in enumerate(zip(waterfall_labels, waterfall_values, waterfall_colors, bottom_vals)):
-        if i == 0 or i == len(waterfall_labels) - 1:
-            ax16e.bar(i, value, color=color, alpha=0.85, edgecolor='black', linewidth=1.2, width=0.6)
-        else:
-            ax16e.bar(i, value, bottom=bottom, color=color, alpha=0.85, edgecolor='black', linewidth=1.2, width=0.6)
-        
-        # Add value labels
-        y_pos_label = value + bottom if i != 0 and i != len(waterfall_labels)-1 else value/2
-        ax16e.text(i, y_pos_label + baseline_total*0.03, f'{value:+.0f}' if i > 0 and i < len(waterfall_labels)-1 else f'{value:,.0f}', 
+    wv = waterfall_values
+    bottom_vals = np.zeros_like(wv)
+    bottom_vals[1:-1] = cumulative - np.cumsum(wv[1:-1])
+    ax16e.bar(x_pos, wv, bottom=bottom_vals, color=waterfall_colors, alpha=0.85, edgecolor='black', linewidth=1.2, width=0.6)
+    
+    # Add value labels (steps above the bar top, baseline/final at half height)
+    is_step = (x_pos > 0) & (x_pos < len(wv) - 1)
+    y_labels = np.where(is_step, wv + bottom_vals, wv / 2) + baseline_total * 0.03
+    for i, value in enumerate(wv):
+        ax16e.text(i, y_labels[i], f'{value:+.0f}' if is_step[i] else f'{value:,.0f}', 
                 ha='center', va='bottom', fontsize=10, fontweight='bold')
     
-    # Connection lines
-    for i in range(len(waterfall_labels) - 1):
-        if i < len(waterfall_labels) - 2:
-            y_connect = bottom_vals[i+1] + waterfall_values[i+1]
-        else:
-            y_connect = waterfall_values[-1]
-        ax16e.plot([i + 0.3, i + 0.7], [y_connect, y_connect], 'k--', linewidth=1, alpha=0.5)
+    # Connection lines from each bar top to the next bar (last one at the final total)
+    y_connect = (bottom_vals + wv)[1:]
+    y_connect[-1] = wv[-1]
+    ax16e.hlines(y_connect, x_pos[:-1] + 0.3, x_pos[:-1] + 0.7, colors='k', linestyles='--', linewidth=1, alpha=0.5)
     
     ax16e.set_xticks(x_pos)
     ax16e.set_xticklabels(waterfall_labels, fontsize=10, fontweight='bold')
@@ -5759,13 +5632,29 @@ def run_full_analysis():
     ax16e.set_title('Sensitivity Waterfall: Cumulative Impact of Parameter Changes\nMonitor 2024 Baseline', 
                 fontsize=14, fontweight='bold', pad=15)
     ax16e.grid(axis='y', alpha=0.3, linestyle='--')
-    ax16e.set_ylim(0, max(waterfall_values) * 1.15)
+    ax16e.set_ylim(0, wv.max() * 1.15)
     
     fig16e.tight_layout()
-    fig16e.savefig(os.path.join(core_dir, '16e_Sensitivity_Waterfall_Chart.png'), dpi=300, bbox_inches='tight')
-    fig16e.savefig(os.path.join(appendix_dir, '16e_Sensitivity_Waterfall_Chart.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Saved: 16e_Sensitivity_Waterfall_Chart.png")
+    chart16_saves.append((fig16e, '16e_Sensitivity_Waterfall_Chart.png'))
+    
+    def save_chart16(fig, name):
+        """Save a Chart 16 figure to core + appendix; False if both save attempts failed"""
+        # save_and_copy reports render failures (PIL issues were seen with the 16d radar chart)
+        if save_and_copy(os.path.join(core_dir, name), os.path.join(appendix_dir, name),
+                         fig=fig, dpi=APPENDIX_DPI, core_dpi=CORE_DPI):
+            return True
+        # Try alternative save without bbox_inches (safe_savefig reports its own errors)
+        core_ok = safe_savefig(os.path.join(core_dir, name), dpi=CORE_DPI, tight=False, fig=fig)
+        appendix_ok = safe_savefig(os.path.join(appendix_dir, name), dpi=APPENDIX_DPI, tight=False, fig=fig)
+        if not (core_ok and appendix_ok):
+            print(f"Skipping {name} PNG save - continuing with CSV export")
+        return core_ok and appendix_ok
+    
+    for fig, name in chart16_saves:
+        saved = save_chart16(fig, name)
+        plt.close(fig)
+        if saved:
+            print(f"✓ Saved: {name}")
     # Export 16e waterfall data to CSV
     df16e = pd.DataFrame({
         'Label': waterfall_labels,
@@ -5776,7 +5665,11 @@ def run_full_analysis():
     
     # ===== 16F: SCENARIO STACKING — COMBINED PARAMETER IMPACTS =====
     print("[Chart 16f] Generating: Scenario Stacking (Combined Impacts)...")
-    fig16f, ax16f = plt.subplots(figsize=(14, 8))
+    # 16f and 16i share a 14x8 canvas; save_and_copy encodes before returning, so
+    # the Figure is cleared and redrawn instead of closed
+    fig16f = template_figure((14, 8))
+    fig16f.clear()
+    ax16f = fig16f.subplots()
     
     scenarios = [
         ('Baseline', 0),
@@ -5818,9 +5711,8 @@ def run_full_analysis():
     ax16f.set_ylim(0, baseline_total * 1.15)
     
     fig16f.tight_layout()
-    fig16f.savefig(os.path.join(core_dir, '16f_Scenario_Stacking.png'), dpi=300, bbox_inches='tight')
-    fig16f.savefig(os.path.join(appendix_dir, '16f_Scenario_Stacking.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_and_copy(os.path.join(core_dir, '16f_Scenario_Stacking.png'),
+                  os.path.join(appendix_dir, '16f_Scenario_Stacking.png'), fig=fig16f, dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     print("✓ Saved: 16f_Scenario_Stacking.png")
     # Export 16f scenario stacking data to CSV
     rows_16f = []
@@ -5880,8 +5772,8 @@ def run_full_analysis():
     ax16g.legend(loc='lower right', fontsize=11, frameon=True, scatterpoints=1)
     
     fig16g.tight_layout()
-    fig16g.savefig(os.path.join(core_dir, '16g_Feasibility_Quadrant.png'), dpi=300, bbox_inches='tight')
-    fig16g.savefig(os.path.join(appendix_dir, '16g_Feasibility_Quadrant.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '16g_Feasibility_Quadrant.png'),
+                  os.path.join(appendix_dir, '16g_Feasibility_Quadrant.png'), fig=fig16g, dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     plt.close()
     print("✓ Saved: 16g_Feasibility_Quadrant.png")
     # Export 16g feasibility quadrant data to CSV
@@ -5951,8 +5843,8 @@ def run_full_analysis():
     cbar = plt.colorbar(im, ax=ax16h, label='Sensitivity Index (0-100)')
     
     fig16h.tight_layout()
-    fig16h.savefig(os.path.join(core_dir, '16h_Sensitivity_Heatmap.png'), dpi=300, bbox_inches='tight')
-    fig16h.savefig(os.path.join(appendix_dir, '16h_Sensitivity_Heatmap.png'), dpi=300, bbox_inches='tight')
+    save_and_copy(os.path.join(core_dir, '16h_Sensitivity_Heatmap.png'),
+                  os.path.join(appendix_dir, '16h_Sensitivity_Heatmap.png'), fig=fig16h, dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     plt.close()
     print("✓ Saved: 16h_Sensitivity_Heatmap.png")
     # Export 16h heatmap data to CSV
@@ -5967,7 +5859,9 @@ def run_full_analysis():
     # ===== 16I: POLICY LEVERS DASHBOARD — SUMMARY RECOMMENDATIONS =====
     print("[Chart 16i] Generating: Policy Levers Dashboard...")
     
-    fig16i, ax16i = plt.subplots(figsize=(14, 8))
+    fig16i = template_figure((14, 8))
+    fig16i.clear()
+    ax16i = fig16i.subplots()
     ax16i.axis('tight')
     ax16i.axis('off')
     
@@ -6020,9 +5914,8 @@ def run_full_analysis():
             family='monospace', wrap=True)
     
     fig16i.tight_layout()
-    fig16i.savefig(os.path.join(core_dir, '16i_Policy_Levers_Dashboard.png'), dpi=300, bbox_inches='tight')
-    fig16i.savefig(os.path.join(appendix_dir, '16i_Policy_Levers_Dashboard.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_and_copy(os.path.join(core_dir, '16i_Policy_Levers_Dashboard.png'),
+                  os.path.join(appendix_dir, '16i_Policy_Levers_Dashboard.png'), fig=fig16i, dpi=APPENDIX_DPI, core_dpi=CORE_DPI)
     print("✓ Saved: 16i_Policy_Levers_Dashboard.png")
     # Export 16i policy levers table to CSV
     df16i = pd.DataFrame(levers_data[1:], columns=levers_data[0])
@@ -6058,7 +5951,7 @@ def run_full_analysis():
     print("  Chart 12: Dietary Intake Comparison (vs Schijf van 5 reference)")
     print("  Chart 13: Amsterdam Food Infographic (system overview)")
     print("  Chart 14a-d: Delta Analysis (emissions change when achieving goals)")
-    print("  Chart 15: APA-formatted Emissions Table (PNG + CSV export)")
+    print("  Chart 15: APA-formatted Emissions Table (PNG + HTML + CSV export)")
     print("  Chart 16a-e: Sensitivity Analysis (tornado, table, grouped, radar, waterfall)")
     print("  Chart 16f: Scenario Stacking (combined parameter impacts)")
     print("  Chart 16g: Feasibility Quadrant (impact vs implementation effort)")
@@ -6075,6 +5968,27 @@ def run_full_analysis():
     else:
         print(f"  Baseline (Monitor 2024): {baseline_total:,.0f} kton CO2e (calculation in progress)")
 
+    # Standalone figures from the worker processes. Only a pool that could not run the job at
+    # all (e.g. the module was imported under a name the spawned interpreter cannot re-import)
+    # falls back to in-process; an error raised by the job itself is reported, not re-run.
+    for (label, fn, args, kwargs), future in zip(standalone_jobs, standalone_futures):
+        try:
+            future.result()
+        except BrokenProcessPool as e:
+            print(f"  [WARN] Worker pool failed for {label} ({e}); generating it in-process")
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                print(f"  [WARN] Could not generate {label}: {str(e)}")
+        except Exception as e:
+            print(f"  [WARN] Could not generate {label} in the worker process:")
+            print(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
+
+    # Single collection sweep once all figures are closed (replaces per-chart gc.collect calls)
+    wait_for_pending_writes()
+    plt.close('all')
+    gc.collect()
+
 if __name__ == "__main__":
     try:
         run_full_analysis()
@@ -6082,4 +5996,9 @@ if __name__ == "__main__":
         print("\n[INFO] Model execution interrupted by user. CSVs have been saved.")
     except Exception as e:
         print(f"\n[ERROR] Unexpected error during analysis: {str(e)}")
-        print("[INFO] CSVs and partially-generated charts have been saved to data/results/ and images/ directories.")
\ No newline at end of file
+        print("[INFO] CSVs and partially-generated charts have been saved to data/results/ and images/ directories.")
+    finally:
+        try:
+            wait_for_pending_writes()  # Charts rendered before an interruption still reach disk
+        except Exception as e:
+            print(f"[ERROR] {e}")  # each failed write was already reported with its path
\ No newline at end of file